@@ -23,7 +23,7 @@ function App() {
 
   const { cities, loading: citiesLoading, error: citiesError } = useCities()
   const { meta: crashesMeta } = useCrashesMeta()
-  const { crashPoints, loadedYears, loadYear, loading: pointsLoading, error: pointsError } = useCrashPoints(
+  const { crashPoints, loadedYears, loadYears, loading: pointsLoading, error: pointsError } = useCrashPoints(
     selectedCity?.state_fips,
     selectedCity?.place_fips,
     crashesMeta?.max_year
@@ -84,7 +84,7 @@ function App() {
           onFatalityFilterChange={setFatalityFilter}
           onCrashDeselect={() => setSelectedCrash(null)}
           loadedYears={loadedYears}
-          loadYear={loadYear}
+          loadYears={loadYears}
           pointsLoading={pointsLoading}
           maxYear={crashesMeta?.max_year}
         />
@@ -16,10 +16,30 @@ export async function fetchCrashPointsForYear(stateFips, placeFips, year) {
     return res.json()
 }
 
-export async function fetchRecentCrashPoints(stateFips, placeFips, maxYear, count = 5) {
-    const years = Array.from({ length: count }, (_, i) => maxYear - i)
+// Fetches a per-city bundle ("recent" or "all"): { years, crashes: { [year]: points } }.
+// Returns null when the export has no such bundle.
+export async function fetchCrashBundle(stateFips, placeFips, name = "recent") {
+    const res = await fetch(`${BASE_URL}/crashes/${stateFips}/${placeFips}/${name}.json`)
+    if (res.status === 404) return null
+    if (!res.ok) throw new Error(`Failed to fetch ${name} crash bundle`)
+    return res.json()
+}
+
+// Points for `years` from one bundle request, falling back to one request
+// per year when the bundle is missing or doesn't cover them.
+export async function fetchCrashPointsForYears(stateFips, placeFips, years, bundleName = "recent") {
+    const bundle = await fetchCrashBundle(stateFips, placeFips, bundleName)
+    if (bundle && years.every(year => year in bundle.crashes)) {
+        return years.flatMap(year => bundle.crashes[year])
+    }
     const results = await Promise.all(
         years.map(year => fetchCrashPointsForYear(stateFips, placeFips, year))
     )
     return results.flat()
 }
+
+export async function fetchRecentCrashPoints(stateFips, placeFips, maxYear, count = 5) {
+    const years = Array.from({ length: count }, (_, i) => maxYear - i)
+    return fetchCrashPointsForYears(stateFips, placeFips, years)
+}
+
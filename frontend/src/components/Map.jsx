@@ -118,7 +118,7 @@ export default function CrashMap({
     onFatalityFilterChange,
     onCrashDeselect,
     loadedYears,
-    loadYear,
+    loadYears,
     pointsLoading,
     maxYear,
 }) {
@@ -204,11 +204,7 @@ export default function CrashMap({
 
     const allYearsLoaded = remainingYears.length === 0
 
-    const handleLoadFullHistory = async () => {
-        for (const year of remainingYears) {
-            await loadYear(year)
-        }
-    }
+    const handleLoadFullHistory = () => loadYears(remainingYears)
 
     const filteredCrashPoints = fatalityFilter === "all"
         ? crashPoints
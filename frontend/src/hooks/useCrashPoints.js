@@ -1,5 +1,5 @@
 import { useState, useEffect, useCallback } from "react"
-import { fetchRecentCrashPoints, fetchCrashPointsForYear } from "../api/crashes"
+import { fetchRecentCrashPoints, fetchCrashPointsForYear, fetchCrashPointsForYears } from "../api/crashes"
 
 export function useCrashPoints(stateFips, placeFips, maxYear) {
     const [crashPoints, setCrashPoints] = useState([])
@@ -38,5 +38,21 @@ export function useCrashPoints(stateFips, placeFips, maxYear) {
         }
     }, [stateFips, placeFips, loadedYears])
 
-    return { crashPoints, loadedYears, loading, error, loadYear }
+    // Loads several years from the city's all.json bundle in one request
+    const loadYears = useCallback(async (years) => {
+        const missing = years.filter(year => !loadedYears.includes(year))
+        if (missing.length === 0) return
+        setLoading(true)
+        try {
+            const points = await fetchCrashPointsForYears(stateFips, placeFips, missing, "all")
+            setCrashPoints(prev => [...prev, ...points])
+            setLoadedYears(prev => [...prev, ...missing])
+        } catch (err) {
+            setError(err.message)
+        } finally {
+            setLoading(false)
+        }
+    }, [stateFips, placeFips, loadedYears])
+
+    return { crashPoints, loadedYears, loading, error, loadYear, loadYears }
 }
\ No newline at end of file
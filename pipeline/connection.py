@@ -1,35 +1,116 @@
+import atexit
 import os
-import psycopg
+import threading
 from contextlib import contextmanager
+from typing import Iterator
+
+import psycopg
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import ConnectionPool
+
 from pipeline.logger import get_logger
 
 logger = get_logger(__name__)
 
-DB_HOST = os.environ["PGHOST"]
-DB_NAME = os.environ["PGDATABASE"]
-DB_USER = os.environ["PGUSER"]
-DB_PASS = os.environ["PGPASSWORD"]
-DB_PORT = os.environ.get("PGPORT", 5432)
+APPLICATION_NAME = "vision-zero-pipeline"
+
+# Session settings applied when a stage checks out a connection; the pool
+# resets them when the connection is returned.
+STAGE_SETTINGS: dict[str, dict[str, str]] = {
+    # Bulk COPY and merges: a crash mid-load just means reloading the year
+    "load": {"synchronous_commit": "off", "work_mem": "64MB", "maintenance_work_mem": "512MB"},
+    "enrich": {"synchronous_commit": "off", "work_mem": "128MB"},
+    "transform": {"work_mem": "256MB"},
+    "maintenance": {"maintenance_work_mem": "1GB"},
+    "export": {"work_mem": "64MB"},
+}
+
+_pool: ConnectionPool | None = None
+_pool_pid: int | None = None
+_pool_lock = threading.Lock()
+
+
+def conninfo() -> str:
+    """Connection string from the PG* environment, read at call time."""
+    return make_conninfo(
+        host=os.environ["PGHOST"],
+        dbname=os.environ["PGDATABASE"],
+        user=os.environ["PGUSER"],
+        password=os.environ["PGPASSWORD"],
+        port=os.environ.get("PGPORT", 5432),
+        application_name=APPLICATION_NAME,
+    )
+
+
+def _reset(conn: psycopg.Connection) -> None:
+    conn.autocommit = True
+    conn.execute("RESET ALL")
+    # Never hand out a connection still holding a session advisory lock
+    conn.execute("SELECT pg_advisory_unlock_all()")
+    conn.autocommit = False
+
+
+def get_pool() -> ConnectionPool:
+    """
+    The process-wide pool, created on first use. Sized by DB_POOL_MIN_SIZE and
+    DB_POOL_MAX_SIZE. A process forked after the pool was created gets its
+    own, since the parent's connections cannot be shared.
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ConnectionPool(
+                conninfo(),
+                min_size=int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+                max_size=int(os.getenv("DB_POOL_MAX_SIZE", "8")),
+                reset=_reset,
+                # Connections can sit idle through a long download or transform
+                check=ConnectionPool.check_connection,
+                name="pipeline",
+                open=True,
+            )
+            _pool_pid = os.getpid()
+    return _pool
+
+
+def close_pool() -> None:
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.close()
+        _pool = None
+        _pool_pid = None
+
+
+atexit.register(close_pool)
+
 
 @contextmanager
-def get_conn():
+def get_conn(stage: str | None = None) -> Iterator[psycopg.Connection]:
     """
-    Context manager that yields a PostgreSQL connection.
+    Context manager that yields a pooled PostgreSQL connection.
     Automatically commits if successful and rolls back on errors.
+
+    ``stage`` (a STAGE_SETTINGS key) applies that stage's session settings
+    and tags the session's application_name, e.g. vision-zero-pipeline:load.
+    Raises ValueError for a stage not in STAGE_SETTINGS.
     """
-    conn = psycopg.connect(
-        host=DB_HOST,
-        dbname=DB_NAME,
-        user=DB_USER,
-        password=DB_PASS,
-        port=DB_PORT,
-    )
-    try:
-        yield conn
+    if stage is not None and stage not in STAGE_SETTINGS:
+        raise ValueError(f"Unknown stage: {stage}")
+    with get_pool().connection() as conn:
+        settings = {
+            "application_name": f"{APPLICATION_NAME}:{stage}" if stage else APPLICATION_NAME,
+            **STAGE_SETTINGS.get(stage, {}),
+        }
+        with conn.cursor() as cur:
+            for name, value in settings.items():
+                cur.execute("SELECT set_config(%s, %s, false)", (name, value))
         conn.commit()
-    except Exception as e:
-        logger.error(f"Failed to create PostgreSQL connection: {e}")
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
\ No newline at end of file
+
+        try:
+            yield conn
+            conn.commit()
+        except Exception as e:
+            logger.error(f"PostgreSQL operation failed, rolling back: {e}")
+            conn.rollback()
+            raise
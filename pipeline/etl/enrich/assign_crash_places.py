@@ -0,0 +1,110 @@
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import shapely
+from psycopg import Connection
+
+from pipeline.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PlaceIndex:
+    """
+    STRtree over census_places_subdivided pieces. Pieces are sorted by
+    (state_fips, place_fips), so a lower tree index is the place the PostGIS
+    enrichment would pick first when a point matches more than one place.
+    """
+    tree: shapely.STRtree
+    place_fips: np.ndarray
+    display_name: np.ndarray
+
+
+# One index per process: every year loaded by a worker reuses it.
+_place_index: PlaceIndex | None = None
+
+
+def load_place_index(conn: Connection) -> PlaceIndex:
+    """
+    Build a PlaceIndex from census_places_subdivided.
+
+    Raises RuntimeError if the table is empty: every crash would be loaded
+    with no place, and with assign_places the post-load enrichment that could
+    fill them in is skipped.
+    """
+    start = time.time()
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT
+                piece.place_fips,
+                places.display_name,
+                ST_AsBinary(piece.geom)
+            FROM census_places_subdivided piece
+            JOIN census_places places
+                ON places.state_fips = piece.state_fips
+                AND places.place_fips = piece.place_fips
+            ORDER BY piece.state_fips, piece.place_fips, piece.id
+        """)
+        rows = cur.fetchall()
+
+    if not rows:
+        raise RuntimeError(
+            "[ENRICH] census_places_subdivided is empty; "
+            "run python -m pipeline.etl.transform.derive_subdivided_places"
+        )
+
+    place_fips, display_name, wkb = zip(*rows)
+    index = PlaceIndex(
+        tree=shapely.STRtree(shapely.from_wkb(np.array(wkb, dtype=object))),
+        place_fips=np.array(place_fips, dtype=object),
+        display_name=np.array(display_name, dtype=object),
+    )
+
+    elapsed = time.time() - start
+    logger.info("[ENRICH] Loaded %s boundary pieces into STRtree, duration=%.2fs", len(rows), elapsed)
+    return index
+
+
+def get_place_index(conn: Connection) -> PlaceIndex:
+    global _place_index
+    if _place_index is None:
+        _place_index = load_place_index(conn)
+    return _place_index
+
+
+def match_places(index: PlaceIndex, lon: np.ndarray, lat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Match a batch of crash points to census places.
+
+    Uses the intersects predicate against the subdivided pieces, the same
+    test enrich_crash_locations runs in PostGIS, so a point on an edge
+    introduced by the subdivision still matches. NaN coordinates match nothing.
+
+    Returns:
+        (place_fips, display_name) object arrays aligned with the input, None
+        where the point lies in no place.
+    """
+    lon = np.asarray(lon, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+    place_fips = np.full(len(lon), None, dtype=object)
+    display_name = np.full(len(lon), None, dtype=object)
+
+    has_point = ~(np.isnan(lon) | np.isnan(lat))
+    if not has_point.any() or len(index.place_fips) == 0:
+        return place_fips, display_name
+
+    rows = np.flatnonzero(has_point)
+    points = shapely.points(lon[rows], lat[rows])
+    point_idx, piece_idx = index.tree.query(points, predicate="intersects")
+
+    # First match per point in piece order, i.e. the lowest (state, place)
+    order = np.lexsort((piece_idx, point_idx))
+    point_idx, piece_idx = point_idx[order], piece_idx[order]
+    matched, first = np.unique(point_idx, return_index=True)
+    pieces = piece_idx[first]
+
+    place_fips[rows[matched]] = index.place_fips[pieces]
+    display_name[rows[matched]] = index.display_name[pieces]
+    return place_fips, display_name
@@ -44,7 +44,7 @@ def enrich_city_points() -> None:
 
         census_places_updated = 0
 
-        with get_conn() as conn:
+        with get_conn("enrich") as conn:
             with conn.cursor() as cur:
                 for row in reader:
                     if row["status"] != "ok" and KNOWN_CITY_ISSUES_MAP.get(row["place_name"]):
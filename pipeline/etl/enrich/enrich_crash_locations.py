@@ -1,36 +1,159 @@
 import time
+from datetime import datetime
+
+from psycopg import Connection, sql
 
 from pipeline.connection import get_conn
 from pipeline.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Incremental runs only look at crashes that are unassigned, in a year that was
+# just loaded, or inside a boundary that changed since the last completed run.
+# Each is its own branch so each can use its own access path: the year branch
+# prunes to the loaded partitions, and the changed-boundary branch starts from
+# the changed places' pieces and probes the crash location index, instead of
+# checking every crash against every changed boundary. A crash found by more
+# than one branch is collapsed by DISTINCT ON in assign_crash_places.
+INCREMENTAL_CANDIDATES = sql.SQL("""
+    (
+        SELECT fc.crash_id, fc.year, fc.location
+        FROM fars_crashes fc
+        WHERE fc.place_fips IS NULL
+        UNION ALL
+        SELECT fc.crash_id, fc.year, fc.location
+        FROM fars_crashes fc
+        WHERE fc.year = ANY(%(years)s)
+        UNION ALL
+        SELECT fc.crash_id, fc.year, fc.location
+        FROM census_places changed
+        JOIN census_places_subdivided piece
+            ON piece.state_fips = changed.state_fips
+            AND piece.place_fips = changed.place_fips
+        JOIN fars_crashes fc
+            ON ST_Intersects(piece.geom, fc.location)
+        WHERE changed.geom_updated_at > COALESCE(%(since)s::timestamptz, '-infinity')
+    )
+""")
+
+# Full runs re-check every crash.
+ALL_CRASHES = sql.SQL("fars_crashes")
+
+
+def last_enrichment_started_at(conn: Connection) -> datetime | None:
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT MAX(started_at)
+            FROM crash_enrichment_runs
+            WHERE completed_at IS NOT NULL
+        """)
+        row = cur.fetchone()
+    return row[0] if row else None
+
+
+def assign_crash_places(conn: Connection, candidates: sql.Composable, params: dict) -> dict[int, int]:
+    """
+    Assign place_fips/fips_city_name to candidate crashes that fall within a
+    census place. Rows whose values would not change are not rewritten.
+
+    ``candidates`` is a relation of (crash_id, year, location) rows, e.g.
+    INCREMENTAL_CANDIDATES or ALL_CRASHES; duplicates are allowed.
+
+    Points are matched against census_places_subdivided. ST_Intersects is
+    used rather than ST_Within so a point on an edge introduced by the
+    subdivision still matches; DISTINCT ON keeps one place per crash.
+
+    Returns:
+        Number of crashes updated, by year.
+    """
+    query = sql.SQL("""
+        WITH matches AS (
+            SELECT DISTINCT ON (fc.crash_id, fc.year)
+                fc.crash_id,
+                fc.year,
+                places.display_name,
+                places.place_fips
+            FROM {candidates} fc
+            JOIN census_places_subdivided piece
+                ON ST_Intersects(piece.geom, fc.location)
+            JOIN census_places places
+                ON places.state_fips = piece.state_fips
+                AND places.place_fips = piece.place_fips
+            WHERE fc.location IS NOT NULL
+            ORDER BY fc.crash_id, fc.year, places.state_fips, places.place_fips
+        ),
+        updated AS (
+            UPDATE fars_crashes fc
+            SET fips_city_name = m.display_name,
+                place_fips = m.place_fips
+            FROM matches m
+            WHERE fc.crash_id = m.crash_id
+              AND fc.year = m.year
+              AND (
+                  fc.place_fips IS DISTINCT FROM m.place_fips
+                  OR fc.fips_city_name IS DISTINCT FROM m.display_name
+              )
+            RETURNING fc.year
+        )
+        SELECT year, COUNT(*)
+        FROM updated
+        GROUP BY year
+    """).format(candidates=candidates)
+
+    with conn.cursor() as cur:
+        cur.execute(query, params)
+        return {year: count for year, count in cur.fetchall()}
+
 
-def enrich_crash_locations() -> None:
+def enrich_crash_locations(years: list[int] | None = None, full: bool = False) -> list[int]:
     """
     Spatially join fars_crashes against census_places to fill in city_name
     for crashes where FARS recorded no city (Rural / Not Applicable) but
     GPS coordinates fall within a Census place boundary.
-    """
-    query = """
-        UPDATE fars_crashes fc
-        SET fips_city_name = places.display_name,
-            place_fips = places.place_fips
-        FROM census_places places
-        WHERE ST_Within(fc.location, places.geom)
-          AND fc.location IS NOT NULL
-    """
 
+    By default only crashes with no place yet, crashes in ``years`` (the years
+    just loaded) and crashes inside boundaries changed since the last run are
+    considered. full=True re-checks every crash with a location.
+
+    Returns:
+        Sorted years in which at least one crash changed place.
+    """
     start = time.time()
-    logger.info("[ENRICH] Starting crash location enrichment...")
+    mode = "full" if full else "incremental"
+    logger.info("[ENRICH] Starting %s crash location enrichment...", mode)
 
-    with get_conn() as conn:
+    with get_conn("enrich") as conn:
         with conn.cursor() as cur:
-            logger.info("[ENRICH] Assigning display_name and place_fips to fars_crashes that lie within census_places boundaries.")
-            cur.execute(query)
-            fars_crashes_updated = cur.rowcount
-            conn.commit()
-            logger.info("[ENRICH] place_fips and city_name updated for %s rows", fars_crashes_updated)
+            cur.execute(
+                "INSERT INTO crash_enrichment_runs (full_run) VALUES (%s) RETURNING run_id",
+                (full,),
+            )
+            row = cur.fetchone()
+            assert row is not None
+            run_id = row[0]
+
+        if full:
+            candidates, params = ALL_CRASHES, {}
+        else:
+            since = last_enrichment_started_at(conn)
+            candidates, params = INCREMENTAL_CANDIDATES, {"years": years or [], "since": since}
+            logger.info("[ENRICH] Checking unassigned crashes, years=%s and boundaries changed since %s", years or [], since or "never")
+
+        logger.info("[ENRICH] Assigning display_name and place_fips to fars_crashes that lie within census_places boundaries.")
+        updated_by_year = assign_crash_places(conn, candidates, params)
+        updated_count = sum(updated_by_year.values())
+
+        with conn.cursor() as cur:
+            cur.execute("""
+                UPDATE crash_enrichment_runs
+                SET completed_at = now(),
+                    crashes_updated = %(updated)s
+                WHERE run_id = %(run_id)s
+            """, {"updated": updated_count, "run_id": run_id})
+        conn.commit()
+
+    logger.info("[ENRICH] place_fips and city_name updated for %s rows", updated_count)
 
     elapsed = time.time() - start
-    logger.info("[ENRICH] Completed crash location enrichment. duration=%.2fs", elapsed)
\ No newline at end of file
+    logger.info("[ENRICH] Completed crash location enrichment. duration=%.2fs", elapsed)
+    return sorted(updated_by_year)
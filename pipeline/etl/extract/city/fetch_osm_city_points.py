@@ -29,7 +29,7 @@ def fetch_nominatim_point(place_name: str, state_name: str) -> tuple[float, floa
 
 
 def main():
-    with get_conn() as conn:
+    with get_conn("enrich") as conn:
         with conn.cursor() as cur:
             cur.execute("""
                 SELECT cp.state_fips, cp.place_fips, cp.place_name, cp.state_name
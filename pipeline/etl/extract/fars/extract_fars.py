@@ -1,6 +1,14 @@
+import zipfile
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator, TextIO
 
-from pipeline.utils.downloader import download_file, extract_if_zip
+from pipeline.utils.downloader import (
+    download_file,
+    extract_if_zip,
+    list_zip_members,
+    open_zip_member,
+)
 from pipeline.logger import get_logger
 
 logger = get_logger(__name__)
@@ -12,29 +20,69 @@ def build_fars_url(year: int) -> str:
     return f"{FARS_BASE_URL}/{year}/National/{FARS_FILENAME_TEMPLATE.format(year=year)}"
 
 
-def download_unzip_fars_year(
-        year: int, 
-        base_dir: Path, 
-        force_extract: bool = False,
-) -> list[Path]:
+def download_fars_year(year: int, base_dir: Path) -> Path:
     """
-    Download a single FARS dataset for a given year.
+    Download the national FARS archive for a year, if not already on disk.
+
+    Returns:
+        Path to the zip.
     """
     year_dir = base_dir / f"fars_{year}"
     year_dir.mkdir(parents=True, exist_ok=True)
 
     zip_path = year_dir / f"fars_{year}.zip"
 
-    # -- Download --
     if zip_path.exists():
         logger.info(f"[FARS] {year} already downloaded, skipping download")
     else:
         logger.info(f"[FARS] Downloading {year}...")
         download_file(
             url=build_fars_url(year),
-            dest=year_dir / f"fars_{year}.zip"
+            dest=zip_path
         )
 
+    return zip_path
+
+
+def list_fars_csvs(zip_path: Path) -> dict[str, Path]:
+    """
+    Map upper-cased CSV names inside a FARS archive (e.g. "ACCIDENT.CSV") to
+    the archive itself, in the same shape as the extracted-files mapping so
+    loaders can be handed either.
+    """
+    members = list_zip_members(zip_path, ".csv")
+    if not members:
+        raise RuntimeError(f"[FARS] No CSVs found in {zip_path}")
+    return {name: zip_path for name in members}
+
+
+@contextmanager
+def open_fars_csv(source: Path, csv_name: str) -> Iterator[TextIO]:
+    """
+    Open a FARS CSV for reading, streaming it straight out of the archive when
+    ``source`` is the downloaded zip, or opening it directly when ``source``
+    is an already-extracted CSV.
+    """
+    if zipfile.is_zipfile(source):
+        with open_zip_member(source, csv_name) as csvfile:
+            yield csvfile
+    else:
+        with open(source, newline="", encoding="utf-8-sig", errors="replace") as csvfile:
+            yield csvfile
+
+
+def download_unzip_fars_year(
+        year: int, 
+        base_dir: Path, 
+        force_extract: bool = False,
+) -> list[Path]:
+    """
+    Download a single FARS dataset for a given year and extract every CSV to
+    disk. Only used for debugging; the pipeline streams from the zip.
+    """
+    year_dir = base_dir / f"fars_{year}"
+    zip_path = download_fars_year(year, base_dir)
+
     # -- Unzip --
     existing_csvs = [
         p for p in year_dir.rglob("*")
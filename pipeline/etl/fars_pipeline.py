@@ -1,28 +1,173 @@
 import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 
-from pipeline.etl.extract.fars.extract_fars import download_unzip_fars_year
+from pipeline.etl.extract.fars.extract_fars import (
+    download_fars_year,
+    download_unzip_fars_year,
+    list_fars_csvs,
+)
 from pipeline.etl.extract.fars.resolve_fars_years import resolve_target_fars_years
 
+from pipeline.etl.load.fars_load_ledger import (
+    complete_ledger_entry,
+    is_year_current,
+    sha256_file,
+    start_ledger_entry,
+)
+from pipeline.etl.load.fars_partitions import (
+    attach_year_partitions,
+    discard_year_partitions,
+    prepare_year_partitions,
+)
+from pipeline.etl.load.fars_maintenance import run_fars_maintenance
+from pipeline.etl.load.fars_year_lock import fars_year_lock
 from pipeline.etl.load.load_fars_crashes import load_fars_crash_year
 from pipeline.etl.load.load_fars_persons import load_fars_person_year
 
 from pipeline.etl.transform.derive_fars_person_subtypes import run_derive_fars_subtypes
+from pipeline.etl.transform.derive_city_year_fatalities import run_refresh_city_year_fatalities
 from pipeline.etl.transform.derive_city_stats import run_derive_city_stats
 from pipeline.etl.transform.derive_city_rankings import run_derive_city_rankings
 
 from pipeline.etl.enrich.enrich_crash_locations import enrich_crash_locations
 
+from pipeline.connection import get_conn
 from pipeline.logger import get_logger
 
 logger = get_logger(__name__)
 
+YEAR_LOADED = "loaded"
+YEAR_UNCHANGED = "unchanged"
+YEAR_FAILED = "failed"
+
+
+def empty_ingestion_stats() -> dict:
+    return {
+        "crashes": {"inserted": 0, "skipped": 0, "errors": 0},
+        "persons": {"inserted": 0, "skipped": 0, "errors": 0},
+    }
+
+
+def merge_ingestion_stats(totals: dict, year_stats: dict) -> None:
+    for table, counts in year_stats.items():
+        for key, value in counts.items():
+            totals[table][key] += value
+
+
+def load_fars_year(
+    year: int,
+    raw_root: Path,
+    extract: bool = False,
+    force: bool = False,
+    assign_places: bool = False,
+) -> tuple[dict, str]:
+    """
+    Extract and load crashes then persons for a single FARS year.
+
+    ACCIDENT.CSV and PERSON.CSV are streamed straight out of the downloaded
+    zip. Pass extract=True to unzip every CSV to disk first and load from the
+    extracted files instead, which is only useful when debugging a year.
+
+    A year whose archive hash and loader version match its fars_load_ledger
+    entries is skipped without reading any rows, unless force=True.
+    Otherwise the year is loaded into fresh detached tables that replace its
+    fars_crashes/fars_persons partitions in one transaction once both files
+    have loaded. If either file fails the load tables are dropped and the
+    year's existing partitions stay attached; no other year is touched.
+
+    assign_places=True matches crash points to census places while loading,
+    using an in-process STRtree, instead of in the post-load enrichment.
+
+    Runs under a per-year advisory lock so two workers (or two concurrent
+    pipeline runs) never load the same year at once. Safe to call from a
+    worker process. The lock, the ledger and both loaders share one pooled
+    connection, so a year never holds more than one.
+
+    Returns:
+        (ingestion_stats for this year, YEAR_LOADED | YEAR_UNCHANGED | YEAR_FAILED)
+    """
+    stats = empty_ingestion_stats()
+
+    with get_conn("load") as conn, fars_year_lock(conn, year) as acquired:
+        if not acquired:
+            logger.error(f"[FARS] {year} is being loaded by another worker or run, skipping")
+            stats["crashes"]["errors"] += 1
+            return stats, YEAR_FAILED
+
+        zip_path = download_fars_year(year, raw_root)
+        source_sha256 = sha256_file(zip_path)
+
+        if not force and is_year_current(conn, year, source_sha256):
+            logger.info(f"[FARS] {year} unchanged since last load, skipping")
+            return stats, YEAR_UNCHANGED
+
+        if extract:
+            csv_paths = download_unzip_fars_year(year, raw_root)
+            files = {path.name.upper(): path for path in csv_paths}
+        else:
+            files = list_fars_csvs(zip_path)
+
+        prepare_year_partitions(conn, year)
+        row_counts: dict[str, int] = {}
+        try:
+            # Crashes first: persons resolve crash_id against them
+            for file_name, table, load_file in (
+                ("ACCIDENT.CSV", "crashes", partial(load_fars_crash_year, assign_places=assign_places)),
+                ("PERSON.CSV", "persons", load_fars_person_year),
+            ):
+                if file_name not in files:
+                    logger.error(f"[FARS] {year} missing {file_name}")
+                    stats[table]["errors"] += 1
+                    discard_year_partitions(conn, year)
+                    return stats, YEAR_FAILED
+
+                start_ledger_entry(conn, year, file_name, source_sha256)
+                insert_count, skip_count, error_count = load_file(files[file_name], year, conn=conn)
+                stats[table]["inserted"] += insert_count
+                stats[table]["skipped"] += skip_count
+                stats[table]["errors"] += error_count
+                row_counts[file_name] = insert_count + skip_count + error_count
+
+            # The ledger only marks the year complete in the transaction that
+            # swaps its partitions in, so a failed swap is retried next run
+            attach_year_partitions(conn, year)
+            for file_name, row_count in row_counts.items():
+                complete_ledger_entry(conn, year, file_name, row_count)
+            conn.commit()
+        except Exception:
+            # The year's current partitions stay attached; re-raise the load error
+            # even if the cleanup fails too
+            try:
+                discard_year_partitions(conn, year)
+            except Exception:
+                logger.exception(f"[FARS] {year} failed to drop its load tables")
+            raise
+
+    return stats, YEAR_LOADED
+
+
 def run_fars_pipeline(
     raw_root: Path,
     requested_years: list[int] | None = None,
+    workers: int = 1,
+    extract: bool = False,
+    force: bool = False,
+    assign_places: bool = False,
 ) -> None:
     """
     End-to-end FARS pipeline: extract → load.
+
+    With workers > 1 the per-year extract + load work is fanned out across a
+    process pool; the post-load derivations still run once, after every year
+    has finished, and only when at least one year was actually loaded.
+    Years unchanged since their last load are skipped unless force=True.
+
+    With assign_places=True the loaders match crashes to census places as they
+    load, so the post-load enrichment pass is skipped. Boundary changes are
+    then picked up by the next ``--enrich-only`` run.
     """
     start = time.time()
 
@@ -31,63 +176,72 @@ def run_fars_pipeline(
     total_inserted = 0
     total_skipped = 0
     total_errors = 0
-    years_processed = 0
-    ingestion_stats = {
-        "crashes": {"inserted": 0, "skipped": 0, "errors": 0},
-        "persons": {"inserted": 0, "skipped": 0, "errors": 0},
-    }
+    loaded_years: list[int] = []
+    unchanged_years: list[int] = []
+    ingestion_stats = empty_ingestion_stats()
 
     years = resolve_target_fars_years(requested_years)
 
-    for year in years:
-        csv_paths = download_unzip_fars_year(year, raw_root)
-
-        files = {path.name.upper(): path for path in csv_paths}
-
-        if "ACCIDENT.CSV" in files:
-            insert_count, skip_count, error_count = load_fars_crash_year(
-                files["ACCIDENT.CSV"], year
-            )
-            ingestion_stats["crashes"]["inserted"] += insert_count
-            ingestion_stats["crashes"]["skipped"] += skip_count
-            ingestion_stats["crashes"]["errors"] += error_count
-        else:
-            logger.error(f"[FARS] {year} missing ACCIDENT.CSV")
-            ingestion_stats["crashes"]["errors"] += 1
-            continue
-
-        if "PERSON.CSV" in files:
-            insert_count, skip_count, error_count = load_fars_person_year(
-                files["PERSON.CSV"], year
-            )
-            ingestion_stats["persons"]["inserted"] += insert_count
-            ingestion_stats["persons"]["skipped"] += skip_count
-            ingestion_stats["persons"]["errors"] += error_count
-        else:
-            logger.error(f"[FARS] {year} missing PERSON.CSV")
-            ingestion_stats["persons"]["errors"] += 1
-            continue
-        
-        years_processed += 1
+    def record_year(year: int, year_stats: dict, status: str) -> None:
+        merge_ingestion_stats(ingestion_stats, year_stats)
+        if status == YEAR_LOADED:
+            loaded_years.append(year)
+        elif status == YEAR_UNCHANGED:
+            unchanged_years.append(year)
+
+    if workers > 1:
+        logger.info("[PIPELINE][FARS] Loading %s years with %s workers", len(years), workers)
+        # spawn rather than fork so no worker inherits a parent's open connection
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = {
+                executor.submit(load_fars_year, year, raw_root, extract, force, assign_places): year
+                for year in years
+            }
+            for future in as_completed(futures):
+                record_year(futures[future], *future.result())
+    else:
+        for year in years:
+            record_year(year, *load_fars_year(year, raw_root, extract, force, assign_places))
+
+    loaded_years.sort()
 
     total_inserted = sum(v["inserted"] for v in ingestion_stats.values())
     total_skipped  = sum(v["skipped"] for v in ingestion_stats.values())
     total_errors   = sum(v["errors"] for v in ingestion_stats.values())
 
     elapsed = time.time() - start
-    logger.info("[PIPELINE][FARS] Summary: years=%s | inserted=%s | skipped=%s | errors=%s | duration=%.2fs",
-                years_processed,
+    logger.info("[PIPELINE][FARS] Summary: years=%s | unchanged=%s | inserted=%s | skipped=%s | errors=%s | duration=%.2fs",
+                len(loaded_years),
+                len(unchanged_years),
                 total_inserted,
                 total_skipped,
                 total_errors,
                 elapsed,
     )
 
-    # Assign city_name to crashes missing city data
-    enrich_crash_locations()
+    if not loaded_years:
+        logger.info("[PIPELINE][FARS] No years loaded, skipping derivations")
+        return
+
+    # Assign city_name to unassigned crashes and crashes in the loaded years
+    enriched_years: list[int] = []
+    if assign_places:
+        logger.info("[PIPELINE][FARS] Places assigned during load, skipping enrichment")
+    else:
+        enriched_years = enrich_crash_locations(years=loaded_years)
+
+    # Derive person mode/type for crashes in the year(s) just loaded
+    run_derive_fars_subtypes(years=loaded_years)
+
+    # Re-aggregate city fatalities for every year whose crashes or places changed
+    changed_years = sorted(set(loaded_years) | set(enriched_years))
+    run_refresh_city_year_fatalities(years=changed_years)
 
-    # Derive person mode/type for all crashes in the specified year(s)
-    run_derive_fars_subtypes(years=years)
+    # Cluster + vacuum the changed partitions for index-only export scans
+    run_fars_maintenance(years=changed_years)
 
     # Derive 5 year avg data for cities
     run_derive_city_stats()
@@ -95,4 +249,4 @@ def run_fars_pipeline(
     # rank cities
     run_derive_city_rankings()
 
-    logger.info("[PIPELINE][FARS] Pipeline completed successfully")
\ No newline at end of file
+    logger.info("[PIPELINE][FARS] Pipeline completed successfully")
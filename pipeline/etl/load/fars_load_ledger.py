@@ -0,0 +1,95 @@
+import hashlib
+from pathlib import Path
+
+from psycopg import Connection
+
+from pipeline.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump whenever a change to parsing or loading would produce different rows
+# from the same source file, so every year is reloaded on the next run.
+LOADER_VERSION: int = 1
+
+# Files a year must have completed loads for before it is considered current.
+LEDGER_FILES: tuple[str, ...] = ("ACCIDENT.CSV", "PERSON.CSV")
+
+
+def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_year_current(conn: Connection, year: int, source_sha256: str) -> bool:
+    """
+    True when every file in LEDGER_FILES completed a load for this year from
+    the same source archive with the current LOADER_VERSION.
+    """
+    query = """
+        SELECT COUNT(*)
+        FROM fars_load_ledger
+        WHERE year = %(year)s
+          AND file_name = ANY(%(files)s)
+          AND source_sha256 = %(sha)s
+          AND loader_version = %(version)s
+          AND completed_at IS NOT NULL
+    """
+    with conn.cursor() as cur:
+        cur.execute(query, {
+            "year": year,
+            "files": list(LEDGER_FILES),
+            "sha": source_sha256,
+            "version": LOADER_VERSION,
+        })
+        row = cur.fetchone()
+    return bool(row) and row[0] == len(LEDGER_FILES)
+
+
+def start_ledger_entry(conn: Connection, year: int, file_name: str, source_sha256: str) -> None:
+    """
+    Record that a file load has started. completed_at stays NULL until
+    complete_ledger_entry runs, so an interrupted load is retried next run.
+    """
+    query = """
+        INSERT INTO fars_load_ledger (
+            year,
+            file_name,
+            source_sha256,
+            loader_version,
+            started_at
+        )
+        VALUES (%(year)s, %(file_name)s, %(sha)s, %(version)s, now())
+        ON CONFLICT (year, file_name) DO UPDATE SET
+            source_sha256 = EXCLUDED.source_sha256,
+            loader_version = EXCLUDED.loader_version,
+            started_at = EXCLUDED.started_at,
+            row_count = NULL,
+            completed_at = NULL
+    """
+    with conn.cursor() as cur:
+        cur.execute(query, {
+            "year": year,
+            "file_name": file_name,
+            "sha": source_sha256,
+            "version": LOADER_VERSION,
+        })
+    conn.commit()
+
+
+def complete_ledger_entry(conn: Connection, year: int, file_name: str, row_count: int) -> None:
+    """
+    Mark a file load complete. Does not commit: the caller commits it with
+    the partition swap that makes the loaded rows visible.
+    """
+    query = """
+        UPDATE fars_load_ledger
+        SET row_count = %(row_count)s,
+            completed_at = now()
+        WHERE year = %(year)s
+          AND file_name = %(file_name)s
+    """
+    with conn.cursor() as cur:
+        cur.execute(query, {"year": year, "file_name": file_name, "row_count": row_count})
@@ -0,0 +1,111 @@
+import time
+
+from psycopg import Connection, sql
+
+from pipeline.connection import get_conn
+from pipeline.etl.load.fars_partitions import is_attached, partition_name
+from pipeline.logger import get_logger
+
+logger = get_logger(__name__)
+
+EXPORT_INDEX = "crashes_export_idx"
+
+# Covers the per-city crash export: equality on (state, place_fips), range and
+# sort on year, and every exported column in INCLUDE, so the export is served
+# by an index-only scan once the partition has been vacuumed. location_5070
+# lets hotspot binning use the same index.
+CREATE_EXPORT_INDEX = sql.SQL("""
+    CREATE INDEX IF NOT EXISTS {index} ON fars_crashes (state, place_fips, year)
+    INCLUDE (
+        st_case,
+        crash_date,
+        state_name,
+        fars_city_name,
+        fips_city_name,
+        road_label,
+        total_fatalities,
+        motorist_fatalities,
+        pedestrian_fatalities,
+        cyclist_fatalities,
+        other_fatalities,
+        location,
+        location_5070
+    )
+""").format(index=sql.Identifier(EXPORT_INDEX))
+
+
+def partition_export_index(conn: Connection, partition: str) -> str | None:
+    """Name of the partition's child of EXPORT_INDEX, if it has one."""
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT child.relname
+            FROM pg_inherits inh
+            JOIN pg_class child ON child.oid = inh.inhrelid
+            JOIN pg_index idx ON idx.indexrelid = inh.inhrelid
+            WHERE inh.inhparent = to_regclass(%(index)s)
+              AND idx.indrelid = to_regclass(%(partition)s)
+        """, {"index": EXPORT_INDEX, "partition": partition})
+        row = cur.fetchone()
+    return row[0] if row else None
+
+
+def maintain_year_partition(conn: Connection, year: int) -> bool:
+    """
+    CLUSTER a year's fars_crashes partition on the export index, then VACUUM
+    ANALYZE it so the visibility map allows index-only scans and the planner
+    sees fresh statistics. Only this year's partition is locked.
+
+    ``conn`` must be in autocommit mode; VACUUM cannot run in a transaction.
+
+    Returns:
+        False if the partition is not attached.
+    """
+    partition = partition_name("fars_crashes", year)
+    if not is_attached(conn, partition):
+        logger.warning("[FARS] %s | no attached crash partition, skipping maintenance", year)
+        return False
+
+    index = partition_export_index(conn, partition)
+    with conn.cursor() as cur:
+        if index is not None:
+            cur.execute(sql.SQL("CLUSTER {} USING {}").format(
+                sql.Identifier(partition), sql.Identifier(index),
+            ))
+        cur.execute(sql.SQL("VACUUM (ANALYZE) {}").format(sql.Identifier(partition)))
+    return True
+
+
+def run_fars_maintenance(years: list[int]) -> None:
+    """
+    Post-load maintenance: make sure the covering export index exists, then
+    reorder and vacuum the partitions of the years whose rows changed. Runs
+    after every post-load UPDATE, since each one leaves dead tuples behind
+    and clears visibility map bits.
+    """
+    start = time.time()
+    logger.info("[PIPELINE][FARS] Running maintenance for years=%s", years)
+
+    with get_conn("maintenance") as conn:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(CREATE_EXPORT_INDEX)
+
+        maintained = [year for year in years if maintain_year_partition(conn, year)]
+
+        # Parent statistics drive estimates for queries that span years
+        with conn.cursor() as cur:
+            cur.execute("ANALYZE fars_crashes")
+
+    elapsed = time.time() - start
+    logger.info(
+        "[PIPELINE][FARS] Finished maintenance. partitions=%s duration=%.2fs",
+        len(maintained), elapsed,
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Rebuild the export index and maintain crash partitions")
+    parser.add_argument("years", type=int, nargs="*", help="Years whose partitions to CLUSTER and VACUUM")
+    args = parser.parse_args()
+    run_fars_maintenance(args.years)
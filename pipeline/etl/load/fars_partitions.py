@@ -0,0 +1,156 @@
+from psycopg import sql
+from psycopg import Connection
+
+from pipeline.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Parents in the order every partition swap locks them. Taking both locks up
+# front in one statement keeps concurrent swaps of different years queued
+# rather than deadlocked.
+PARENTS: tuple[tuple[str, str], ...] = (("fars_crashes", "year"), ("fars_persons", "crash_year"))
+
+
+def partition_name(parent: str, year: int) -> str:
+    return f"{parent}_y{year}"
+
+
+def load_table_name(parent: str, year: int) -> str:
+    """Detached table a year is loaded into before it replaces partition_name."""
+    return f"{parent}_y{year}_load"
+
+
+def crash_load_table(year: int) -> sql.Identifier:
+    return sql.Identifier(load_table_name("fars_crashes", year))
+
+
+def person_load_table(year: int) -> sql.Identifier:
+    return sql.Identifier(load_table_name("fars_persons", year))
+
+
+def is_attached(conn: Connection, name: str) -> bool:
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_inherits WHERE inhrelid = to_regclass(%s))",
+            (name,),
+        )
+        row = cur.fetchone()
+    return bool(row and row[0])
+
+
+def prepare_year_partitions(conn: Connection, year: int) -> None:
+    """
+    Create empty, detached crash and person load tables for a year for the
+    loaders to fill. The year's attached partitions stay in place, and
+    readable, until attach_year_partitions swaps the load tables in.
+    """
+    with conn.cursor() as cur:
+        for parent, year_column in PARENTS:
+            name = load_table_name(parent, year)
+            # Left behind by a run that died before it could clean up
+            cur.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(sql.Identifier(name)))
+            cur.execute(sql.SQL("CREATE TABLE {} (LIKE {} INCLUDING ALL)").format(
+                sql.Identifier(name), sql.Identifier(parent),
+            ))
+            # Matches the partition bound, so ATTACH can skip its validation scan
+            cur.execute(sql.SQL(
+                "ALTER TABLE {} ADD CONSTRAINT {} CHECK ({col} >= {lo} AND {col} < {hi})"
+            ).format(
+                sql.Identifier(name),
+                sql.Identifier(f"{name}_year_check"),
+                col=sql.Identifier(year_column),
+                lo=sql.Literal(year),
+                hi=sql.Literal(year + 1),
+            ))
+    conn.commit()
+    logger.debug("[FARS] %s | prepared load tables", year)
+
+
+def rename_load_table(conn: Connection, parent: str, year: int) -> None:
+    """
+    Rename a year's load table, and the indexes LIKE named after it, to the
+    partition's names, so the next reload's load table gets the same names.
+    """
+    load_name = load_table_name(parent, year)
+    name = partition_name(parent, year)
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT idx.relname
+            FROM pg_index i
+            JOIN pg_class idx ON idx.oid = i.indexrelid
+            WHERE i.indrelid = to_regclass(%s)
+            """,
+            (load_name,),
+        )
+        indexes = [row[0] for row in cur.fetchall()]
+
+        cur.execute(sql.SQL("ALTER TABLE {} RENAME TO {}").format(
+            sql.Identifier(load_name), sql.Identifier(name),
+        ))
+        for index in indexes:
+            if index.startswith(load_name):
+                cur.execute(sql.SQL("ALTER INDEX {} RENAME TO {}").format(
+                    sql.Identifier(index), sql.Identifier(name + index[len(load_name):]),
+                ))
+
+
+def attach_year_partitions(conn: Connection, year: int) -> None:
+    """
+    Replace a year's fars_crashes and fars_persons partitions with its loaded
+    tables in one transaction, so readers see either the old year or the new
+    one, never neither.
+
+    Postgres will not TRUNCATE a single fars_crashes partition while
+    fars_persons holds a foreign key to the parent, so the old pair is
+    detached and dropped rather than emptied. Other years are untouched.
+
+    Does not commit, so the caller can record the load in the same
+    transaction; until it commits, readers still see the old partitions.
+    """
+    with conn.cursor() as cur:
+        cur.execute(sql.SQL("LOCK TABLE {} IN ACCESS EXCLUSIVE MODE").format(
+            sql.SQL(", ").join(sql.Identifier(parent) for parent, _ in PARENTS),
+        ))
+
+        # Persons first: detaching a crash partition fails while rows reference it
+        for parent, _ in reversed(PARENTS):
+            name = partition_name(parent, year)
+            if is_attached(conn, name):
+                cur.execute(sql.SQL("ALTER TABLE {} DETACH PARTITION {}").format(
+                    sql.Identifier(parent), sql.Identifier(name),
+                ))
+            cur.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(sql.Identifier(name)))
+
+        # Crashes first, so the persons foreign key can be validated
+        for parent, _ in PARENTS:
+            name = load_table_name(parent, year)
+            cur.execute(sql.SQL(
+                "ALTER TABLE {} ATTACH PARTITION {} FOR VALUES FROM ({}) TO ({})"
+            ).format(
+                sql.Identifier(parent),
+                sql.Identifier(name),
+                sql.Literal(year),
+                sql.Literal(year + 1),
+            ))
+            cur.execute(sql.SQL("ALTER TABLE {} DROP CONSTRAINT {}").format(
+                sql.Identifier(name), sql.Identifier(f"{name}_year_check"),
+            ))
+            rename_load_table(conn, parent, year)
+    logger.debug("[FARS] %s | swapped in loaded partitions", year)
+
+
+def discard_year_partitions(conn: Connection, year: int) -> None:
+    """
+    Drop a year's load tables after a failed load. Rolls back first, since
+    the failure may have aborted the current transaction; the attached
+    partitions are left as they were.
+    """
+    conn.rollback()
+    with conn.cursor() as cur:
+        for parent, _ in reversed(PARENTS):
+            cur.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(
+                sql.Identifier(load_table_name(parent, year)),
+            ))
+    conn.commit()
+    logger.debug("[FARS] %s | discarded load tables", year)
@@ -0,0 +1,45 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from psycopg import Connection
+from psycopg.pq import TransactionStatus
+
+from pipeline.logger import get_logger
+
+logger = get_logger(__name__)
+
+# First key of the two-key advisory lock; the second key is the FARS year.
+# Keeps these locks from colliding with any other advisory locks in the database.
+FARS_YEAR_LOCK_NAMESPACE: int = 3170
+
+
+@contextmanager
+def fars_year_lock(conn: Connection, year: int) -> Iterator[bool]:
+    """
+    Hold a session-level advisory lock on a FARS year, on ``conn``, for the
+    duration of the block. Yields False without waiting if another worker or
+    another pipeline run already holds the lock, so callers can skip the year.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT pg_try_advisory_lock(%s, %s)",
+            (FARS_YEAR_LOCK_NAMESPACE, year),
+        )
+        row = cur.fetchone()
+        acquired = bool(row and row[0])
+    conn.commit()
+
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            # A failed statement in the block leaves the transaction aborted;
+            # roll it back so the unlock runs and the original error surfaces
+            if conn.info.transaction_status == TransactionStatus.INERROR:
+                conn.rollback()
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT pg_advisory_unlock(%s, %s)",
+                    (FARS_YEAR_LOCK_NAMESPACE, year),
+                )
+            conn.commit()
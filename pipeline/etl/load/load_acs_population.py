@@ -29,7 +29,7 @@ def load_population_data():
     headers = data[0]
     rows = data[1:]
 
-    with get_conn() as conn:
+    with get_conn("load") as conn:
         with conn.cursor() as cur:
             for row in rows:
                 record = dict(zip(headers, row))
@@ -1,13 +1,22 @@
 import re
 import csv
 import time
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
 from psycopg import sql
 from psycopg import Connection
 
 from pipeline.logger import get_logger
 from pipeline.connection import get_conn
+from pipeline.etl.enrich.assign_crash_places import PlaceIndex, get_place_index, match_places
+from pipeline.etl.extract.fars.extract_fars import open_fars_csv
+from pipeline.etl.load.fars_partitions import crash_load_table
 from pipeline.etl.transform.mappings import STATE_FIPS_MAP
+from pipeline.etl.transform.parse_fars_crash_batch import assemble_fars_crash_batch
 from pipeline.etl.transform.parse_fars_crash import (
     parse_fars_date, 
     parse_fars_geom, 
@@ -18,8 +27,30 @@ logger = get_logger(__name__)
 
 BATCH_SIZE: int = 5000
 
+# Rows per chunk handed to the columnar transform on the bulk path.
+TRANSFORM_CHUNK_SIZE: int = 50_000
+
 YEAR_REGEX = re.compile(r"(19|20)\d{2}")
 
+# Columns written by the bulk COPY path, in staging table order.
+STAGING_COLUMNS: tuple[str, ...] = (
+    "st_case",
+    "year",
+    "crash_date",
+    "state",
+    "state_name",
+    "county",
+    "county_name",
+    "city",
+    "fars_city_name",
+    "route_code",
+    "road_label",
+    "total_fatalities",
+    "location",
+    "place_fips",
+    "fips_city_name",
+)
+
 def count_peds(person_rows) -> int:
     '''
     Stub fns for counting number of fatality types in each FARS case.
@@ -101,14 +132,14 @@ def assemble_fars_crash(
 
 def insert_fars_crash(conn: Connection, record: dict) -> bool:
     """
-    Inserts a single row from a FARS CSV into the crashes table.
+    Inserts a single row from a FARS CSV into the crash load table for its year.
     Parameters:
         record (dict): a dictionary representing one row from the accidents csv, 
                        with minor transformations applied. Ready for insertion into DB.
     """
 
     insert_query = sql.SQL("""
-        INSERT INTO fars_crashes (
+        INSERT INTO {partition} (
             st_case, 
             year,
             crash_date, 
@@ -151,7 +182,7 @@ def insert_fars_crash(conn: Connection, record: dict) -> bool:
         )
         ON CONFLICT (st_case, year) DO NOTHING
         RETURNING 1;
-    """)
+    """).format(partition=crash_load_table(record["year"]))
 
     try:
         with conn.cursor() as cur:
@@ -239,24 +270,239 @@ def load_fars_crash_rows(
     return insert_count, skip_count, error_count
 
 
-def load_fars_crash_year(file_path: Path, year: int) -> tuple[int, int, int]:
+def crash_staging_table(year: int) -> sql.Identifier:
+    """
+    Name of the per-year unlogged staging table. One table per year keeps
+    concurrent loads of different years from truncating each other's rows.
+    """
+    return sql.Identifier(f"fars_crashes_stage_{year}")
+
+
+def create_crash_staging_table(conn: Connection, year: int) -> sql.Identifier:
     """
-    Load a single FARS CSV file into the database.
+    (Re)create an empty unlogged staging table for a year's ACCIDENT.CSV rows.
+    Unlogged tables skip WAL, which is fine for throwaway staging data.
+    """
+    stage = crash_staging_table(year)
+    with conn.cursor() as cur:
+        cur.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(stage))
+        cur.execute(sql.SQL("""
+            CREATE UNLOGGED TABLE {} (
+                st_case INTEGER NOT NULL,
+                year INTEGER NOT NULL,
+                crash_date DATE,
+                state CHAR(2) NOT NULL,
+                state_name VARCHAR(20),
+                county CHAR(3) NOT NULL,
+                county_name VARCHAR(40),
+                city CHAR(4) NOT NULL,
+                fars_city_name VARCHAR(80),
+                route_code INTEGER,
+                road_label VARCHAR(30),
+                total_fatalities INTEGER NOT NULL,
+                location GEOMETRY(Point, 4326),
+                place_fips CHAR(5),
+                fips_city_name VARCHAR(80)
+            )
+        """).format(stage))
+    return stage
+
+
+def drop_crash_staging_table(conn: Connection, year: int) -> None:
+    with conn.cursor() as cur:
+        cur.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(crash_staging_table(year)))
+
+
+def crash_copy_rows(records: pd.DataFrame) -> Iterator[tuple]:
+    """
+    Yield COPY rows in STAGING_COLUMNS order from a frame of assembled crash
+    records. The point is sent as EWKT so PostGIS builds the geometry during COPY.
+    """
+    location = [
+        None if lon is None or lat is None else f"SRID=4326;POINT({lon!r} {lat!r})"
+        for lon, lat in zip(records["lon"].tolist(), records["lat"].tolist())
+    ]
+
+    columns = [
+        location if col == "location" else records[col].tolist()
+        for col in STAGING_COLUMNS
+    ]
+    return zip(*columns)
+
+
+def copy_crash_records(
+        conn: Connection,
+        stage: sql.Identifier,
+        rows: Iterable[tuple],
+) -> int:
+    """
+    Stream crash rows (in STAGING_COLUMNS order) into the staging table with
+    COPY FROM STDIN.
+
+    Returns:
+        Number of rows staged.
+    """
+    copy_query = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        stage,
+        sql.SQL(", ").join(sql.Identifier(col) for col in STAGING_COLUMNS),
+    )
+    staged = 0
+    with conn.cursor() as cur:
+        with cur.copy(copy_query) as copy:
+            for row in rows:
+                copy.write_row(row)
+                staged += 1
+    return staged
+
+
+def merge_crash_staging(conn: Connection, stage: sql.Identifier, year: int) -> int:
+    """
+    Set-based merge of the staging table into the year's crash load table
+    (see fars_partitions). Rows that already exist for (st_case, year) are left untouched.
+
+    Returns:
+        Number of rows inserted.
+    """
+    columns = sql.SQL(", ").join(sql.Identifier(col) for col in STAGING_COLUMNS)
+    merge_query = sql.SQL("""
+        INSERT INTO {partition} ({columns})
+        SELECT {columns}
+        FROM {stage}
+        ON CONFLICT (st_case, year) DO NOTHING
+    """).format(partition=crash_load_table(year), columns=columns, stage=stage)
+
+    with conn.cursor() as cur:
+        cur.execute(merge_query)
+        return cur.rowcount
+
+
+def iter_fars_crash_copy_rows(
+        chunks: Iterable[pd.DataFrame],
+        glc_lookup: dict,
+        file_year: int,
+        error_counts: list[int],
+        place_index: PlaceIndex | None = None,
+) -> Iterator[tuple]:
+    """
+    Run the columnar transform over each chunk of raw ACCIDENT.CSV rows and
+    yield COPY rows. The number of rows that failed to parse in each chunk is
+    appended to ``error_counts``.
+
+    With a ``place_index`` each chunk's points are matched to census places
+    before COPY; otherwise place_fips/fips_city_name are left NULL for
+    enrich_crash_locations to fill in.
+    """
+    for chunk in chunks:
+        records, chunk_errors = assemble_fars_crash_batch(chunk, glc_lookup, file_year)
+        error_count = int(chunk_errors.sum())
+        error_counts.append(error_count)
+        if error_count:
+            failed = chunk.loc[chunk_errors, "ST_CASE"].tolist() if "ST_CASE" in chunk.columns else []
+            logger.error(
+                "[FARS] %s | %s rows failed to parse (ST_CASE=%s)",
+                file_year, error_count, failed[:10],
+            )
+        if place_index is not None:
+            place_fips, fips_city_name = match_places(
+                place_index,
+                records["lon"].to_numpy(dtype=np.float64, na_value=np.nan),
+                records["lat"].to_numpy(dtype=np.float64, na_value=np.nan),
+            )
+        else:
+            place_fips = fips_city_name = np.full(len(records), None, dtype=object)
+        # object dtype keeps None as None; a string column would COPY it as "nan"
+        records["place_fips"] = pd.Series(place_fips, index=records.index, dtype=object)
+        records["fips_city_name"] = pd.Series(fips_city_name, index=records.index, dtype=object)
+        yield from crash_copy_rows(records)
+
+
+def load_fars_crash_rows_bulk(
+        conn: Connection,
+        chunks: Iterable[pd.DataFrame],
+        file_year: int,
+        assign_places: bool = False,
+) -> tuple[int, int, int]:
+    """
+    Bulk variant of load_fars_crash_rows: transform chunks of raw rows with
+    the columnar engine, COPY them into an unlogged staging table, then merge
+    into fars_crashes with a single INSERT ... SELECT ... ON CONFLICT.
+
+    assign_places=True matches each chunk against an in-process STRtree of
+    census place boundaries, so the year needs no post-load enrichment pass.
+
+    Rows that fail to parse are counted as errors; a COPY or merge failure
+    aborts the whole year, since nothing is committed until the merge succeeds.
+
+    Returns:
+        (insert_count, skip_count, error_count)
+    """
+    glc_lookup = load_glc_lookup(conn)
+    place_index = get_place_index(conn) if assign_places else None
+    error_counts: list[int] = []
+
+    # Created in the load's transaction, so the caller's rollback removes it
+    # if COPY or the merge fails
+    stage = create_crash_staging_table(conn, file_year)
+    staged = copy_crash_records(
+        conn,
+        stage,
+        iter_fars_crash_copy_rows(chunks, glc_lookup, file_year, error_counts, place_index),
+    )
+    insert_count = merge_crash_staging(conn, stage, file_year)
+    drop_crash_staging_table(conn, file_year)
+
+    skip_count = staged - insert_count
+    error_count = sum(error_counts)
+    logger.debug(
+        "[FARS] %s | staged=%s | inserted=%s | skipped=%s | errors=%s",
+        file_year, staged, insert_count, skip_count, error_count,
+    )
+    return insert_count, skip_count, error_count
+
+
+def load_fars_crash_year(
+        file_path: Path,
+        year: int,
+        bulk: bool = True,
+        assign_places: bool = False,
+        conn: Connection | None = None,
+) -> tuple[int, int, int]:
+    """
+    Load a year's ACCIDENT.CSV into the database. ``file_path`` is either the
+    downloaded FARS zip (the CSV is streamed out of it) or an extracted CSV.
+
+    By default rows are parsed with the columnar transform in chunks of
+    TRANSFORM_CHUNK_SIZE and loaded through the COPY + staging merge path. Pass
+    bulk=False to fall back to per-row inserts, which isolates failures to
+    individual rows when debugging a problematic file.
+
+    assign_places=True (bulk only) fills place_fips/fips_city_name during the
+    load instead of leaving them to enrich_crash_locations.
+
+    Runs on ``conn`` when given, e.g. the connection load_fars_year already
+    holds, instead of checking out another from the pool.
     """
     start = time.time()
-    logger.info(f"[FARS] Loading {year} {file_path.name}")
+    logger.info(f"[FARS] Loading {year} ACCIDENT.CSV from {file_path.name}")
 
     try:
-        with open(
-            file_path,
-            newline="",
-            encoding="utf-8-sig",
-            errors="replace",
-        ) as csvfile:
-            reader = csv.DictReader(csvfile)
-
-            with get_conn() as conn:
-                insert_count, skip_count, error_count = load_fars_crash_rows(conn=conn, reader=reader, file_year=year)
+        with open_fars_csv(file_path, "ACCIDENT.CSV") as csvfile:
+            with nullcontext(conn) if conn is not None else get_conn("load") as conn:
+                if bulk:
+                    chunks = pd.read_csv(
+                        csvfile,
+                        dtype=str,
+                        keep_default_na=False,
+                        chunksize=TRANSFORM_CHUNK_SIZE,
+                    )
+                    insert_count, skip_count, error_count = load_fars_crash_rows_bulk(
+                        conn=conn, chunks=chunks, file_year=year, assign_places=assign_places
+                    )
+                else:
+                    reader = csv.DictReader(csvfile)
+                    insert_count, skip_count, error_count = load_fars_crash_rows(
+                        conn=conn, reader=reader, file_year=year
+                    )
                 conn.commit()
     except Exception as e:
         logger.error(f"[FARS] {year} load failed: {e}")
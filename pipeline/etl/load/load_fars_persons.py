@@ -1,23 +1,40 @@
 import csv
 import time
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Iterable, Iterator
+from psycopg import sql
 from psycopg import Connection
 
 from pipeline.logger import get_logger
 from pipeline.connection import get_conn
+from pipeline.etl.extract.fars.extract_fars import open_fars_csv
+from pipeline.etl.load.fars_partitions import crash_load_table, person_load_table
 
 logger = get_logger(__name__)
 
-BATCH_SIZE: int = 5000
+# Columns written by the COPY path, in staging table order.
+STAGING_COLUMNS: tuple[str, ...] = (
+    "st_case",
+    "crash_year",
+    "vehicle_number",
+    "person_number",
+    "person_age",
+    "sex",
+    "person_type",
+    "injury_severity",
+    "location_code",
+)
+
+ORPHAN_REASON = "missing_crash"
+
 
 def assemble_fars_person(
     person_row: dict,
-    crash_id: int,
     file_year: int,
 ) -> dict:
     return {
-        "crash_id": crash_id,
-        "st_case": person_row["ST_CASE"],
+        "st_case": int(person_row["ST_CASE"]),
         "crash_year": file_year,
         "vehicle_number": int(person_row["VEH_NO"]),
         "person_number": int(person_row["PER_NO"]),
@@ -29,25 +46,72 @@ def assemble_fars_person(
     }
 
 
-def load_crash_id_map(conn: Connection, year: int) -> dict[int, int]:
+def person_staging_table(year: int) -> sql.Identifier:
+    return sql.Identifier(f"fars_persons_stage_{year}")
+
+
+def create_person_staging_table(conn: Connection, year: int) -> sql.Identifier:
     """
-    Map ST_CASE → crash_id for a given year.
+    (Re)create an empty unlogged staging table for a year's PERSON.CSV rows.
     """
+    stage = person_staging_table(year)
     with conn.cursor() as cur:
-        cur.execute(
-            """
-            SELECT st_case, crash_id
-            FROM fars_crashes
-            WHERE year = %s
-            """,
-            (year,),
-        )
-        return {st_case: crash_id for st_case, crash_id in cur.fetchall()}
+        cur.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(stage))
+        cur.execute(sql.SQL("""
+            CREATE UNLOGGED TABLE {} (
+                st_case INTEGER NOT NULL,
+                crash_year INTEGER NOT NULL,
+                vehicle_number INTEGER NOT NULL,
+                person_number INTEGER NOT NULL,
+                person_age INTEGER,
+                sex INTEGER,
+                person_type INTEGER NOT NULL,
+                injury_severity INTEGER NOT NULL,
+                location_code INTEGER NOT NULL
+            )
+        """).format(stage))
+    return stage
+
+
+def drop_person_staging_table(conn: Connection, year: int) -> None:
+    with conn.cursor() as cur:
+        cur.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(person_staging_table(year)))
+
+
+def copy_person_records(
+        conn: Connection,
+        stage: sql.Identifier,
+        records: Iterable[dict],
+) -> int:
+    """
+    Stream assembled person records into the staging table with COPY FROM STDIN.
+
+    Returns:
+        Number of rows staged.
+    """
+    copy_query = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        stage,
+        sql.SQL(", ").join(sql.Identifier(col) for col in STAGING_COLUMNS),
+    )
+    staged = 0
+    with conn.cursor() as cur:
+        with cur.copy(copy_query) as copy:
+            for record in records:
+                copy.write_row(tuple(record[col] for col in STAGING_COLUMNS))
+                staged += 1
+    return staged
 
 
-def insert_fars_person(conn: Connection, record: dict) -> bool:
-    query = """
-        INSERT INTO fars_persons (
+def merge_person_staging(conn: Connection, stage: sql.Identifier, year: int) -> int:
+    """
+    Resolve crash_id by joining staged rows to the year's crash load table on
+    st_case and insert the matches into its person load table.
+
+    Returns:
+        Number of rows inserted.
+    """
+    merge_query = sql.SQL("""
+        INSERT INTO {partition} (
             crash_id,
             st_case,
             crash_year,
@@ -59,117 +123,185 @@ def insert_fars_person(conn: Connection, record: dict) -> bool:
             injury_severity,
             location_code
         )
-        VALUES (
-            %(crash_id)s,
-            %(st_case)s,
-            %(crash_year)s,
-            %(vehicle_number)s,
-            %(person_number)s,
-            %(person_age)s,
-            %(sex)s,
-            %(person_type)s,
-            %(injury_severity)s,
-            %(location_code)s
-        )
-        ON CONFLICT (crash_id, vehicle_number, person_number) DO NOTHING
-        RETURNING 1;
-    """
-    try:
-        with conn.cursor() as cur:
-            cur.execute(query, record)
-            return cur.fetchone() is not None
-    except Exception:
-        raise
+        SELECT
+            c.crash_id,
+            s.st_case,
+            s.crash_year,
+            s.vehicle_number,
+            s.person_number,
+            s.person_age,
+            s.sex,
+            s.person_type,
+            s.injury_severity,
+            s.location_code
+        FROM {stage} s
+        JOIN {crashes} c
+            ON c.st_case = s.st_case
+            AND c.year = s.crash_year
+        ON CONFLICT (crash_id, person_number, vehicle_number, crash_year) DO NOTHING
+    """).format(
+        partition=person_load_table(year),
+        crashes=crash_load_table(year),
+        stage=stage,
+    )
 
-def load_fars_persons_rows(
-        conn: Connection, 
-        reader:csv.DictReader, 
-        file_year: int,
-        crash_id_map: dict[int, int]
-) -> tuple[int, int, int]:
-    
-    insert_count = 0
-    skip_count = 0
-    error_count = 0
+    with conn.cursor() as cur:
+        cur.execute(merge_query)
+        return cur.rowcount
 
-    # -- batch deltas --
-    batch_processed = 0
-    batch_inserted = 0
-    batch_skipped = 0
-    batch_errors = 0
 
-    for idx, row in enumerate(reader, start=1):
-        batch_processed += 1
-
-        st_case = int(row["ST_CASE"])
-        crash_id = crash_id_map.get(st_case)
-        if crash_id is None:
-            logger.warning(
-                "[FARS] %s | Skipping person row %d — ST_CASE %d not found in crashes",
-                file_year, idx, st_case,
+def reject_orphan_persons(conn: Connection, stage: sql.Identifier, year: int) -> int:
+    """
+    Move staged rows with no matching crash into fars_persons_rejects, and clear
+    earlier rejects for this year that now resolve to a crash.
+
+    Returns:
+        Number of orphan rows in this load (including ones already rejected
+        by a previous run).
+    """
+    reject_query = sql.SQL("""
+        WITH orphans AS (
+            SELECT s.*
+            FROM {stage} s
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM {crashes} c
+                WHERE c.st_case = s.st_case
+                  AND c.year = s.crash_year
+            )
+        ),
+        rejected AS (
+            INSERT INTO fars_persons_rejects (
+                st_case,
+                crash_year,
+                vehicle_number,
+                person_number,
+                person_age,
+                sex,
+                person_type,
+                injury_severity,
+                location_code,
+                reason
             )
-            skip_count += 1
-            batch_skipped += 1
-            continue
-
-        record = assemble_fars_person(
-                    file_year=file_year,
-                    person_row=row,
-                    crash_id=crash_id,
+            SELECT
+                st_case,
+                crash_year,
+                vehicle_number,
+                person_number,
+                person_age,
+                sex,
+                person_type,
+                injury_severity,
+                location_code,
+                %(reason)s
+            FROM orphans
+            ON CONFLICT (crash_year, st_case, vehicle_number, person_number) DO NOTHING
+            RETURNING 1
+        )
+        SELECT
+            (SELECT COUNT(*) FROM orphans),
+            (SELECT COUNT(*) FROM rejected)
+    """).format(stage=stage, crashes=crash_load_table(year))
+
+    resolved_query = sql.SQL("""
+        DELETE FROM fars_persons_rejects r
+        USING {crashes} c
+        WHERE r.crash_year = %(year)s
+          AND c.year = r.crash_year
+          AND c.st_case = r.st_case
+    """).format(crashes=crash_load_table(year))
+
+    with conn.cursor() as cur:
+        cur.execute(resolved_query, {"year": year})
+        resolved_count = cur.rowcount
+        cur.execute(reject_query, {"reason": ORPHAN_REASON})
+        row = cur.fetchone()
+        assert row is not None
+        orphan_count, new_reject_count = row
+
+    if resolved_count:
+        logger.info("[FARS] %s | %s previously rejected person rows now match a crash", year, resolved_count)
+    if orphan_count:
+        logger.warning(
+            "[FARS] %s | %s person rows have no matching crash (%s new) — see fars_persons_rejects",
+            year, orphan_count, new_reject_count,
         )
+    return orphan_count
+
+
+def iter_fars_person_records(
+        reader: Iterable[dict],
+        file_year: int,
+        errors: list[int],
+) -> Iterator[dict]:
+    """
+    Assemble person records from raw CSV rows, skipping rows that fail to parse.
+    The index of every failed row is appended to ``errors``.
+    """
+    for idx, row in enumerate(reader, start=1):
         try:
-            inserted = insert_fars_person(conn, record)
-        except Exception:
-            conn.rollback()
-            for key, value in record.items():
-                if isinstance(value, str):
-                    logger.debug("FIELD %s len=%d value=%r", key, len(value), value)
-            error_count += 1
-            batch_errors += 1
+            yield assemble_fars_person(person_row=row, file_year=file_year)
+        except (KeyError, TypeError, ValueError):
+            errors.append(idx)
             logger.exception(
-                f"[FARS] {file_year} | Failed to insert row {idx} "
+                f"[FARS] {file_year} | Failed to assemble row {idx} "
                 f"(ST_CASE={row.get('ST_CASE')})"
             )
-        else:
-            if inserted:
-                insert_count += 1
-                batch_inserted += 1
-            else:
-                skip_count += 1
-                batch_skipped += 1
-            if idx % BATCH_SIZE == 0:
-                conn.commit()
-                logger.debug(
-                    "(batch committed) +%s processed | +%s inserted | +%s skipped | +%s errors",
-                    batch_processed,
-                    batch_inserted,
-                    batch_skipped,
-                    batch_errors,
-                )
-    
-    return insert_count, skip_count, error_count
-    
-
-def load_fars_person_year(file_path: Path, year: int) -> tuple[int, int, int]:
+
+
+def load_fars_persons_rows(
+        conn: Connection,
+        reader: csv.DictReader,
+        file_year: int,
+) -> tuple[int, int, int]:
+    """
+    COPY PERSON.CSV rows into an unlogged staging table, then resolve crash_id
+    and insert into fars_persons in one statement. Orphan rows are written to
+    fars_persons_rejects and counted as skipped.
+
+    Returns:
+        (insert_count, skip_count, error_count)
+    """
+    errors: list[int] = []
+
+    # Created in the load's transaction, so the caller's rollback removes it
+    # if COPY or the merge fails
+    stage = create_person_staging_table(conn, file_year)
+    staged = copy_person_records(
+        conn,
+        stage,
+        iter_fars_person_records(reader, file_year, errors),
+    )
+    insert_count = merge_person_staging(conn, stage, file_year)
+    reject_orphan_persons(conn, stage, file_year)
+    drop_person_staging_table(conn, file_year)
+
+    skip_count = staged - insert_count
+    return insert_count, skip_count, len(errors)
+
+
+def load_fars_person_year(
+        file_path: Path,
+        year: int,
+        conn: Connection | None = None,
+) -> tuple[int, int, int]:
+    """
+    Load a year's PERSON.CSV into the database. ``file_path`` is either the
+    downloaded FARS zip (the CSV is streamed out of it) or an extracted CSV.
+    Runs on ``conn`` when given instead of checking out another connection.
+    """
     start = time.time()
-    logger.info(f"[FARS] Loading {year} {file_path.name}")
+    logger.info(f"[FARS] Loading {year} PERSON.CSV from {file_path.name}")
 
     try:
-        with open(
-            file_path,
-            newline="",
-            encoding="utf-8-sig",
-            errors="replace",
-        ) as csvfile:
+        with open_fars_csv(file_path, "PERSON.CSV") as csvfile:
             reader = csv.DictReader(csvfile)
 
-            with get_conn() as conn:
-                crash_id_map = load_crash_id_map(conn, year)
+            with nullcontext(conn) if conn is not None else get_conn("load") as conn:
                 insert_count, skip_count, error_count = load_fars_persons_rows(
-                    conn=conn, 
-                    reader=reader, 
-                    file_year=year,
-                    crash_id_map=crash_id_map)
+                    conn=conn,
+                    reader=reader,
+                    file_year=year)
                 conn.commit()
     except Exception as e:
         logger.error(f"[FARS] {year} load failed: {e}")
@@ -181,4 +313,4 @@ def load_fars_person_year(file_path: Path, year: int) -> tuple[int, int, int]:
             f"Inserted={insert_count}, skipped={skip_count}, errors={error_count}, "
             f"duration={elapsed:.2f}s"
         )
-        return insert_count, skip_count, error_count
\ No newline at end of file
+        return insert_count, skip_count, error_count
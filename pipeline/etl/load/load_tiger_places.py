@@ -5,6 +5,8 @@ import geopandas as gpd
 from psycopg import Connection
 
 from pipeline.etl.transform.mappings import DISPLAY_NAME_MAP, STATE_FIPS_MAP
+from pipeline.etl.transform.derive_simplified_places import refresh_simplified_places
+from pipeline.etl.transform.derive_subdivided_places import refresh_subdivided_places
 from pipeline.connection import get_conn
 from pipeline.logger import get_logger
 from scripts.load_vision_zero_cities import load_vision_zero_cities
@@ -14,6 +16,17 @@ logger = get_logger(__name__)
 
 BATCH_SIZE = 500
 
+# geom_updated_at for an UPDATE of census_places aliased "places" setting geom
+# to {new}. Only a real change is stamped, so re-running the TIGER load does
+# not mark every boundary as changed for the incremental enrichment. ST_Equals
+# ignores the vertex order ST_Union does not keep stable between runs.
+GEOM_UPDATED_AT = """CASE
+                    WHEN places.geom IS DISTINCT FROM {new}
+                     AND NOT COALESCE(ST_Equals(places.geom, {new}), FALSE)
+                    THEN now()
+                    ELSE places.geom_updated_at
+                END"""
+
 
 def insert_tiger_place(conn: Connection, record: dict) -> bool:
     insert_query = """
@@ -104,7 +117,7 @@ def load_tiger_places(shapefiles: list[Path]) -> tuple[int, int, int]:
 
     total_inserted = total_skipped = total_errors = 0
 
-    with get_conn() as conn:
+    with get_conn("load") as conn:
         for shp_path in shapefiles:
             logger.info(f"[LOAD][TIGER] Loading {shp_path.name}")
             try:
@@ -122,6 +135,8 @@ def load_tiger_places(shapefiles: list[Path]) -> tuple[int, int, int]:
                 logger.error(f"[TIGER] Failed to load {shp_path.name}: {e}")
                 raise
 
+        refresh_subdivided_places(conn)
+        refresh_simplified_places(conn)
         fix_consolidated_governments(conn)
         cleanup_boundary_polygons(conn)
 
@@ -139,9 +154,11 @@ def load_tiger_places(shapefiles: list[Path]) -> tuple[int, int, int]:
 def cleanup_boundary_polygons(conn) -> None:
     with conn.cursor() as cur:
         # remove Farallon Island from San Francisco boundary
-        cur.execute("""
-            UPDATE census_places
-            SET geom = (
+        cur.execute(f"""
+            UPDATE census_places places
+            SET geom = largest.geom,
+                geom_updated_at = {GEOM_UPDATED_AT.format(new="largest.geom")}
+            FROM (
                 SELECT geom
                 FROM (
                     SELECT (ST_Dump(geom)).geom, ST_Area((ST_Dump(geom)).geom) AS area
@@ -150,10 +167,12 @@ def cleanup_boundary_polygons(conn) -> None:
                 ) parts
                 ORDER BY area DESC
                 LIMIT 1
-            )
-            WHERE state_fips = '06' AND place_fips = '67000'
+            ) largest
+            WHERE places.state_fips = '06' AND places.place_fips = '67000'
         """)
         conn.commit()
+    refresh_subdivided_places(conn, [("06", "67000")])
+    refresh_simplified_places(conn, [("06", "67000")])
     logger.info("[TIGER] City boundaries cleaned up.")
 
 
@@ -166,11 +185,18 @@ def fix_consolidated_governments(conn) -> None:
 
     with conn.cursor() as cur:
         # Louisville: union balance area with excluded incorporated places
-        cur.execute("""
-            UPDATE census_places
-            SET 
-                geom = (
-                    SELECT ST_Union(ARRAY_AGG(geom))
+        cur.execute(f"""
+            UPDATE census_places places
+            SET
+                geom = merged.geom,
+                geom_updated_at = {GEOM_UPDATED_AT.format(new="merged.geom")},
+                point_geom = (
+                    SELECT point_geom
+                    FROM census_places
+                    WHERE state_fips = '21' AND place_fips = '48000'
+                )
+            FROM (
+                    SELECT ST_Union(ARRAY_AGG(geom)) AS geom
                     FROM census_places
                     WHERE state_fips = '21' 
                     AND place_fips IN (
@@ -218,13 +244,10 @@ def fix_consolidated_governments(conn) -> None:
                         '65766',
                         '84576'
                     )
-                ),
-                point_geom = (
-                    SELECT point_geom
-                    FROM census_places
-                    WHERE state_fips = '21' AND place_fips = '48000'
-                )
-            WHERE state_fips = '21' AND place_fips = '48006'
+            ) merged
+            WHERE places.state_fips = '21' AND places.place_fips = '48006'
         """)
         conn.commit()
+    refresh_subdivided_places(conn, [("21", "48006")])
+    refresh_simplified_places(conn, [("21", "48006")])
     logger.info("[TIGER] Consolidated government boundaries fixed.")
\ No newline at end of file
@@ -219,7 +219,7 @@ def run_derive_city_rankings() -> None:
     start = time.time()
     logger.info("[PIPELINE][TRANSFORM] Deriving city rankings.")
 
-    with get_conn() as conn:
+    with get_conn("transform") as conn:
         updated, errors = derive_city_rankings(conn)
 
     elapsed = time.time() - start
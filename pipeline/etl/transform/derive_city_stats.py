@@ -10,7 +10,8 @@ logger = get_logger(__name__)
 def derive_city_stats(conn: Connection) -> tuple[int, int]:
     """
     Compute aggregate fatality stats for each city in city_stats and write
-    them back. Requires fars_crashes to be fully loaded and subtype-derived.
+    them back. Reads the per-year sums in city_year_fatalities, so it must run
+    after refresh_city_year_fatalities and never scans fars_crashes.
 
     Stats computed:
     - avg_fatalities_5yr: average annual total fatalities over the 5 most recent years
@@ -24,7 +25,7 @@ def derive_city_stats(conn: Connection) -> tuple[int, int]:
     query = """
         WITH ten_years AS (
             SELECT year
-            FROM fars_crashes
+            FROM city_year_fatalities
             GROUP BY year
             ORDER BY year DESC
             LIMIT 10
@@ -41,18 +42,16 @@ def derive_city_stats(conn: Connection) -> tuple[int, int]:
         ),
         city_annual AS (
             SELECT
-                fc.state,
-                fc.place_fips,
-                fc.year,
-                SUM(fc.total_fatalities)      AS fatalities,
-                SUM(fc.pedestrian_fatalities) AS ped_fatalities,
-                SUM(fc.cyclist_fatalities)    AS cyc_fatalities,
-                SUM(fc.motorist_fatalities 
-                    + COALESCE(fc.other_fatalities, 0)) AS mot_fatalities
-            FROM fars_crashes fc
-            WHERE fc.year IN (SELECT year FROM ten_years)
-              AND fc.place_fips IS NOT NULL
-            GROUP BY fc.state, fc.place_fips, fc.year
+                cyf.state,
+                cyf.place_fips,
+                cyf.year,
+                cyf.total_fatalities      AS fatalities,
+                cyf.pedestrian_fatalities AS ped_fatalities,
+                cyf.cyclist_fatalities    AS cyc_fatalities,
+                cyf.motorist_fatalities
+                    + COALESCE(cyf.other_fatalities, 0) AS mot_fatalities
+            FROM city_year_fatalities cyf
+            WHERE cyf.year IN (SELECT year FROM ten_years)
         ),
         city_stats_computed AS (
             SELECT
@@ -165,7 +164,7 @@ def run_derive_city_stats() -> None:
     start = time.time()
     logger.info("[PIPELINE][TRANSFORM] Deriving city stats.")
 
-    with get_conn() as conn:
+    with get_conn("transform") as conn:
         updated, errors = derive_city_stats(conn)
 
     elapsed = time.time() - start
@@ -0,0 +1,80 @@
+import time
+from psycopg import Connection
+
+from pipeline.logger import get_logger
+from pipeline.connection import get_conn
+
+logger = get_logger(__name__)
+
+
+def refresh_city_year_fatalities(conn: Connection, years: list[int] | None = None) -> int:
+    """
+    Recompute city_year_fatalities for the given years from fars_crashes.
+    Requires place_fips and the subtype counts to be derived for those years.
+
+    years=None, or an empty table, rebuilds every year so an existing
+    database backfills on its first run.
+
+    Returns:
+        Number of (state, place_fips, year) rows written.
+    """
+    with conn.cursor() as cur:
+        cur.execute("SELECT NOT EXISTS (SELECT 1 FROM city_year_fatalities)")
+        row = cur.fetchone()
+    if row and row[0]:
+        years = None
+
+    year_filter = "" if years is None else "AND year = ANY(%(years)s)"
+    params = None if years is None else {"years": years}
+
+    if years is None:
+        delete_query = "TRUNCATE city_year_fatalities"
+    else:
+        delete_query = "DELETE FROM city_year_fatalities WHERE year = ANY(%(years)s)"
+
+    insert_query = f"""
+        INSERT INTO city_year_fatalities (
+            state,
+            place_fips,
+            year,
+            total_fatalities,
+            pedestrian_fatalities,
+            cyclist_fatalities,
+            motorist_fatalities,
+            other_fatalities
+        )
+        SELECT
+            state,
+            place_fips,
+            year,
+            SUM(total_fatalities),
+            SUM(pedestrian_fatalities),
+            SUM(cyclist_fatalities),
+            SUM(motorist_fatalities),
+            SUM(other_fatalities)
+        FROM fars_crashes
+        WHERE place_fips IS NOT NULL
+        {year_filter}
+        GROUP BY state, place_fips, year
+    """
+
+    with conn.cursor() as cur:
+        cur.execute(delete_query, params)
+        cur.execute(insert_query, params)
+        written = cur.rowcount
+    conn.commit()
+    return written
+
+
+def run_refresh_city_year_fatalities(years: list[int] | None = None) -> None:
+    start = time.time()
+    logger.info("[PIPELINE][TRANSFORM] Refreshing city_year_fatalities for years=%s", years or "all")
+
+    with get_conn("transform") as conn:
+        written = refresh_city_year_fatalities(conn, years)
+
+    elapsed = time.time() - start
+    logger.info(
+        "[PIPELINE][TRANSFORM] Finished refreshing city_year_fatalities. rows=%s duration=%.2fs",
+        written, elapsed,
+    )
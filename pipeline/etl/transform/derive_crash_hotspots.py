@@ -23,6 +23,10 @@ def derive_crash_hotspots(conn: Connection) -> dict:
     polygon (the grid cell itself) and a "buffer" polygon (core cell expanded
     by BUFFER_SIZE_METERS) for each hotspot, tagged via zone_type.
 
+    Cells are integer (x, y) keys computed from the stored location_5070
+    column, the nearest grid point as with ST_SnapToGrid, so crashes are
+    never reprojected here.
+
     Eligible cities match the existing export scope: population >= 100k or
     Vision Zero-pledged (per census_places / city_stats).
 
@@ -39,36 +43,32 @@ def derive_crash_hotspots(conn: Connection) -> dict:
             WHERE stats.population >= 100000
             OR places.is_vision_zero = TRUE
         ),
-        crashes_projected_5070 AS (
+        crash_cells AS (
             SELECT
-                fc.crash_id,
                 fc.place_fips,
-                ST_Transform(fc.location, 5070) AS geom_5070
+                round(ST_X(fc.location_5070) / %(grid_size)s)::bigint AS cell_x,
+                round(ST_Y(fc.location_5070) / %(grid_size)s)::bigint AS cell_y
             FROM fars_crashes fc
             JOIN eligible_cities ec
                 ON fc.state = ec.state_fips
                 AND fc.place_fips = ec.place_fips
             WHERE fc.year >= %(min_year)s
-            AND fc.location IS NOT NULL
-        ),
-        snapped AS (
-            SELECT
-                place_fips,
-                ST_SnapToGrid(geom_5070, %(grid_size)s) AS cell_origin
-            FROM crashes_projected_5070
+            AND fc.location_5070 IS NOT NULL
         ),
         cell_counts AS (
             SELECT
                 place_fips,
-                cell_origin,
+                cell_x,
+                cell_y,
                 COUNT(*) AS crash_count
-            FROM snapped
-            GROUP BY place_fips, cell_origin
+            FROM crash_cells
+            GROUP BY place_fips, cell_x, cell_y
         ),
         ranked_cells AS (
             SELECT
                 place_fips,
-                cell_origin,
+                cell_x,
+                cell_y,
                 PERCENT_RANK() OVER (
                     PARTITION BY place_fips
                     ORDER BY crash_count
@@ -76,7 +76,7 @@ def derive_crash_hotspots(conn: Connection) -> dict:
             FROM cell_counts
         ),
         hotspot_cells AS (
-            SELECT place_fips, cell_origin
+            SELECT place_fips, cell_x, cell_y
             FROM ranked_cells
             WHERE pct_rank >= %(threshold)s
         ),
@@ -84,8 +84,8 @@ def derive_crash_hotspots(conn: Connection) -> dict:
             SELECT
                 place_fips,
                 ST_MakeEnvelope(
-                    ST_X(cell_origin) - %(half_grid)s, ST_Y(cell_origin) - %(half_grid)s,
-                    ST_X(cell_origin) + %(half_grid)s, ST_Y(cell_origin) + %(half_grid)s,
+                    (cell_x - 0.5) * %(grid_size)s, (cell_y - 0.5) * %(grid_size)s,
+                    (cell_x + 0.5) * %(grid_size)s, (cell_y + 0.5) * %(grid_size)s,
                     5070
                 ) AS core_geom
             FROM hotspot_cells
@@ -141,7 +141,6 @@ def derive_crash_hotspots(conn: Connection) -> dict:
     params = {
         "min_year": MIN_YEAR,
         "grid_size": GRID_SIZE_METERS,
-        "half_grid": GRID_SIZE_METERS / 2,
         "buffer_size": BUFFER_SIZE_METERS,
         "threshold": HOTSPOT_PERCENTILE_THRESHOLD,
         "precision": 5,
@@ -160,7 +159,7 @@ def run_derive_crash_hotspots() -> None:
     logger.info("[PIPELINE][TRANSFORM] Deriving crash hotspots.")
 
     try:
-        with get_conn() as conn:
+        with get_conn("transform") as conn:
             geojson = derive_crash_hotspots(conn)
 
         feature_count = len(geojson.get("features", []))
@@ -6,8 +6,6 @@ from pipeline.connection import get_conn
 
 logger = get_logger(__name__)
 
-BATCH_SIZE: int = 100000
-
 # FARS person_type codes
 MOTORIST_CODES    = {1, 2, 3, 9}
 PEDESTRIAN_CODES  = {5, 10}
@@ -17,121 +15,120 @@ OTHER_CODES       = {4, 8, 11, 12, 13, 19, 99}
 FATAL_SEVERITY = 4
 
 
-def classify_person_type(person_type: int) -> str | None:
-    """
-    Map a FARS person_type code to a fatality subtype bucket.
-    Returns None for unrecognized codes (logged as warnings upstream).
+def derive_year_subtypes(conn: Connection, year: int) -> int:
     """
-    if person_type in MOTORIST_CODES:
-        return "motorist"
-    if person_type in PEDESTRIAN_CODES:
-        return "pedestrian"
-    if person_type in CYCLIST_CODES:
-        return "cyclist"
-    if person_type in OTHER_CODES:
-        return "other"
-    return None
-
-
-def count_fatalities_by_type(conn: Connection, crash_id: int) -> dict:
+    Aggregate fatal persons per crash for a single year and write the subtype
+    counts back to fars_crashes in one UPDATE. Crashes with no fatal persons
+    in a bucket get 0 for that bucket.
+
+    Returns:
+        Number of crashes updated.
     """
-    Query fars_persons for a given crash_id and return fatality counts
-    broken down by subtype. Only counts rows where injury_severity = 4 (fatal).
+    query = """
+        UPDATE fars_crashes fc
+        SET
+            motorist_fatalities    = agg.motorist,
+            pedestrian_fatalities  = agg.pedestrian,
+            cyclist_fatalities     = agg.cyclist,
+            other_fatalities       = agg.other
+        FROM (
+            SELECT
+                c.crash_id,
+                COUNT(p.person_id) FILTER (WHERE p.person_type = ANY(%(motorist_codes)s))   AS motorist,
+                COUNT(p.person_id) FILTER (WHERE p.person_type = ANY(%(pedestrian_codes)s)) AS pedestrian,
+                COUNT(p.person_id) FILTER (WHERE p.person_type = ANY(%(cyclist_codes)s))    AS cyclist,
+                COUNT(p.person_id) FILTER (WHERE p.person_type = ANY(%(other_codes)s))      AS other
+            FROM fars_crashes c
+            LEFT JOIN fars_persons p
+                ON p.crash_id = c.crash_id
+                AND p.crash_year = c.year
+                AND p.injury_severity = %(fatal_severity)s
+            WHERE c.year = %(year)s
+            GROUP BY c.crash_id
+        ) agg
+        WHERE fc.crash_id = agg.crash_id
+          AND fc.year = %(year)s
     """
     with conn.cursor() as cur:
-        cur.execute(
-            """
-            SELECT person_type, COUNT(*) 
-            FROM fars_persons
-            WHERE crash_id = %s AND injury_severity = %s
-            GROUP BY person_type
-            """,
-            (crash_id, FATAL_SEVERITY),
-        )
-        rows = cur.fetchall()
-
-    counts = {"motorist": 0, "pedestrian": 0, "cyclist": 0, "other": 0}
+        cur.execute(query, {**subtype_code_params(), "year": year})
+        return cur.rowcount
 
-    for person_type_code, count in rows:
-        bucket = classify_person_type(person_type_code)
-        if bucket is None:
-            logger.warning(
-                "Unrecognized person_type code %s for crash_id %s — excluded from subtype counts",
-                person_type_code,
-                crash_id,
-            )
-        else:
-            counts[bucket] += count
 
-    return counts
+def subtype_code_params() -> dict:
+    return {
+        "motorist_codes": sorted(MOTORIST_CODES),
+        "pedestrian_codes": sorted(PEDESTRIAN_CODES),
+        "cyclist_codes": sorted(CYCLIST_CODES),
+        "other_codes": sorted(OTHER_CODES),
+        "fatal_severity": FATAL_SEVERITY,
+    }
 
 
-def update_crash_subtypes(conn: Connection, crash_id: int, counts: dict) -> None:
+def report_unrecognized_person_types(conn: Connection, years: list[int]) -> int:
     """
-    Write subtype fatality counts back to fars_crashes for a given crash_id.
+    Log fatal person_type codes that fall outside every subtype bucket for the
+    given years. These persons are excluded from subtype counts.
+
+    Returns:
+        Number of fatal persons with unrecognized codes.
     """
+    known_codes = sorted(MOTORIST_CODES | PEDESTRIAN_CODES | CYCLIST_CODES | OTHER_CODES)
     with conn.cursor() as cur:
         cur.execute(
             """
-            UPDATE fars_crashes
-            SET
-                motorist_fatalities    = %(motorist)s,
-                pedestrian_fatalities  = %(pedestrian)s,
-                cyclist_fatalities     = %(cyclist)s,
-                other_fatalities       = %(other)s
-            WHERE crash_id = %(crash_id)s
+            SELECT crash_year, person_type, COUNT(*)
+            FROM fars_persons
+            WHERE crash_year = ANY(%(years)s)
+              AND injury_severity = %(fatal_severity)s
+              AND NOT (person_type = ANY(%(known_codes)s))
+            GROUP BY crash_year, person_type
+            ORDER BY crash_year, person_type
             """,
-            {**counts, "crash_id": crash_id},
+            {"years": years, "fatal_severity": FATAL_SEVERITY, "known_codes": known_codes},
+        )
+        rows = cur.fetchall()
+
+    for crash_year, person_type_code, count in rows:
+        logger.warning(
+            "Unrecognized person_type code %s in %s (%s fatal persons) — excluded from subtype counts",
+            person_type_code,
+            crash_year,
+            count,
         )
+    return sum(count for _, _, count in rows)
 
 
 def derive_crash_subtypes(conn: Connection, years: list[int] | None = None) -> tuple[int, int]:
     """
-    For the specified year(s) (orr every crash in fars_crashes if years is omitted),
-    compute subtype fatality counts from fars_persons and write them back. 
-    Processes in batches of BATCH_SIZE.
+    For the specified year(s) (or every year in fars_crashes if years is omitted),
+    compute subtype fatality counts from fars_persons and write them back.
+    Runs one aggregated UPDATE per year and commits after each year.
 
     Returns:
         (updated_count, error_count)
     """
-    if years is not None:
-        with conn.cursor() as cur:
-            cur.execute(
-                "SELECT crash_id FROM fars_crashes WHERE year = ANY(%s) ORDER BY crash_id",
-                (years,)
-            )
-            crash_ids = [row[0] for row in cur.fetchall()]
-    else:
+    if years is None:
         with conn.cursor() as cur:
-            cur.execute("SELECT crash_id FROM fars_crashes ORDER BY crash_id")
-            crash_ids = [row[0] for row in cur.fetchall()]
+            cur.execute("SELECT DISTINCT year FROM fars_crashes ORDER BY year")
+            years = [row[0] for row in cur.fetchall()]
 
-    total = len(crash_ids)
     updated_count = 0
     error_count = 0
 
-    logger.info("[FARS] Deriving subtype counts for %s crashes", total)
+    logger.info("[FARS] Deriving subtype counts for %s years", len(years))
 
-    for idx, crash_id in enumerate(crash_ids, start=1):
+    for year in years:
         try:
-            counts = count_fatalities_by_type(conn, crash_id)
-            update_crash_subtypes(conn, crash_id, counts)
-            updated_count += 1
+            year_updated = derive_year_subtypes(conn, year)
+            conn.commit()
+            updated_count += year_updated
+            logger.info("[FARS] %s subtypes derived | updated=%s", year, year_updated)
         except Exception:
             conn.rollback()
             error_count += 1
-            logger.exception(
-                "[FARS] Failed to derive subtypes for crash_id=%s", crash_id
-            )
-
-        if idx % BATCH_SIZE == 0:
-            conn.commit()
-            logger.info(
-                "[FARS] %s / %s processed | updated=%s errors=%s",
-                idx, total, updated_count, error_count,
-            )
+            logger.exception("[FARS] Failed to derive subtypes for year=%s", year)
 
-    conn.commit()
+    report_unrecognized_person_types(conn, years)
     return updated_count, error_count
 
 
@@ -143,7 +140,7 @@ def run_derive_fars_subtypes(years: list[int] | None = None) -> None:
     start = time.time()
     logger.info("[FARS] Starting subtype derivation (years=%s)", years or "all")
 
-    with get_conn() as conn:
+    with get_conn("transform") as conn:
         updated, errors = derive_crash_subtypes(conn, years)
 
     elapsed = time.time() - start
@@ -0,0 +1,113 @@
+import time
+from psycopg import Connection
+
+from pipeline.connection import get_conn
+from pipeline.logger import get_logger
+
+logger = get_logger(__name__)
+
+# zoom band -> (ST_SimplifyPreserveTopology tolerance in degrees, decimal
+# digits kept). Coordinates are snapped to a grid one digit finer than the
+# tolerance, so quantization never adds visible error on top of simplification.
+SIMPLIFICATION_BANDS: dict[str, tuple[float, int]] = {
+    "z0-8": (0.001, 4),
+    "z9-11": (0.0001, 5),
+    "z12+": (0.00001, 6),
+}
+
+# Band written to boundary.geojson; its tolerance matches the previous
+# on-the-fly simplification.
+DEFAULT_BAND = "z9-11"
+
+
+def zoom_band(zoom: int) -> str:
+    """SIMPLIFICATION_BANDS key for a web map zoom level."""
+    if zoom <= 8:
+        return "z0-8"
+    if zoom <= 11:
+        return "z9-11"
+    return "z12+"
+
+
+def refresh_simplified_places(
+        conn: Connection,
+        places: list[tuple[str, str]] | None = None,
+) -> int:
+    """
+    Rebuild census_places_simplified from census_places.geom for every band
+    in SIMPLIFICATION_BANDS.
+
+    Parameters:
+        places: (state_fips, place_fips) pairs whose boundary changed. None
+                rebuilds every place.
+
+    Returns:
+        Number of simplified geometries written.
+    """
+    start = time.time()
+
+    params: dict = {
+        "bands": list(SIMPLIFICATION_BANDS),
+        "tolerances": [tolerance for tolerance, _ in SIMPLIFICATION_BANDS.values()],
+        "digits": [digits for _, digits in SIMPLIFICATION_BANDS.values()],
+    }
+    if places is None:
+        delete_query = "TRUNCATE census_places_simplified"
+        place_filter = ""
+    else:
+        delete_query = """
+            DELETE FROM census_places_simplified
+            WHERE (state_fips, place_fips) IN (
+                SELECT * FROM unnest(%(state_fips)s::char(2)[], %(place_fips)s::char(5)[])
+            )
+        """
+        place_filter = """
+            AND (places.state_fips, places.place_fips) IN (
+                SELECT * FROM unnest(%(state_fips)s::char(2)[], %(place_fips)s::char(5)[])
+            )
+        """
+        params["state_fips"] = [state for state, _ in places]
+        params["place_fips"] = [place for _, place in places]
+
+    # ST_ReducePrecision snaps to the grid without producing invalid rings;
+    # slivers that collapse entirely are dropped.
+    insert_query = f"""
+        INSERT INTO census_places_simplified (state_fips, place_fips, zoom_band, decimal_digits, geom)
+        SELECT state_fips, place_fips, zoom_band, decimal_digits, geom
+        FROM (
+            SELECT
+                places.state_fips,
+                places.place_fips,
+                bands.zoom_band,
+                bands.decimal_digits,
+                ST_Multi(ST_CollectionExtract(ST_ReducePrecision(
+                    ST_SimplifyPreserveTopology(places.geom, bands.tolerance),
+                    power(10, -bands.decimal_digits)
+                ), 3)) AS geom
+            FROM census_places places
+            CROSS JOIN unnest(
+                %(bands)s::varchar[], %(tolerances)s::float8[], %(digits)s::smallint[]
+            ) AS bands (zoom_band, tolerance, decimal_digits)
+            WHERE places.geom IS NOT NULL
+            {place_filter}
+        ) simplified
+        WHERE NOT ST_IsEmpty(geom)
+    """
+
+    with conn.cursor() as cur:
+        cur.execute(delete_query, params if places is not None else None)
+        cur.execute(insert_query, params)
+        inserted = cur.rowcount
+    conn.commit()
+
+    elapsed = time.time() - start
+    logger.info(
+        "[TIGER] Simplified boundaries refreshed for %s places: %s geometries, duration=%.2fs",
+        "all" if places is None else len(places), inserted, elapsed,
+    )
+    return inserted
+
+
+if __name__ == "__main__":
+    with get_conn("transform") as conn:
+        refresh_simplified_places(conn)
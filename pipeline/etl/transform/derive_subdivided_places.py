@@ -0,0 +1,75 @@
+import time
+from psycopg import Connection
+
+from pipeline.connection import get_conn
+from pipeline.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Vertex cap per piece passed to ST_Subdivide (PostGIS default is 256).
+SUBDIVIDE_MAX_VERTICES = 256
+
+
+def refresh_subdivided_places(
+        conn: Connection,
+        places: list[tuple[str, str]] | None = None,
+) -> int:
+    """
+    Rebuild census_places_subdivided from census_places.geom.
+
+    Parameters:
+        places: (state_fips, place_fips) pairs whose boundary changed. None
+                rebuilds every place.
+
+    Returns:
+        Number of subdivided polygons written.
+    """
+    start = time.time()
+
+    params: dict = {"max_vertices": SUBDIVIDE_MAX_VERTICES}
+    if places is None:
+        delete_query = "TRUNCATE census_places_subdivided"
+        place_filter = ""
+    else:
+        delete_query = """
+            DELETE FROM census_places_subdivided
+            WHERE (state_fips, place_fips) IN (
+                SELECT * FROM unnest(%(state_fips)s::char(2)[], %(place_fips)s::char(5)[])
+            )
+        """
+        place_filter = """
+            AND (state_fips, place_fips) IN (
+                SELECT * FROM unnest(%(state_fips)s::char(2)[], %(place_fips)s::char(5)[])
+            )
+        """
+        params["state_fips"] = [state for state, _ in places]
+        params["place_fips"] = [place for _, place in places]
+
+    insert_query = f"""
+        INSERT INTO census_places_subdivided (state_fips, place_fips, geom)
+        SELECT
+            state_fips,
+            place_fips,
+            ST_Subdivide(geom, %(max_vertices)s)
+        FROM census_places
+        WHERE geom IS NOT NULL
+        {place_filter}
+    """
+
+    with conn.cursor() as cur:
+        cur.execute(delete_query, params if places is not None else None)
+        cur.execute(insert_query, params)
+        inserted = cur.rowcount
+    conn.commit()
+
+    elapsed = time.time() - start
+    logger.info(
+        "[TIGER] Subdivided boundaries refreshed for %s places: %s polygons, duration=%.2fs",
+        "all" if places is None else len(places), inserted, elapsed,
+    )
+    return inserted
+
+
+if __name__ == "__main__":
+    with get_conn("transform") as conn:
+        refresh_subdivided_places(conn)
@@ -0,0 +1,303 @@
+"""
+Columnar counterparts of the scalar parsers in parse_fars_crash.py.
+
+Each function takes a whole ACCIDENT.CSV year (or a chunk of one) as a
+DataFrame of raw string columns and returns results that match the scalar
+functions row for row, with NaN/None wherever the scalar version returns None.
+
+String work runs on fixed-width numpy unicode arrays via ``np.strings``.
+Numeric casts use numpy's string -> int64/float64 conversion, which accepts
+exactly what int() and float() accept; a column only falls back to parsing
+value by value when it contains something unparseable.
+"""
+import numpy as np
+import pandas as pd
+
+from pipeline.etl.transform.mappings import ROUTE_MAP, STATE_FIPS_MAP
+
+GEOM_SENTINELS = ["0", "9999"]
+
+# Columns assemble_fars_crash reads with [] rather than .get(); a missing
+# column fails every row, the same way the scalar version raises KeyError.
+REQUIRED_COLUMNS = ("ST_CASE", "STATE", "COUNTY", "CITY", "YEAR", "MONTH", "DAY")
+
+# Columns parse_fars_date reads with []; missing ones raise KeyError in both versions.
+DATE_COLUMNS = ("YEAR", "MONTH", "DAY")
+
+# Longest digit string parse_digits casts without overflowing int64.
+MAX_DIGITS = 18
+
+DAYS_IN_MONTH = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+
+def raw_column(frame: pd.DataFrame, name: str) -> np.ndarray:
+    """
+    Raw values for a column as a unicode array, with missing columns and
+    missing values as "".
+    """
+    if name not in frame.columns:
+        return np.full(len(frame), "", dtype=str)
+    return frame[name].to_numpy(dtype=str, na_value="")
+
+
+def parse_digits(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse the entries made only of decimal digits, the common case, with one cast.
+
+    Returns:
+        (parsed float64 array, mask of entries that were plain digits).
+    """
+    plain = np.strings.isdecimal(values) & (np.strings.str_len(values) <= MAX_DIGITS)
+    parsed = np.full(values.shape, np.nan)
+    parsed[plain] = values[plain].astype(np.int64)
+    return parsed, plain
+
+
+def parse_numbers(values: np.ndarray, dtype: type) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse a unicode array the way int() (dtype=np.int64) or float()
+    (dtype=np.float64) would.
+
+    Returns:
+        (parsed float64 array, valid mask). Invalid entries are NaN.
+    """
+    # np.strings only works on unicode arrays; object arrays are cast first
+    values = np.asarray(values, dtype=str)
+    parsed = np.full(values.shape, np.nan)
+    valid = np.zeros(values.shape, dtype=bool)
+
+    pending = np.strings.str_len(np.strings.strip(values)) > 0
+    if dtype is np.int64:
+        digits, plain = parse_digits(values)
+        parsed[plain] = digits[plain]
+        valid |= plain
+        pending &= ~plain
+
+    candidates = np.flatnonzero(pending)
+    subset = values[candidates]
+    try:
+        parsed[candidates] = subset.astype(dtype)
+        valid[candidates] = True
+    except (ValueError, OverflowError):
+        # Slow path: only taken when the column contains unparseable values
+        caster = int if dtype is np.int64 else float
+        for idx, value in zip(candidates, subset):
+            try:
+                parsed[idx] = caster(value)
+                valid[idx] = True
+            except (ValueError, OverflowError):
+                pass
+    return parsed, valid
+
+
+def dms_to_decimal_batch(values: np.ndarray) -> np.ndarray:
+    """
+    Vectorized dms_to_decimal for FARS DDMMSSSS integers.
+    """
+    ints = np.abs(values).astype(np.int64)
+
+    degrees = ints // 1_000_000
+    minutes = (ints // 10_000) % 100
+    seconds = (ints % 10_000) / 100
+
+    return degrees + minutes / 60 + seconds / 3600
+
+
+def parse_fars_geom_batch(frame: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized parse_fars_geom.
+
+    Returns:
+        (lon, lat) float arrays, NaN where the scalar version returns (None, None).
+    """
+    raw_lon = raw_column(frame, "LONGITUD")
+    raw_lon = np.where(raw_lon != "", raw_lon, raw_column(frame, "longitud"))
+    raw_lat = raw_column(frame, "LATITUDE")
+    raw_lat = np.where(raw_lat != "", raw_lat, raw_column(frame, "latitude"))
+
+    # -- Missing or blank (checked before stripping, like the scalar version) --
+    missing = (raw_lon == "") | (raw_lat == "")
+
+    raw_lat = np.strings.strip(raw_lat)
+    raw_lon = np.strings.strip(raw_lon)
+
+    # -- Sentinel values --
+    sentinel = np.isin(raw_lat, GEOM_SENTINELS) | np.isin(raw_lon, GEOM_SENTINELS)
+
+    # --- Detect DMS vs decimal ---
+    is_dms = (np.strings.find(raw_lat, ".") < 0) & (np.strings.find(raw_lon, ".") < 0)
+    is_decimal = ~is_dms
+
+    lat = np.full(len(frame), np.nan)
+    lon = np.full(len(frame), np.nan)
+
+    if is_dms.any():
+        dms_lat, lat_ok = parse_numbers(raw_lat[is_dms], np.int64)
+        dms_lon, lon_ok = parse_numbers(raw_lon[is_dms], np.int64)
+        ok = lat_ok & lon_ok
+        lat[is_dms] = np.where(ok, dms_to_decimal_batch(np.where(ok, dms_lat, 0)), np.nan)
+        lon[is_dms] = np.where(ok, dms_to_decimal_batch(np.where(ok, dms_lon, 0)), np.nan)
+
+    if is_decimal.any():
+        dec_lat, lat_ok = parse_numbers(raw_lat[is_decimal], np.float64)
+        dec_lon, lon_ok = parse_numbers(raw_lon[is_decimal], np.float64)
+        ok = lat_ok & lon_ok
+        lat[is_decimal] = np.where(ok, dec_lat, np.nan)
+        lon[is_decimal] = np.where(ok, dec_lon, np.nan)
+
+    # -- Spatial sanity checks (NaN fails every comparison) --
+    in_range = (lat >= -90) & (lat <= 90) & (lon >= -180) & (lon <= 180)
+
+    valid = ~missing & ~sentinel & in_range
+    return np.where(valid, lon, np.nan), np.where(valid, lat, np.nan)
+
+
+def parse_fars_date_batch(frame: pd.DataFrame) -> np.ndarray:
+    """
+    Vectorized parse_fars_date, including two-digit year handling.
+
+    Returns:
+        Object array of datetime.date, None where the date is missing or invalid.
+
+    Raises:
+        KeyError: if YEAR, MONTH or DAY is not a column, like parse_fars_date.
+    """
+    for name in DATE_COLUMNS:
+        if name not in frame.columns:
+            raise KeyError(name)
+
+    year, year_ok = parse_numbers(raw_column(frame, "YEAR"), np.int64)
+    month, month_ok = parse_numbers(raw_column(frame, "MONTH"), np.int64)
+    day, day_ok = parse_numbers(raw_column(frame, "DAY"), np.int64)
+
+    positive = (year > 0) & (month > 0) & (day > 0)
+    year = np.where((year < 100) & (year > 23), year + 1900, year)
+
+    valid_month = (month >= 1) & (month <= 12)
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    days_in_month = DAYS_IN_MONTH[np.where(valid_month, month, 0).astype(np.int64)]
+    days_in_month = days_in_month + (leap & (month == 2))
+
+    valid = (
+        year_ok & month_ok & day_ok
+        & positive
+        & (year <= 9999)
+        & valid_month
+        & (day <= days_in_month)
+    )
+
+    dates = np.full(len(frame), None, dtype=object)
+    if valid.any():
+        y = year[valid].astype(np.int64)
+        m = month[valid].astype(np.int64)
+        d = day[valid].astype(np.int64)
+        # Offsets from the epoch; datetime64[D] converts to datetime.date
+        months = (y - 1970).astype("datetime64[Y]").astype("datetime64[M]") + (m - 1)
+        dates[valid] = (months.astype("datetime64[D]") + (d - 1)).astype(object)
+    return dates
+
+
+def map_route_to_road_label_batch(route_codes: np.ndarray) -> np.ndarray:
+    """
+    Vectorized map_route_to_road_label for already-parsed route codes.
+    """
+    return pd.Series(route_codes).map(ROUTE_MAP).fillna("Unknown").to_numpy(dtype=object)
+
+
+def nan_to_none(values: np.ndarray) -> np.ndarray:
+    out = values.astype(object)
+    out[np.isnan(values)] = None
+    return out
+
+
+def assemble_fars_crash_batch(
+        frame: pd.DataFrame,
+        glc_lookup: dict,
+        file_year: int,
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """
+    Columnar assemble_fars_crash for a chunk of raw ACCIDENT.CSV rows.
+
+    Returns:
+        (records, errors) where records has the same columns as the dicts
+        produced by assemble_fars_crash (None for missing values) and
+        errors is a boolean mask of rows the scalar version would reject
+        with an exception. Error rows are excluded from records.
+    """
+    row_count = len(frame)
+
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in frame.columns]
+    if missing_columns:
+        return pd.DataFrame(index=frame.index[:0]), np.ones(row_count, dtype=bool)
+
+    lon, lat = parse_fars_geom_batch(frame)
+    crash_date = parse_fars_date_batch(frame)
+
+    if "ROUTE" in frame.columns:
+        route_code, route_ok = parse_numbers(raw_column(frame, "ROUTE"), np.int64)
+    else:
+        route_code, route_ok = np.full(row_count, 9.0), np.ones(row_count, dtype=bool)
+
+    if "FATALS" in frame.columns:
+        total_fatalities, fatals_ok = parse_numbers(raw_column(frame, "FATALS"), np.int64)
+    else:
+        total_fatalities, fatals_ok = np.zeros(row_count), np.ones(row_count, dtype=bool)
+
+    keep = route_ok & fatals_ok
+
+    state_code = np.strings.zfill(raw_column(frame, "STATE"), 2)
+    if "STATENAME" in frame.columns:
+        state_name = raw_column(frame, "STATENAME").astype(object)
+    else:
+        state_name = pd.Series(state_code).map(STATE_FIPS_MAP).fillna("ERROR").to_numpy(dtype=object)
+
+    county_code = np.strings.zfill(raw_column(frame, "COUNTY"), 3)
+    if "COUNTYNAME" in frame.columns:
+        county_name = raw_column(frame, "COUNTYNAME").astype(object)
+    else:
+        county_name = np.full(row_count, None, dtype=object)
+
+    fars_city_code = np.strings.zfill(raw_column(frame, "CITY"), 4)
+    if "CITYNAME" in frame.columns:
+        fars_city_name = raw_column(frame, "CITYNAME").astype(object)
+    else:
+        fars_city_name = np.full(row_count, None, dtype=object)
+
+    unincorporated = (
+        (fars_city_code == "0000")
+        | (fars_city_code >= "9000")
+        | (fars_city_name == "Not Applicable")
+    )
+    fars_city_name[unincorporated] = "Unincorporated"
+
+    # Older years have no CITYNAME column; fall back to the GLC code lookup
+    needs_lookup = pd.isna(fars_city_name)
+    if needs_lookup.any():
+        glc_keys = {f"{state}|{city}": name for (state, city), name in glc_lookup.items()}
+        lookup_key = np.strings.add(
+            np.strings.add(state_code[needs_lookup], "|"),
+            fars_city_code[needs_lookup],
+        )
+        fars_city_name[needs_lookup] = pd.Series(lookup_key).map(glc_keys).to_numpy(dtype=object)
+    fars_city_name[pd.isna(fars_city_name)] = "ERROR"
+
+    route_code = route_code[keep].astype(np.int64)
+
+    records = pd.DataFrame({
+        "st_case": raw_column(frame, "ST_CASE")[keep].astype(object),
+        "year": file_year,
+        "crash_date": crash_date[keep],
+        "state": state_code[keep].astype(object),
+        "state_name": state_name[keep],
+        "county": county_code[keep].astype(object),
+        "county_name": county_name[keep],
+        "city": fars_city_code[keep].astype(object),
+        "fars_city_name": fars_city_name[keep],
+        "route_code": route_code,
+        "road_label": map_route_to_road_label_batch(route_code),
+        "total_fatalities": total_fatalities[keep].astype(np.int64),
+        "lat": nan_to_none(lat[keep]),
+        "lon": nan_to_none(lon[keep]),
+    }, index=frame.index[keep])
+
+    return records, ~keep
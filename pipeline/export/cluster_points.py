@@ -0,0 +1,96 @@
+# Grid clustering of crash points for low-zoom map views, in the style of
+# supercluster: each zoom level is built from the one above it, and a cluster
+# carries its weighted centroid, point count and attribute sums. Coordinates
+# are Web Mercator in [0, 1), so a zoom z tile is 1 / 2**z wide.
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# Grid cells per tile side at every zoom. A power of two keeps the grids
+# nested, so each cluster falls in exactly one cell of the zoom below and the
+# hierarchy matches clustering every zoom directly from the points.
+CELLS_PER_TILE = 16
+
+MAX_LAT = 85.05112878
+
+
+@dataclass(frozen=True)
+class Clusters:
+    x: np.ndarray
+    y: np.ndarray
+    count: np.ndarray
+    # (n, k) per-cluster sums, e.g. fatalities by type or crashes by year
+    sums: np.ndarray
+
+
+def to_mercator(lon: np.ndarray, lat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    lat = np.clip(lat, -MAX_LAT, MAX_LAT)
+    x = (lon + 180) / 360
+    y = (1 - np.arcsinh(np.tan(np.radians(lat))) / np.pi) / 2
+    return np.clip(x, 0, np.nextafter(1, 0)), np.clip(y, 0, np.nextafter(1, 0))
+
+
+def from_mercator(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    lon = x * 360 - 180
+    lat = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * y))))
+    return lon, lat
+
+
+def merge_on_grid(clusters: Clusters, zoom: int, cells_per_tile: int = CELLS_PER_TILE) -> Clusters:
+    """Merge every cluster whose centroid falls in the same grid cell at ``zoom``."""
+    cells = (1 << zoom) * cells_per_tile
+    keys = (clusters.x * cells).astype(np.int64) * cells + (clusters.y * cells).astype(np.int64)
+    unique, inverse = np.unique(keys, return_inverse=True)
+    n = len(unique)
+
+    count = np.bincount(inverse, weights=clusters.count, minlength=n)
+    x = np.bincount(inverse, weights=clusters.x * clusters.count, minlength=n) / count
+    y = np.bincount(inverse, weights=clusters.y * clusters.count, minlength=n) / count
+    sums = np.column_stack([
+        np.bincount(inverse, weights=column, minlength=n)
+        for column in clusters.sums.T
+    ]) if clusters.sums.shape[1] else np.zeros((n, 0))
+
+    return Clusters(x=x, y=y, count=count.astype(np.int64), sums=sums.astype(np.int64))
+
+
+def cluster_pyramid(
+        lon: np.ndarray,
+        lat: np.ndarray,
+        sums: np.ndarray,
+        min_zoom: int,
+        max_zoom: int,
+) -> dict[int, Clusters]:
+    """
+    Cluster points for every zoom from max_zoom down to min_zoom.
+
+    Parameters:
+        sums: (n, k) per-point values summed into each cluster.
+
+    Returns:
+        zoom -> Clusters
+    """
+    x, y = to_mercator(np.asarray(lon, dtype=np.float64), np.asarray(lat, dtype=np.float64))
+    # Point-level sums keep the caller's (small) dtype; merged levels are int64
+    level = Clusters(x=x, y=y, count=np.ones(len(x), dtype=np.int64), sums=np.asarray(sums).reshape(len(x), -1))
+
+    pyramid = {}
+    for zoom in range(max_zoom, min_zoom - 1, -1):
+        level = merge_on_grid(level, zoom)
+        pyramid[zoom] = level
+    return pyramid
+
+
+def tile_groups(clusters: Clusters, zoom: int) -> dict[tuple[int, int], np.ndarray]:
+    """(tile x, tile y) -> indexes of the clusters in that tile at ``zoom``."""
+    n = 1 << zoom
+    tx = (clusters.x * n).astype(np.int64)
+    ty = (clusters.y * n).astype(np.int64)
+    keys = tx * n + ty
+    order = np.argsort(keys, kind="stable")
+    unique, starts = np.unique(keys[order], return_index=True)
+    return {
+        (int(key // n), int(key % n)): indexes
+        for key, indexes in zip(unique, np.split(order, starts[1:]))
+    }
@@ -0,0 +1,105 @@
+# Columnar binary encoding of one city-year of crash points. The .bin file
+# holds one little-endian typed array per column, each starting on a 4-byte
+# boundary so the client can view it in place; the JSON layout sidecar gives
+# every column's type, offset and, for labels, its dictionary.
+
+from datetime import date
+from typing import Iterable
+
+import numpy as np
+
+LAYOUT_VERSION = 1
+
+# Offsets are padded to this so Float32Array/Int32Array views are aligned.
+ALIGNMENT = 4
+
+COUNT_COLUMNS = (
+    "total_fatalities",
+    "motorist_fatalities",
+    "pedestrian_fatalities",
+    "cyclist_fatalities",
+    "other_fatalities",
+)
+
+DICTIONARY_COLUMNS = (
+    "state_name",
+    "fars_city_name",
+    "fips_city_name",
+    "road_label",
+)
+
+
+def _smallest_uint(max_value: int):
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if max_value <= np.iinfo(dtype).max:
+            return dtype
+    raise ValueError(f"Value too large for a uint32 column: {max_value}")
+
+
+def _day_of_year(value) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    return value.timetuple().tm_yday
+
+
+def _count_column(values: list) -> tuple[np.ndarray, dict]:
+    # The dtype's max value marks NULL, so it cannot be a real count
+    dtype = _smallest_uint(max((v for v in values if v is not None), default=0) + 1)
+    null = int(np.iinfo(dtype).max)
+    return np.array([null if v is None else v for v in values], dtype=dtype), {"null": null}
+
+
+def _dictionary_column(values: list) -> tuple[np.ndarray, dict]:
+    dictionary = list(dict.fromkeys(values))
+    index = {value: i for i, value in enumerate(dictionary)}
+    dtype = _smallest_uint(max(len(dictionary) - 1, 0))
+    return np.array([index[v] for v in values], dtype=dtype), {"dictionary": dictionary}
+
+
+def encode_crash_columns(year: int, records: Iterable[dict]) -> tuple[bytes, dict]:
+    """
+    Encode crash records (as written to {year}.json) into column buffers.
+
+    position is interleaved float32 (lon, lat) pairs, ready for a deck.gl
+    binary getPosition attribute. crash_date is the day of the year, 0 when
+    unknown. Counts use the smallest unsigned type that fits, with the type's
+    max value as NULL. Labels are indexes into a dictionary that may contain
+    null.
+
+    Returns:
+        (binary data, layout)
+    """
+    records = list(records)
+    columns = [
+        (
+            "position",
+            np.array([(r["lon"], r["lat"]) for r in records], dtype=np.float32).reshape(-1, 2),
+            {"size": 2},
+        ),
+        ("st_case", np.array([r["st_case"] for r in records], dtype=np.int32), {}),
+        (
+            "crash_date",
+            np.array([_day_of_year(r["crash_date"]) for r in records], dtype=np.uint16),
+            {"encoding": "day_of_year", "null": 0},
+        ),
+    ]
+    columns += [(name, *_count_column([r[name] for r in records])) for name in COUNT_COLUMNS]
+    columns += [(name, *_dictionary_column([r[name] for r in records])) for name in DICTIONARY_COLUMNS]
+
+    buffer = bytearray()
+    layout_columns = {}
+    for name, array, extra in columns:
+        buffer += bytes(-len(buffer) % ALIGNMENT)
+        layout_columns[name] = {"type": array.dtype.name, "offset": len(buffer), **extra}
+        buffer += array.astype(array.dtype.newbyteorder("<"), copy=False).tobytes()
+
+    layout = {
+        "version": LAYOUT_VERSION,
+        "year": year,
+        "count": len(records),
+        "byteLength": len(buffer),
+        "columns": layout_columns,
+    }
+    return bytes(buffer), layout
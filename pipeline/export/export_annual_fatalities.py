@@ -1,12 +1,18 @@
 import json
-from pathlib import Path
+from itertools import groupby
+from operator import itemgetter
 
 from pipeline.connection import get_conn
+from pipeline.export.export_writer import ExportWriter
 from pipeline.logger import get_logger
 
 logger = get_logger(__name__)
 
-def export_annual_fatalities(out_dir: Path, min_population: int = 100000):
+def export_annual_fatalities(writer: ExportWriter, min_population: int = 100000):
+    """
+    Write cities/{state}/{place}/annual_fatalities.json for every dashboard
+    city from a single query over city_year_fatalities.
+    """
     query_cities = """
         SELECT places.state_fips, places.place_fips
         FROM census_places places
@@ -16,44 +22,42 @@ def export_annual_fatalities(out_dir: Path, min_population: int = 100000):
         WHERE stats.population >= %(min_population)s
            OR places.is_vision_zero = TRUE
     """
-    query_by_year = """
+    query_by_year = f"""
+        WITH cities AS ({query_cities})
         SELECT
-            year,
-            SUM(total_fatalities)        AS total_fatalities,
-            SUM(motorist_fatalities)     AS motorist_fatalities,
-            SUM(pedestrian_fatalities)   AS pedestrian_fatalities,
-            SUM(cyclist_fatalities)      AS cyclist_fatalities,
-            SUM(other_fatalities)        AS other_fatalities
-        FROM fars_crashes
-        WHERE state = %(state_fips)s
-          AND place_fips = %(place_fips)s
-        GROUP BY year
-        ORDER BY year
+            cities.state_fips,
+            cities.place_fips,
+            cyf.year,
+            cyf.total_fatalities,
+            cyf.motorist_fatalities,
+            cyf.pedestrian_fatalities,
+            cyf.cyclist_fatalities,
+            cyf.other_fatalities
+        FROM cities
+        LEFT JOIN city_year_fatalities cyf
+            ON cyf.state = cities.state_fips
+            AND cyf.place_fips = cities.place_fips
+        ORDER BY cities.state_fips, cities.place_fips, cyf.year
     """
     try:
-        with get_conn() as conn:
+        with get_conn("export") as conn:
             with conn.cursor() as cur:
-                cur.execute(query_cities, {"min_population": min_population})
-                cities = cur.fetchall()
-
-            total = len(cities)
-            for i, (state_fips, place_fips) in enumerate(cities, 1):
-                with conn.cursor() as cur:
-                    cur.execute(query_by_year, {"state_fips": state_fips, "place_fips": place_fips})
-                    assert cur.description is not None
-                    columns = [desc[0] for desc in cur.description]
-                    rows = cur.fetchall()
+                cur.execute(query_by_year, {"min_population": min_population})
+                assert cur.description is not None
+                columns = [desc[0] for desc in cur.description][2:]
+                rows = cur.fetchall()
 
-                data = [dict(zip(columns, row)) for row in rows]
+        cities = groupby(rows, key=itemgetter(0, 1))
+        total = len({row[:2] for row in rows})
+        for i, ((state_fips, place_fips), city_rows) in enumerate(cities, 1):
+            # A city with no fatalities comes back as one row of NULLs
+            data = [dict(zip(columns, row[2:])) for row in city_rows if row[2] is not None]
 
-                city_dir = out_dir / "cities" / state_fips / place_fips
-                city_dir.mkdir(parents=True, exist_ok=True)
-                out_path = city_dir / "annual_fatalities.json"
-                out_path.write_text(json.dumps(data))
+            writer.write_text(f"cities/{state_fips}/{place_fips}/annual_fatalities.json", json.dumps(data))
 
-                if i % 50 == 0 or i == total:
-                    logger.info("[EXPORT] Annual fatality export progress: %d/%d cities", i, total)
+            if i % 50 == 0 or i == total:
+                logger.info("[EXPORT] Annual fatality export progress: %d/%d cities", i, total)
 
     except Exception as e:
         logger.error("[EXPORT] export_annual_fatalities failed: %s", e)
-        raise
\ No newline at end of file
+        raise
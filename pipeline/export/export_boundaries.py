@@ -1,65 +1,79 @@
 import json
-from pathlib import Path
+from itertools import groupby
+from operator import itemgetter
 
 from pipeline.connection import get_conn
+from pipeline.etl.transform.derive_simplified_places import DEFAULT_BAND
+from pipeline.export.export_writer import ExportWriter
+from pipeline.export.topojson import encode_topology
 from pipeline.logger import get_logger
 
 logger = get_logger(__name__)
 
-def export_boundaries(out_dir: Path, min_population: int = 100000):
-    query_cities = """
-        SELECT places.state_fips, places.place_fips
+def export_boundaries(writer: ExportWriter, min_population: int = 100000, topojson: bool = True):
+    """
+    Write cities/{state}/{place}/boundary.geojson from the DEFAULT_BAND
+    geometry in census_places_simplified. With topojson=True every zoom band
+    is also written to boundary.topojson as one quantized object per band.
+    """
+    query_boundaries = """
+        SELECT
+            places.state_fips,
+            places.place_fips,
+            places.place_name,
+            simplified.zoom_band,
+            ST_AsGeoJSON(simplified.geom, simplified.decimal_digits) AS geom
         FROM census_places places
         JOIN city_stats stats
             ON places.state_fips = stats.state_fips
             AND places.place_fips = stats.place_fips
+        LEFT JOIN census_places_simplified simplified
+            ON simplified.state_fips = places.state_fips
+            AND simplified.place_fips = places.place_fips
         WHERE stats.population >= %(min_population)s
            OR places.is_vision_zero = TRUE
-    """
-    query_boundary = """
-        SELECT
-            place_name,
-            state_fips,
-            place_fips,
-            ST_AsGeoJSON(ST_SimplifyPreserveTopology(geom, 0.0001)) AS geom
-        FROM census_places
-        WHERE state_fips = %(state_fips)s
-          AND place_fips = %(place_fips)s
+        ORDER BY places.state_fips, places.place_fips, simplified.zoom_band
     """
     try:
-        with get_conn() as conn:
+        with get_conn("export") as conn:
             with conn.cursor() as cur:
-                cur.execute(query_cities, {"min_population": min_population})
-                cities = cur.fetchall()
+                cur.execute(query_boundaries, {"min_population": min_population})
+                rows = cur.fetchall()
+
+        write_count = 0
+        for (state_fips, place_fips), city_rows in groupby(rows, key=itemgetter(0, 1)):
+            city_rows = list(city_rows)
+            place_name = city_rows[0][2]
+            bands = {
+                zoom_band: json.loads(geom_json)
+                for _, _, _, zoom_band, geom_json in city_rows
+                if zoom_band is not None
+            }
+            if DEFAULT_BAND not in bands:
+                logger.warning("No boundary found for %s/%s", state_fips, place_fips)
+                continue
 
-            write_count = 0
-            for i, (state_fips, place_fips) in enumerate(cities, 1):
-                with conn.cursor() as cur:
-                    cur.execute(query_boundary, {"state_fips": state_fips, "place_fips": place_fips})
-                    row = cur.fetchone()
-                    if not row:
-                        logger.warning("No boundary found for %s/%s", state_fips, place_fips)
-                        continue
+            properties = {
+                "place_name": place_name,
+                "state_fips": state_fips,
+                "place_fips": place_fips,
+            }
+            feature = {
+                "type": "Feature",
+                "properties": properties,
+                "geometry": bands[DEFAULT_BAND],
+            }
 
-                    place_name, state_fips, place_fips, geom_json = row
-                    feature = {
-                        "type": "Feature",
-                        "properties": {
-                            "place_name": place_name,
-                            "state_fips": state_fips,
-                            "place_fips": place_fips,
-                        },
-                        "geometry": json.loads(geom_json),
-                    }
+            city_dir = f"cities/{state_fips}/{place_fips}"
+            writer.write_text(f"{city_dir}/boundary.geojson", json.dumps(feature))
 
-                city_dir = out_dir / "cities" / state_fips / place_fips
-                city_dir.mkdir(parents=True, exist_ok=True)
-                out_path = city_dir / "boundary.geojson"
-                out_path.write_text(json.dumps(feature))
-                write_count += 1
+            if topojson:
+                topology = encode_topology(bands, properties)
+                writer.write_text(f"{city_dir}/boundary.topojson", json.dumps(topology, separators=(",", ":")))
+            write_count += 1
 
-            logger.info("[EXPORT] Boundaries exported for %d cities", write_count)
+        logger.info("[EXPORT] Boundaries exported for %d cities", write_count)
 
     except Exception as e:
         logger.error("[EXPORT] export_boundaries failed: %s", e)
-        raise
\ No newline at end of file
+        raise
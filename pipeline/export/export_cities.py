@@ -1,8 +1,8 @@
 import json
-from pathlib import Path
 from decimal import Decimal
 
 from pipeline.connection import get_conn
+from pipeline.export.export_writer import ExportWriter
 from pipeline.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,7 +15,7 @@ def _serialize(val):
         return val.isoformat()
     return val
 
-def export_cities(out_dir: Path, min_population: int = 100000):
+def export_cities(writer: ExportWriter, min_population: int = 100000):
     query = """
         SELECT
             places.place_name,
@@ -80,7 +80,7 @@ def export_cities(out_dir: Path, min_population: int = 100000):
         ORDER BY stats.population DESC
     """
     try:
-        with get_conn() as conn:
+        with get_conn("export") as conn:
             with conn.cursor() as cur:
                 cur.execute(query, {"min_population": min_population})
                 assert cur.description is not None
@@ -92,9 +92,7 @@ def export_cities(out_dir: Path, min_population: int = 100000):
             for row in rows
         ]
 
-        out_dir.mkdir(parents=True, exist_ok=True)
-        out_path = out_dir / "cities.json"
-        out_path.write_text(json.dumps(cities))
+        writer.write_text("cities.json", json.dumps(cities))
         logger.info("[EXPORT] Exported stats and metrics for %d cities", len(cities))
 
     except Exception as e:
@@ -0,0 +1,112 @@
+import json
+
+import numpy as np
+
+from pipeline.connection import get_conn
+from pipeline.export.cluster_points import cluster_pyramid, from_mercator, tile_groups
+from pipeline.export.export_vector_tiles import CRASH_MIN_ZOOM
+from pipeline.export.export_writer import ExportWriter
+from pipeline.logger import get_logger
+
+logger = get_logger(__name__)
+
+MIN_ZOOM = 0
+# Clusters cover the zooms below the vector tiles' crash layer.
+MAX_ZOOM = CRASH_MIN_ZOOM - 1
+
+# Rows fetched per round trip from the server-side cursor.
+CURSOR_ITERSIZE = 50000
+
+FATALITY_COLUMNS = (
+    "total_fatalities",
+    "pedestrian_fatalities",
+    "cyclist_fatalities",
+    "motorist_fatalities",
+    "other_fatalities",
+)
+
+
+def load_crash_points(conn) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Every located crash since 2001 as arrays.
+
+    Returns:
+        (lon, lat, year, fatalities) with fatalities shaped (n, len(FATALITY_COLUMNS))
+    """
+    fatality_sql = ", ".join(f"COALESCE({column}, 0)" for column in FATALITY_COLUMNS)
+    chunks = []
+    with conn.cursor(name="export_crash_clusters") as cur:
+        cur.itersize = CURSOR_ITERSIZE
+        cur.execute(
+            f"""
+            SELECT ST_X(location), ST_Y(location), year, {fatality_sql}
+            FROM fars_crashes
+            WHERE year >= 2001
+              AND location IS NOT NULL
+            """
+        )
+        while rows := cur.fetchmany(CURSOR_ITERSIZE):
+            chunks.append(np.array(rows, dtype=np.float64))
+
+    if not chunks:
+        empty = np.empty(0)
+        return empty, empty, empty.astype(np.int64), np.empty((0, len(FATALITY_COLUMNS)), dtype=np.int16)
+    data = np.concatenate(chunks)
+    return data[:, 0], data[:, 1], data[:, 2].astype(np.int64), data[:, 3:].astype(np.int16)
+
+
+def export_crash_clusters(writer: ExportWriter, min_zoom: int = MIN_ZOOM, max_zoom: int = MAX_ZOOM):
+    """
+    Write clusters/{z}/{x}/{y}.json for every zoom from min_zoom to max_zoom,
+    plus clusters/index.json listing the years and the tiles that exist.
+
+    Every located crash nationwide is clustered on a grid per zoom (see
+    cluster_points). Each cluster has its centroid, crash count, fatality
+    sums by type and a crash count per year, aligned with index.json's
+    "years".
+    """
+    try:
+        with get_conn("export") as conn:
+            lon, lat, year, fatalities = load_crash_points(conn)
+
+        if not len(lon):
+            logger.warning("[EXPORT] No located crashes to cluster")
+            return
+
+        years = np.arange(year.min(), year.max() + 1)
+        year_counts = np.zeros((len(year), len(years)), dtype=np.int16)
+        year_counts[np.arange(len(year)), year - years[0]] = 1
+
+        k = len(FATALITY_COLUMNS)
+        pyramid = cluster_pyramid(lon, lat, np.hstack([fatalities, year_counts]), min_zoom, max_zoom)
+
+        index_tiles = {}
+        for zoom, clusters in sorted(pyramid.items()):
+            cluster_lon, cluster_lat = from_mercator(clusters.x, clusters.y)
+            tiles = tile_groups(clusters, zoom)
+            for (x, y), indexes in sorted(tiles.items()):
+                records = [
+                    {
+                        "lon": round(float(cluster_lon[i]), 5),
+                        "lat": round(float(cluster_lat[i]), 5),
+                        "count": int(clusters.count[i]),
+                        **{column: int(value) for column, value in zip(FATALITY_COLUMNS, clusters.sums[i, :k])},
+                        "years": clusters.sums[i, k:].tolist(),
+                    }
+                    for i in indexes
+                ]
+                writer.write_text(f"clusters/{zoom}/{x}/{y}.json", json.dumps(records))
+            index_tiles[zoom] = sorted(tiles)
+            logger.info("[EXPORT] Clusters z%d: %d clusters in %d tiles", zoom, len(clusters.count), len(tiles))
+
+        index = {
+            "min_zoom": min_zoom,
+            "max_zoom": max_zoom,
+            "years": years.tolist(),
+            "tiles": {str(zoom): [list(tile) for tile in tiles] for zoom, tiles in index_tiles.items()},
+        }
+        writer.write_text("clusters/index.json", json.dumps(index))
+
+    except Exception as e:
+        logger.error("[EXPORT] export_crash_clusters failed: %s", e)
+        raise
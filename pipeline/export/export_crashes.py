@@ -1,19 +1,77 @@
 import json
-from collections import defaultdict
-from pathlib import Path
+from contextlib import ExitStack
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterable, Iterator
 
 from pipeline.connection import get_conn
+from pipeline.export.crash_columns import encode_crash_columns
+from pipeline.export.export_writer import ExportWriter
 from pipeline.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Rows fetched per round trip from the server-side cursor.
+CURSOR_ITERSIZE = 5000
+
+# Years in each city's recent.json bundle, matching the map's initial load.
+RECENT_YEARS = 5
+
 def _serialize(val):
     """Handle date serialization for JSON."""
     if hasattr(val, "isoformat"):
         return val.isoformat()
     return val
 
-def export_crashes(out_dir: Path, min_population: int = 100000):
+def write_json_array(writer: ExportWriter, rel_path: str, records: Iterable[dict]) -> None:
+    """
+    Write records to ``rel_path`` as a JSON array one element at a time. The
+    output is byte-identical to ``json.dumps(list(records))``.
+    """
+    with writer.open_text(rel_path) as file:
+        _write_array([file], records)
+
+def _write_array(files: list, records: Iterable[dict]) -> None:
+    """Stream one JSON array into several open files, encoding each record once."""
+    for file in files:
+        file.write("[")
+    for i, record in enumerate(records):
+        text = json.dumps(record)
+        for file in files:
+            if i:
+                file.write(", ")
+            file.write(text)
+    for file in files:
+        file.write("]")
+
+def write_crash_columns(writer: ExportWriter, city_dir: str, year: int, records: list[dict]) -> None:
+    data, layout = encode_crash_columns(year, records)
+    writer.write_bytes(f"{city_dir}/{year}.bin", data)
+    writer.write_text(f"{city_dir}/{year}.bin.json", json.dumps(layout))
+
+def export_crashes(
+        writer: ExportWriter,
+        min_population: int = 100000,
+        binary: bool = False,
+        full_history: bool = False,
+):
+    """
+    Write crashes/{state}/{place}/{year}.json for every dashboard city.
+
+    One query ordered by (state, place_fips, year, st_case) is read through a
+    named server-side cursor, and rows are streamed into each year's file as
+    the city and year boundaries go by, so memory use does not grow with the
+    number of cities or crashes. Years without crashes get an empty array.
+
+    With binary=True each year is also written as {year}.bin columns plus a
+    {year}.bin.json layout (see crash_columns); only one city-year of
+    records is held in memory to encode it.
+
+    The same pass writes crashes/{state}/{place}/recent.json, the last
+    RECENT_YEARS years in one file, and with full_history=True all.json with
+    every year since 2001. Bundles are {"years": [...], "crashes": {year:
+    [...]}}, each year's array identical to its {year}.json.
+    """
     query_cities = """
         SELECT places.state_fips, places.place_fips
         FROM census_places places
@@ -23,31 +81,35 @@ def export_crashes(out_dir: Path, min_population: int = 100000):
         WHERE stats.population >= %(min_population)s
            OR places.is_vision_zero = TRUE
     """
-    query_crashes = """
+    query_crashes = f"""
+        WITH cities AS ({query_cities})
         SELECT
-            ST_X(location) AS lon,
-            ST_Y(location) AS lat,
-            st_case,
-            year,
-            crash_date,
-            state_name,
-            fars_city_name,
-            fips_city_name,
-            road_label,
-            total_fatalities,
-            motorist_fatalities,
-            pedestrian_fatalities,
-            cyclist_fatalities,
-            other_fatalities
-        FROM fars_crashes
-        WHERE year >= 2001
-          AND location IS NOT NULL
-          AND state = %(state_fips)s
-          AND place_fips = %(place_fips)s
-        ORDER BY year
+            fc.state,
+            fc.place_fips,
+            ST_X(fc.location) AS lon,
+            ST_Y(fc.location) AS lat,
+            fc.st_case,
+            fc.year,
+            fc.crash_date,
+            fc.state_name,
+            fc.fars_city_name,
+            fc.fips_city_name,
+            fc.road_label,
+            fc.total_fatalities,
+            fc.motorist_fatalities,
+            fc.pedestrian_fatalities,
+            fc.cyclist_fatalities,
+            fc.other_fatalities
+        FROM cities
+        JOIN fars_crashes fc
+            ON fc.state = cities.state_fips
+            AND fc.place_fips = cities.place_fips
+        WHERE fc.year >= 2001
+          AND fc.location IS NOT NULL
+        ORDER BY fc.state, fc.place_fips, fc.year, fc.st_case
     """
     try:
-        with get_conn() as conn:
+        with get_conn("export") as conn:
             with conn.cursor() as cur:
                 cur.execute("SELECT MAX(year) FROM fars_crashes")
                 max_year_result = cur.fetchone()
@@ -57,37 +119,74 @@ def export_crashes(out_dir: Path, min_population: int = 100000):
                 cur.execute(query_cities, {"min_population": min_population})
                 cities = cur.fetchall()
 
-
+            all_years = range(2001, max_year + 1)
+            bundle_years = {"recent": range(max(2001, max_year - RECENT_YEARS + 1), max_year + 1)}
+            if full_history:
+                bundle_years["all"] = all_years
             total = len(cities)
-            for i, (state_fips, place_fips) in enumerate(cities, 1):
-                with conn.cursor() as cur:
-                    cur.execute(query_crashes, {"state_fips": state_fips, "place_fips": place_fips})
-                    assert cur.description is not None
-                    columns = [desc[0] for desc in cur.description]
-                    rows = cur.fetchall()
-
-                # Partition by year in Python — one DB round trip per city
-                by_year = defaultdict(list)
-                for row in rows:
-                    record = {col: _serialize(val) for col, val in zip(columns, row)}
-                    by_year[record["year"]].append(record)
-
-                city_dir = out_dir / "crashes" / state_fips / place_fips
-                city_dir.mkdir(parents=True, exist_ok=True)
-
-                all_years = range(2001, max_year + 1)
-                for year in all_years:
-                    out_path = city_dir / f"{year}.json"
-                    if not out_path.exists():
-                        out_path.write_text("[]")
-
-                for year, points in by_year.items():
-                    out_path = city_dir / f"{year}.json"
-                    out_path.write_text(json.dumps(points))
-
-                if i % 50 == 0 or i == total:
-                    logger.info("[EXPORT] Crash export progress: %d/%d cities", i, total)
+            exported = 0
+
+            def export_city(city_dir: str, records: Iterator[dict]) -> None:
+                """Write every year of one city, and its bundles, from its ordered records."""
+                nonlocal exported
+                groups = groupby(records, key=itemgetter("year"))
+                group = next(groups, None)
+
+                with ExitStack() as stack:
+                    bundles = []
+                    for name, years in bundle_years.items():
+                        file = stack.enter_context(writer.open_text(f"{city_dir}/{name}.json"))
+                        file.write(f'{{"years": {json.dumps(list(years))}, "crashes": {{')
+                        bundles.append((file, years))
+
+                    for year in all_years:
+                        has_crashes = group is not None and group[0] == year
+                        points: Iterable[dict] = group[1] if has_crashes else ()
+                        if binary:
+                            points = list(points)
+                            write_crash_columns(writer, city_dir, year, points)
+
+                        sinks = []
+                        for file, years in bundles:
+                            if year in years:
+                                file.write(f'{", " if year != years[0] else ""}"{year}": ')
+                                sinks.append(file)
+                        with writer.open_text(f"{city_dir}/{year}.json") as file:
+                            _write_array([file, *sinks], points)
+
+                        # Advancing groupby invalidates the current group, so
+                        # only move on once its points have been written
+                        if has_crashes:
+                            group = next(groups, None)
+
+                    for file, _ in bundles:
+                        file.write("}}")
+
+                exported += 1
+                if exported % 50 == 0 or exported == total:
+                    logger.info("[EXPORT] Crash export progress: %d/%d cities", exported, total)
+
+            seen = set()
+            with conn.cursor(name="export_crashes") as cur:
+                cur.itersize = CURSOR_ITERSIZE
+                cur.execute(query_crashes, {"min_population": min_population})
+                assert cur.description is not None
+                columns = [desc[0] for desc in cur.description][2:]
+
+                for (state_fips, place_fips), city_rows in groupby(cur, key=itemgetter(0, 1)):
+                    records = (
+                        {col: _serialize(val) for col, val in zip(columns, row[2:])}
+                        for row in city_rows
+                    )
+                    export_city(f"crashes/{state_fips}/{place_fips}", records)
+                    seen.add((state_fips, place_fips))
+
+            # Cities with no located crashes since 2001 still get empty years
+            for state_fips, place_fips in cities:
+                if (state_fips, place_fips) in seen:
+                    continue
+                export_city(f"crashes/{state_fips}/{place_fips}", iter(()))
 
     except Exception as e:
         logger.error("[EXPORT] export_crashes failed: %s", e)
-        raise
\ No newline at end of file
+        raise
@@ -1,19 +1,19 @@
 import json
-from pathlib import Path
 
 from pipeline.connection import get_conn
+from pipeline.export.export_writer import ExportWriter
 from pipeline.logger import get_logger
 
 logger = get_logger(__name__)
 
-def export_crashes_metadata(out_dir: Path):
+def export_crashes_metadata(writer: ExportWriter):
     query_years = """
         SELECT MIN(year) AS min_year, MAX(year) AS max_year
         FROM fars_crashes
     """
 
     try:
-        with get_conn() as conn:
+        with get_conn("export") as conn:
             with conn.cursor() as cur:
                 cur.execute(query_years)
                 row = cur.fetchone()
@@ -25,10 +25,8 @@ def export_crashes_metadata(out_dir: Path):
             "max_year": max_year,
         }
 
-        out_dir.mkdir(parents=True, exist_ok=True)
-        out_path = out_dir / "crashes_metadata.json"
-        out_path.write_text(json.dumps(meta))
-        logger.info("[EXPORT] Exported crashes metadata to %s", out_path)
+        writer.write_text("crashes_metadata.json", json.dumps(meta))
+        logger.info("[EXPORT] Exported crashes metadata")
 
     except Exception as e:
         logger.error("[EXPORT] export_crashes_metadata failed: %s", e)
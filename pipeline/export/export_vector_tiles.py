@@ -0,0 +1,267 @@
+import gzip
+import math
+
+from psycopg import Connection
+
+from pipeline.connection import get_conn
+from pipeline.etl.transform.derive_simplified_places import zoom_band
+from pipeline.export.export_writer import ExportWriter
+from pipeline.logger import get_logger
+
+logger = get_logger(__name__)
+
+ARCHIVE_PATH = "tiles/vision_zero.pmtiles"
+
+MIN_ZOOM = 4
+MAX_ZOOM = 12
+
+# Crash points are only tiled from this zoom up; below it a tile would hold
+# a whole region's crashes, which the clustered exports cover instead.
+CRASH_MIN_ZOOM = 8
+
+TILE_EXTENT = 4096
+
+# Web Mercator's latitude limit.
+MAX_LAT = 85.05112878
+
+CRASH_FIELDS = {
+    "st_case": "Number",
+    "year": "Number",
+    "crash_date": "String",
+    "total_fatalities": "Number",
+    "motorist_fatalities": "Number",
+    "pedestrian_fatalities": "Number",
+    "cyclist_fatalities": "Number",
+    "other_fatalities": "Number",
+}
+
+PLACE_FIELDS = {
+    "state_fips": "String",
+    "place_fips": "String",
+    "place_name": "String",
+    "is_vision_zero": "Boolean",
+}
+
+QUERY_CITIES = """
+    SELECT places.state_fips, places.place_fips
+    FROM census_places places
+    JOIN city_stats stats
+        ON places.state_fips = stats.state_fips
+        AND places.place_fips = stats.place_fips
+    WHERE stats.population >= %(min_population)s
+       OR places.is_vision_zero = TRUE
+"""
+
+QUERY_TILE = f"""
+    WITH bounds AS (
+        SELECT
+            ST_TileEnvelope(%(z)s, %(x)s, %(y)s) AS tile,
+            ST_Transform(ST_TileEnvelope(%(z)s, %(x)s, %(y)s), 4326) AS filter
+    ),
+    crashes AS (
+        SELECT
+            ST_AsMVTGeom(ST_Transform(fc.location, 3857), bounds.tile, {TILE_EXTENT}) AS geom,
+            fc.st_case,
+            fc.year,
+            fc.crash_date::text AS crash_date,
+            fc.total_fatalities,
+            fc.motorist_fatalities,
+            fc.pedestrian_fatalities,
+            fc.cyclist_fatalities,
+            fc.other_fatalities
+        FROM fars_crashes fc, bounds
+        WHERE %(with_crashes)s
+          AND fc.year >= 2001
+          AND fc.location && bounds.filter
+    ),
+    places AS (
+        SELECT
+            ST_AsMVTGeom(ST_Transform(simplified.geom, 3857), bounds.tile, {TILE_EXTENT}) AS geom,
+            places.state_fips,
+            places.place_fips,
+            places.place_name,
+            places.is_vision_zero
+        FROM ({QUERY_CITIES}) cities
+        JOIN census_places places
+            ON places.state_fips = cities.state_fips
+            AND places.place_fips = cities.place_fips
+        JOIN census_places_simplified simplified
+            ON simplified.state_fips = places.state_fips
+            AND simplified.place_fips = places.place_fips
+        CROSS JOIN bounds
+        WHERE simplified.zoom_band = %(zoom_band)s
+          AND simplified.geom && bounds.filter
+    )
+    SELECT
+        COALESCE((
+            SELECT ST_AsMVT(crashes, 'crashes', {TILE_EXTENT}, 'geom' ORDER BY year, st_case)
+            FROM crashes WHERE geom IS NOT NULL
+        ), '')
+        || COALESCE((
+            SELECT ST_AsMVT(places, 'places', {TILE_EXTENT}, 'geom' ORDER BY state_fips, place_fips)
+            FROM places WHERE geom IS NOT NULL
+        ), '')
+"""
+
+
+def tile_xy(lon: float, lat: float, zoom: int) -> tuple[int, int]:
+    """Web Mercator tile containing a WGS84 point."""
+    n = 1 << zoom
+    lat = max(min(lat, MAX_LAT), -MAX_LAT)
+    x = int((lon + 180) / 360 * n)
+    y = int((1 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def crash_tiles(conn: Connection, min_zoom: int, max_zoom: int) -> set[tuple[int, int, int]]:
+    """Every (z, x, y) from min_zoom to max_zoom holding at least one crash."""
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT DISTINCT
+                GREATEST(LEAST(floor((ST_X(location) + 180) / 360 * 2 ^ %(z)s), 2 ^ %(z)s - 1), 0)::int,
+                -- MAX_LAT rounds up, so y is clamped at 0 as well, like tile_xy
+                GREATEST(LEAST(
+                    floor((1 - asinh(tan(radians(GREATEST(LEAST(ST_Y(location), %(max_lat)s), -%(max_lat)s))))
+                        / pi()) / 2 * 2 ^ %(z)s),
+                    2 ^ %(z)s - 1
+                ), 0)::int
+            FROM fars_crashes
+            WHERE year >= 2001
+              AND location IS NOT NULL
+            """,
+            {"z": max_zoom, "max_lat": MAX_LAT},
+        )
+        leaves = cur.fetchall()
+
+    # Parents are derived by shifting, so the table is scanned once
+    return {
+        (z, x >> (max_zoom - z), y >> (max_zoom - z))
+        for x, y in leaves
+        for z in range(min_zoom, max_zoom + 1)
+    }
+
+
+def place_tiles(conn: Connection, min_zoom: int, max_zoom: int, min_population: int) -> set[tuple[int, int, int]]:
+    """Every (z, x, y) from min_zoom to max_zoom overlapping a dashboard city's bounding box."""
+    with conn.cursor() as cur:
+        cur.execute(
+            f"""
+            SELECT ST_XMin(places.geom), ST_YMin(places.geom), ST_XMax(places.geom), ST_YMax(places.geom)
+            FROM ({QUERY_CITIES}) cities
+            JOIN census_places places
+                ON places.state_fips = cities.state_fips
+                AND places.place_fips = cities.place_fips
+            WHERE places.geom IS NOT NULL
+            """,
+            {"min_population": min_population},
+        )
+        boxes = cur.fetchall()
+
+    tiles = set()
+    for xmin, ymin, xmax, ymax in boxes:
+        for z in range(min_zoom, max_zoom + 1):
+            x0, y0 = tile_xy(xmin, ymax, z)
+            x1, y1 = tile_xy(xmax, ymin, z)
+            tiles.update((z, x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1))
+    return tiles
+
+
+def export_vector_tiles(
+        writer: ExportWriter,
+        min_population: int = 100000,
+        min_zoom: int = MIN_ZOOM,
+        max_zoom: int = MAX_ZOOM,
+        crash_min_zoom: int = CRASH_MIN_ZOOM,
+):
+    """
+    Write every crash and dashboard city boundary nationwide as one PMTiles
+    archive of gzipped Mapbox Vector Tiles, read by the map with HTTP range
+    requests straight from R2.
+
+    Tiles have a "crashes" layer from crash_min_zoom up and a "places"
+    layer using the census_places_simplified band for their zoom. Only
+    tiles with data are generated, in tile-id order, one ST_AsMVT query each.
+    """
+    from pmtiles.tile import Compression, TileType, zxy_to_tileid  # optional: pip install pmtiles
+    from pmtiles.writer import Writer
+
+    try:
+        with get_conn("export") as conn:
+            tiles = place_tiles(conn, min_zoom, max_zoom, min_population)
+            if crash_min_zoom <= max_zoom:
+                tiles |= crash_tiles(conn, max(min_zoom, crash_min_zoom), max_zoom)
+            if not tiles:
+                logger.warning("[EXPORT] No vector tiles to write")
+                return
+
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT ST_XMin(extent), ST_YMin(extent), ST_XMax(extent), ST_YMax(extent)
+                    FROM (SELECT ST_Extent(location) AS extent FROM fars_crashes WHERE year >= 2001) crashes
+                    """
+                )
+                bounds = cur.fetchone()
+
+            ordered = sorted(tiles, key=lambda tile: zxy_to_tileid(*tile))
+            logger.info("[EXPORT] Building %d vector tiles (z%d-%d)", len(ordered), min_zoom, max_zoom)
+
+            written = 0
+            with writer.open_binary(ARCHIVE_PATH) as file:
+                archive = Writer(file)
+                with conn.cursor() as cur:
+                    for i, (z, x, y) in enumerate(ordered, start=1):
+                        cur.execute(
+                            QUERY_TILE,
+                            {
+                                "z": z,
+                                "x": x,
+                                "y": y,
+                                "with_crashes": z >= crash_min_zoom,
+                                "zoom_band": zoom_band(z),
+                                "min_population": min_population,
+                            },
+                        )
+                        row = cur.fetchone()
+                        data = row[0] if row else None
+                        if data:
+                            archive.write_tile(zxy_to_tileid(z, x, y), gzip.compress(data, mtime=0))
+                            written += 1
+                        if i % 10000 == 0:
+                            logger.info("[EXPORT] Vector tile progress: %d/%d", i, len(ordered))
+
+                if not written:
+                    raise RuntimeError("Every vector tile was empty")
+
+                min_lon, min_lat, max_lon, max_lat = bounds if bounds and bounds[0] is not None else (-180, -85, 180, 85)
+                header = {
+                    "tile_type": TileType.MVT,
+                    "tile_compression": Compression.GZIP,
+                    "min_lon_e7": int(min_lon * 10_000_000),
+                    "min_lat_e7": int(min_lat * 10_000_000),
+                    "max_lon_e7": int(max_lon * 10_000_000),
+                    "max_lat_e7": int(max_lat * 10_000_000),
+                    "center_zoom": min_zoom,
+                    "center_lon_e7": int((min_lon + max_lon) / 2 * 10_000_000),
+                    "center_lat_e7": int((min_lat + max_lat) / 2 * 10_000_000),
+                }
+                metadata = {
+                    "name": "Vision Zero crashes",
+                    "vector_layers": [
+                        {
+                            "id": "crashes",
+                            "fields": CRASH_FIELDS,
+                            "minzoom": max(min_zoom, crash_min_zoom),
+                            "maxzoom": max_zoom,
+                        },
+                        {"id": "places", "fields": PLACE_FIELDS, "minzoom": min_zoom, "maxzoom": max_zoom},
+                    ],
+                }
+                archive.finalize(header, metadata)
+
+        logger.info("[EXPORT] Vector tiles exported: %d non-empty tiles → %s", written, ARCHIVE_PATH)
+
+    except Exception as e:
+        logger.error("[EXPORT] export_vector_tiles failed: %s", e)
+        raise
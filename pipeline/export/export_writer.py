@@ -0,0 +1,212 @@
+import gzip
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from pipeline.logger import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST_NAME = "export_manifest.json"
+
+# Pre-compressed variants written next to each export file, by
+# Content-Encoding name.
+ENCODING_SUFFIXES: dict[str, str] = {
+    "gzip": ".gz",
+    "br": ".br",
+}
+
+# Archives the client reads with HTTP range requests must be served as-is,
+# so they never get pre-compressed variants.
+RANGE_READ_SUFFIXES = (".pmtiles",)
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        # mtime=0 keeps the bytes, and so the uploaded ETag, stable across runs
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == "br":
+        import brotli  # optional: pip install brotli
+        return brotli.compress(data, quality=11)
+    raise ValueError(f"Unknown encoding: {encoding}")
+
+
+def variant_path(path: Path, encoding: str) -> Path:
+    return path.with_name(path.name + ENCODING_SUFFIXES[encoding])
+
+
+class ExportWriter:
+    """
+    Writes export files under ``out_dir`` only when their content changed.
+
+    Every file's sha256 and size are recorded in export_manifest.json at the
+    root of the export. A file whose serialized bytes hash to the recorded
+    value, and which is still on disk, is left untouched, so an annual
+    update rewrites only the files whose data actually moved.
+
+    With ``encodings`` (any of ENCODING_SUFFIXES) each file also gets a
+    pre-compressed variant per encoding, e.g. ``2023.json.gz``, and the
+    variant sizes are recorded in the manifest.
+    """
+
+    def __init__(self, out_dir: Path, encodings: tuple[str, ...] = ()):
+        unknown = set(encodings) - ENCODING_SUFFIXES.keys()
+        if unknown:
+            raise ValueError(f"Unknown encodings: {sorted(unknown)}")
+        self.out_dir = out_dir
+        self.encodings = encodings
+        self.manifest_path = out_dir / MANIFEST_NAME
+        self.manifest: dict[str, dict] = {}
+        if self.manifest_path.exists():
+            self.manifest = json.loads(self.manifest_path.read_text())
+        self.seen: set[str] = set()
+        self.written = 0
+        self.unchanged = 0
+
+    def _record(self, rel_path: str, digest: str, size: int, changed: bool, data: bytes | None = None) -> None:
+        previous = self.manifest.get(rel_path, {})
+        entry = {"sha256": digest, "size": size}
+
+        path = self.out_dir / rel_path
+        encodings = () if path.suffix in RANGE_READ_SUFFIXES else self.encodings
+        for encoding in encodings:
+            variant = variant_path(path, encoding)
+            if not changed and encoding in previous and variant.exists():
+                entry[encoding] = previous[encoding]
+                continue
+            if data is None:
+                data = path.read_bytes()
+            compressed = compress(data, encoding)
+            variant.write_bytes(compressed)
+            entry[encoding] = len(compressed)
+
+        self.manifest[rel_path] = entry
+        self.seen.add(rel_path)
+        if changed:
+            self.written += 1
+        else:
+            self.unchanged += 1
+
+    def _is_current(self, rel_path: str, digest: str) -> bool:
+        entry = self.manifest.get(rel_path)
+        return entry is not None and entry["sha256"] == digest and (self.out_dir / rel_path).exists()
+
+    def write_bytes(self, rel_path: str, data: bytes) -> bool:
+        """
+        Write ``data`` to ``out_dir/rel_path`` unless it is unchanged.
+
+        Returns:
+            True if the file was written.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        if self._is_current(rel_path, digest):
+            self._record(rel_path, digest, len(data), changed=False, data=data)
+            return False
+
+        path = self.out_dir / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        self._record(rel_path, digest, len(data), changed=True, data=data)
+        return True
+
+    def write_text(self, rel_path: str, text: str) -> bool:
+        return self.write_bytes(rel_path, text.encode("utf-8"))
+
+    @contextmanager
+    def open_text(self, rel_path: str) -> Iterator["_HashingFile"]:
+        """
+        Stream text into ``rel_path`` without holding it in memory. Content
+        goes to a temporary file beside the target and only replaces it if
+        the hash differs from the manifest.
+        """
+        with self._open(rel_path, text=True) as stream:
+            yield stream
+
+    @contextmanager
+    def open_binary(self, rel_path: str) -> Iterator["_HashingFile"]:
+        """Like open_text, for writers that produce bytes."""
+        with self._open(rel_path, text=False) as stream:
+            yield stream
+
+    @contextmanager
+    def _open(self, rel_path: str, text: bool) -> Iterator["_HashingFile"]:
+        path = self.out_dir / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+
+        with open(tmp_path, "wb") as file:
+            stream = _HashingFile(file, text)
+            try:
+                yield stream
+            except BaseException:
+                file.close()
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+        digest = stream.digest.hexdigest()
+        if self._is_current(rel_path, digest):
+            tmp_path.unlink()
+            self._record(rel_path, digest, stream.size, changed=False)
+        else:
+            os.replace(tmp_path, path)
+            self._record(rel_path, digest, stream.size, changed=True)
+
+    def total_bytes(self) -> int:
+        return sum(self.manifest[rel_path]["size"] for rel_path in self.seen)
+
+    def remove_stale_files(self) -> int:
+        """
+        Delete files the previous manifest listed that this run did not
+        produce, with their variants, and variants of current files for
+        encodings no longer written, so a sync never uploads them. Files the
+        manifest never listed are left alone.
+
+        Returns:
+            Number of files deleted.
+        """
+        removed = 0
+        for rel_path, entry in self.manifest.items():
+            path = self.out_dir / rel_path
+            stale = [variant_path(path, encoding) for encoding in ENCODING_SUFFIXES if encoding not in entry]
+            if rel_path not in self.seen:
+                stale = [path, *(variant_path(path, encoding) for encoding in ENCODING_SUFFIXES)]
+            for stale_path in stale:
+                if stale_path.exists():
+                    stale_path.unlink()
+                    removed += 1
+        return removed
+
+    def save(self) -> None:
+        """
+        Persist the manifest. Only files written or confirmed unchanged by
+        this run are kept, so it always describes the current export; files
+        from earlier runs that are no longer produced are deleted.
+        """
+        removed = self.remove_stale_files()
+        self.manifest = {rel_path: self.manifest[rel_path] for rel_path in sorted(self.seen)}
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(f".{MANIFEST_NAME}.tmp")
+        tmp_path.write_text(json.dumps(self.manifest, indent=1))
+        os.replace(tmp_path, self.manifest_path)
+        logger.info(
+            "[EXPORT] Manifest saved: written=%d | unchanged=%d | removed=%d | files=%d",
+            self.written, self.unchanged, removed, len(self.manifest),
+        )
+
+
+class _HashingFile:
+    def __init__(self, file, text: bool = True):
+        self.file = file
+        self.text = text
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: str | bytes) -> None:
+        if self.text:
+            data = data.encode("utf-8")
+        self.digest.update(data)
+        self.size += len(data)
+        self.file.write(data)
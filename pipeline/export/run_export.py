@@ -1,5 +1,6 @@
 import os
-from pathlib import Path
+from collections import defaultdict
+from pathlib import Path, PurePosixPath
 from dotenv import load_dotenv
 
 from pipeline.export.export_crashes_metadata import export_crashes_metadata
@@ -7,6 +8,9 @@ from pipeline.export.export_cities import export_cities
 from pipeline.export.export_boundaries import export_boundaries
 from pipeline.export.export_crashes import export_crashes
 from pipeline.export.export_annual_fatalities import export_annual_fatalities
+from pipeline.export.export_vector_tiles import export_vector_tiles
+from pipeline.export.export_crash_clusters import export_crash_clusters
+from pipeline.export.export_writer import ExportWriter
 from pipeline.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,21 +19,63 @@ load_dotenv()
 
 OUTPUT_DIR = Path(os.getenv("EXPORT_OUTPUT_DIR", "export_output"))
 
-def log_export_size(out_dir: Path):
-    total_bytes = sum(f.stat().st_size for f in out_dir.rglob("*") if f.is_file())
-    total_mb = total_bytes / (1024 * 1024)
-    file_count = sum(1 for f in out_dir.rglob("*") if f.is_file())
-    logger.info("Export size: %.1f MB across %d files", total_mb, file_count)
+# Also write crashes/{state}/{place}/{year}.bin columnar point files.
+CRASH_BINARY = os.getenv("EXPORT_CRASH_BINARY", "").lower() in ("1", "true", "yes")
+
+# Also write crashes/{state}/{place}/all.json with every year since 2001.
+CRASH_HISTORY_BUNDLE = os.getenv("EXPORT_CRASH_HISTORY_BUNDLE", "").lower() in ("1", "true", "yes")
+
+# Also write the nationwide tiles/vision_zero.pmtiles vector tile archive.
+VECTOR_TILES = os.getenv("EXPORT_VECTOR_TILES", "").lower() in ("1", "true", "yes")
+
+# Also write clusters/{z}/{x}/{y}.json nationwide crash clusters for low zooms.
+CRASH_CLUSTERS = os.getenv("EXPORT_CRASH_CLUSTERS", "").lower() in ("1", "true", "yes")
+
+# Comma-separated pre-compressed variants to write, e.g. "gzip,br".
+COMPRESSION = tuple(enc.strip() for enc in os.getenv("EXPORT_COMPRESSION", "").split(",") if enc.strip())
+
+def log_export_size(writer: ExportWriter):
+    total_mb = writer.total_bytes() / (1024 * 1024)
+    logger.info("Export size: %.1f MB across %d files", total_mb, len(writer.manifest))
+
+def artifact_type(rel_path: str) -> str:
+    """Group files under a directory by that top-level directory and suffix, e.g. clusters/*.json."""
+    path = PurePosixPath(rel_path)
+    if len(path.parts) > 1:
+        return f"{path.parts[0]}/*{path.suffix}"
+    return path.name
+
+def log_compression_ratios(writer: ExportWriter):
+    totals = defaultdict(lambda: defaultdict(int))
+    for rel_path, entry in writer.manifest.items():
+        sizes = totals[artifact_type(rel_path)]
+        sizes["size"] += entry["size"]
+        for encoding in writer.encodings:
+            sizes[encoding] += entry.get(encoding, 0)
+
+    for kind, sizes in sorted(totals.items()):
+        ratios = " | ".join(
+            f"{encoding}={sizes[encoding] / sizes['size']:.1%}" for encoding in writer.encodings if sizes["size"]
+        )
+        logger.info("[EXPORT] Compression %s: %.1f MB raw | %s", kind, sizes["size"] / (1024 * 1024), ratios)
 
 def main():
     logger.info("[EXPORT] Starting export — output dir: %s", OUTPUT_DIR)
-    export_crashes_metadata(OUTPUT_DIR)
-    export_cities(OUTPUT_DIR)
-    export_boundaries(OUTPUT_DIR)
-    export_annual_fatalities(OUTPUT_DIR)
-    export_crashes(OUTPUT_DIR)
+    writer = ExportWriter(OUTPUT_DIR, encodings=COMPRESSION)
+    export_crashes_metadata(writer)
+    export_cities(writer)
+    export_boundaries(writer)
+    export_annual_fatalities(writer)
+    export_crashes(writer, binary=CRASH_BINARY, full_history=CRASH_HISTORY_BUNDLE)
+    if VECTOR_TILES:
+        export_vector_tiles(writer)
+    if CRASH_CLUSTERS:
+        export_crash_clusters(writer)
+    writer.save()
     logger.info("[EXPORT] Export complete")
-    log_export_size(OUTPUT_DIR)
+    log_export_size(writer)
+    if writer.encodings:
+        log_compression_ratios(writer)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
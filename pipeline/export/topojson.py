@@ -0,0 +1,85 @@
+# Minimal quantized TopoJSON encoder for boundary exports. Each ring becomes
+# its own delta-encoded arc; arcs are not shared, since a single city boundary
+# has no internal edges to share and the size win comes from quantization.
+
+# Grid points per axis across the topology's bounding box (the TopoJSON
+# reference implementation's default).
+QUANTIZATION = 100_000
+
+
+def _polygons(geometry: dict) -> list[list[list[list[float]]]]:
+    if geometry["type"] == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry["type"] == "MultiPolygon":
+        return geometry["coordinates"]
+    raise ValueError(f"Unsupported geometry type: {geometry['type']}")
+
+
+def encode_topology(
+        geometries: dict[str, dict],
+        properties: dict | None = None,
+        quantization: int = QUANTIZATION,
+) -> dict:
+    """
+    Build a quantized Topology from named GeoJSON Polygon/MultiPolygon
+    geometries, one TopoJSON object per name.
+
+    Rings that collapse to fewer than four positions after quantization are
+    dropped, as are polygons whose exterior ring collapses.
+    """
+    coords = [
+        point
+        for geometry in geometries.values()
+        for polygon in _polygons(geometry)
+        for ring in polygon
+        for point in ring
+    ]
+    if not coords:
+        raise ValueError("Cannot encode a topology with no coordinates")
+
+    x0 = min(x for x, _ in coords)
+    y0 = min(y for _, y in coords)
+    x1 = max(x for x, _ in coords)
+    y1 = max(y for _, y in coords)
+    kx = (x1 - x0) / (quantization - 1) if x1 > x0 else 1
+    ky = (y1 - y0) / (quantization - 1) if y1 > y0 else 1
+
+    arcs: list[list[list[int]]] = []
+
+    def encode_ring(ring: list[list[float]]) -> int | None:
+        quantized: list[tuple[int, int]] = []
+        for x, y in ring:
+            point = (round((x - x0) / kx), round((y - y0) / ky))
+            if not quantized or point != quantized[-1]:
+                quantized.append(point)
+        if len(quantized) < 4:
+            return None
+
+        arc = [list(quantized[0])]
+        for (px, py), (qx, qy) in zip(quantized, quantized[1:]):
+            arc.append([qx - px, qy - py])
+        arcs.append(arc)
+        return len(arcs) - 1
+
+    objects = {}
+    for name, geometry in geometries.items():
+        polygons = []
+        for polygon in _polygons(geometry):
+            exterior = encode_ring(polygon[0])
+            if exterior is None:
+                continue
+            holes = [encode_ring(ring) for ring in polygon[1:]]
+            polygons.append([[exterior]] + [[hole] for hole in holes if hole is not None])
+
+        topo_object: dict = {"type": "MultiPolygon", "arcs": polygons}
+        if properties:
+            topo_object["properties"] = properties
+        objects[name] = topo_object
+
+    return {
+        "type": "Topology",
+        "bbox": [x0, y0, x1, y1],
+        "transform": {"scale": [kx, ky], "translate": [x0, y0]},
+        "objects": objects,
+        "arcs": arcs,
+    }
@@ -1,12 +1,16 @@
 import os
+import json
+import hashlib
 import mimetypes
 from pathlib import Path
 import boto3
 from botocore.config import Config
+from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 from tqdm import tqdm
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from pipeline.export.export_writer import ENCODING_SUFFIXES, MANIFEST_NAME, variant_path
 from pipeline.logger import get_logger
 
 logger = get_logger(__name__)
@@ -19,19 +23,39 @@ SECRET_ACCESS_KEY = os.getenv("R2_SECRET_ACCESS_KEY")
 BUCKET_NAME = os.getenv("R2_BUCKET_NAME", "visionzero-data")
 EXPORT_OUTPUT_DIR = Path(os.getenv("EXPORT_OUTPUT_DIR", "exports"))
 
+# Exports only change when the pipeline runs, at most a few times a year.
+CACHE_CONTROL = os.getenv("R2_CACHE_CONTROL", "public, max-age=604800")
+
+# Upload threads; the client's connection pool is sized to match so threads
+# never wait on each other for a connection.
+UPLOAD_WORKERS = 16
+
+# delete_objects accepts at most 1000 keys per request.
+DELETE_BATCH_SIZE = 1000
+
 MIME_OVERRIDES = {
     ".geojson": "application/geo+json",
+    ".topojson": "application/json",
+    ".pmtiles": "application/vnd.pmtiles",
     ".json": "application/json",
 }
 
 
-def get_client():
+def get_client(max_pool_connections: int = UPLOAD_WORKERS):
+    """
+    Build one S3 client for R2. boto3 clients are thread-safe, so a single
+    client is shared by every upload thread.
+    """
     return boto3.client(
         "s3",
         endpoint_url=f"https://{ACCOUNT_ID}.r2.cloudflarestorage.com",
         aws_access_key_id=ACCESS_KEY_ID,
         aws_secret_access_key=SECRET_ACCESS_KEY,
-        config=Config(signature_version="s3v4"),
+        config=Config(
+            signature_version="s3v4",
+            max_pool_connections=max_pool_connections,
+            retries={"max_attempts": 5, "mode": "standard"},
+        ),
         region_name="auto",
     )
 
@@ -40,39 +64,234 @@ def get_content_type(path: Path) -> str:
     return MIME_OVERRIDES.get(path.suffix, mimetypes.guess_type(path.name)[0] or "application/octet-stream")
 
 
-def upload_file(client, path, key, content_type, dry_run):
+def hash_file(path: Path, algorithm: str, chunk_size: int = 1024 * 1024) -> str:
+    """Hex digest of a file, read in chunks so large exports never sit in memory."""
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def upload_body(path: Path, encoding: str | None) -> tuple[Path, str | None]:
+    """
+    File to upload for ``path`` and its Content-Encoding: the pre-compressed
+    variant when one was exported for ``encoding``, else the plain file.
+    """
+    if encoding:
+        variant = variant_path(path, encoding)
+        if variant.exists():
+            return variant, encoding
+    return path, None
+
+
+def upload_file(
+        client,
+        path,
+        key,
+        content_type,
+        dry_run,
+        bucket=BUCKET_NAME,
+        encoding=None,
+        cache_control=CACHE_CONTROL,
+        metadata=None,
+):
+    body_path, content_encoding = upload_body(path, encoding)
     if dry_run:
-        logger.info("[dry-run] %s → %s", path, key)
+        logger.info("[dry-run] %s → %s", body_path, key)
         return key
-    client = get_client()
-    client.put_object(
-        Bucket=BUCKET_NAME,
-        Key=key,
-        Body=path.read_bytes(),
-        ContentType=content_type,
-    )
+    extra = {"ContentEncoding": content_encoding} if content_encoding else {}
+    # Streamed from the open file. A single put_object rather than
+    # upload_fileobj, whose multipart uploads would not have the file's MD5
+    # as their ETag, which compare="etag" relies on.
+    with open(body_path, "rb") as body:
+        client.put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=body,
+            ContentType=content_type,
+            CacheControl=cache_control,
+            Metadata=metadata or {},
+            **extra,
+        )
     return key
 
 
-def upload_all(dry_run: bool = False):
-    client = get_client()
-    files = list(EXPORT_OUTPUT_DIR.rglob("*"))
-    files = [f for f in files if f.is_file()]
-    total = len(files)
-
-    logger.info("Uploading %d files from %s", total, EXPORT_OUTPUT_DIR)
-
-    with ThreadPoolExecutor(max_workers=10) as executor:
+def upload_files(
+        client,
+        out_dir: Path,
+        keys: list[str],
+        dry_run: bool,
+        bucket: str = BUCKET_NAME,
+        encoding: str | None = None,
+) -> None:
+    total = len(keys)
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
         futures = {
-            executor.submit(upload_file, client, path, str(path.relative_to(EXPORT_OUTPUT_DIR)), get_content_type(path), dry_run): path
-            for path in files
+            executor.submit(
+                upload_file, client, out_dir / key, key, get_content_type(out_dir / key), dry_run, bucket, encoding,
+            ): key
+            for key in keys
         }
-        for i, future in enumerate(tqdm(as_completed(futures), total=total, desc="Uploading", ncols=80), 1):
+        for future in tqdm(as_completed(futures), total=total, desc="Uploading", ncols=80):
             try:
                 future.result()
             except Exception as e:
                 logger.error("Failed: %s", e)
                 raise
+
+
+def local_export_files(out_dir: Path) -> list[str]:
+    return sorted(
+        path.relative_to(out_dir).as_posix()
+        for path in out_dir.rglob("*")
+        if path.is_file()
+        and path.name != MANIFEST_NAME
+        and path.suffix not in (".tmp", *ENCODING_SUFFIXES.values())
+    )
+
+
+def local_hashes(out_dir: Path) -> dict[str, str]:
+    """
+    key -> sha256 for the current export, read from the export manifest.
+    Falls back to hashing every file if no manifest was written.
+    """
+    manifest_path = out_dir / MANIFEST_NAME
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text())
+        return {key: entry["sha256"] for key, entry in manifest.items()}
+    return {
+        key: hash_file(out_dir / key, "sha256")
+        for key in local_export_files(out_dir)
+    }
+
+
+def remote_manifest_hashes(client, bucket: str = BUCKET_NAME, encoding: str | None = None) -> dict[str, str]:
+    """
+    key -> sha256 from the manifest stored by the last sync, or {} if none.
+    A manifest stored by a sync with a different encoding also returns {},
+    since every object has to be re-uploaded with the new Content-Encoding.
+    """
+    try:
+        response = client.get_object(Bucket=bucket, Key=MANIFEST_NAME)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+            return {}
+        raise
+    if response.get("Metadata", {}).get("upload-encoding", "identity") != (encoding or "identity"):
+        return {}
+    manifest = json.loads(response["Body"].read())
+    return {key: entry["sha256"] for key, entry in manifest.items()}
+
+
+def remote_etags(client, bucket: str = BUCKET_NAME) -> dict[str, str]:
+    """key -> ETag for every object in the bucket, from one paginated listing."""
+    etags = {}
+    paginator = client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket):
+        for obj in page.get("Contents", []):
+            etags[obj["Key"]] = obj["ETag"].strip('"')
+    return etags
+
+
+def delete_keys(client, keys: list[str], dry_run: bool, bucket: str = BUCKET_NAME) -> None:
+    for i in range(0, len(keys), DELETE_BATCH_SIZE):
+        batch = keys[i:i + DELETE_BATCH_SIZE]
+        if dry_run:
+            for key in batch:
+                logger.info("[dry-run] delete %s", key)
+            continue
+        client.delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+        )
+
+
+def sync_export(
+        client,
+        out_dir: Path = EXPORT_OUTPUT_DIR,
+        bucket: str = BUCKET_NAME,
+        compare: str = "manifest",
+        delete_orphans: bool = False,
+        dry_run: bool = False,
+        encoding: str | None = None,
+) -> tuple[list[str], list[str]]:
+    """
+    Upload only new or changed export files.
+
+    compare="manifest" diffs the local export manifest against the copy
+    stored in the bucket by the previous sync (one GET). compare="etag" diffs
+    local MD5s against the ETags from a listing of the bucket instead, which
+    also catches objects changed outside the pipeline; single-part uploads
+    have the object's MD5 as their ETag.
+
+    With delete_orphans=True, remote keys the current export no longer
+    produces are deleted. Orphans come from a listing of the bucket, not the
+    stored manifest, so they are found even when the manifest is missing or
+    was stored with another encoding.
+
+    With ``encoding`` ("gzip" or "br") each file's pre-compressed variant is
+    uploaded under the plain key with a matching Content-Encoding.
+
+    Returns:
+        (uploaded keys, deleted keys)
+    """
+    if compare == "manifest":
+        local = local_hashes(out_dir)
+        remote = remote_manifest_hashes(client, bucket, encoding)
+    elif compare == "etag":
+        local = {
+            key: hash_file(upload_body(out_dir / key, encoding)[0], "md5")
+            for key in local_export_files(out_dir)
+        }
+        remote = remote_etags(client, bucket)
+        remote.pop(MANIFEST_NAME, None)
+    else:
+        raise ValueError(f"Unknown compare mode: {compare}")
+
+    changed = sorted(key for key, digest in local.items() if remote.get(key) != digest)
+    orphans: list[str] = []
+    if delete_orphans:
+        listed = remote if compare == "etag" else remote_etags(client, bucket)
+        orphans = sorted(listed.keys() - local.keys() - {MANIFEST_NAME})
+    logger.info(
+        "Sync: %d local files | %d new or changed | %d unchanged | %d orphans to delete",
+        len(local), len(changed), len(local) - len(changed), len(orphans),
+    )
+
+    upload_files(client, out_dir, changed, dry_run, bucket, encoding)
+    delete_keys(client, orphans, dry_run, bucket)
+
+    # Stored last, so an interrupted sync is retried on the next run. Kept
+    # current in etag mode too, so a later manifest sync starts from the truth.
+    if (out_dir / MANIFEST_NAME).exists():
+        upload_manifest(client, out_dir, dry_run, bucket, encoding)
+
+    logger.info("Sync complete")
+    return changed, orphans
+
+
+def upload_manifest(client, out_dir: Path, dry_run: bool, bucket: str = BUCKET_NAME, encoding: str | None = None) -> None:
+    upload_file(
+        client,
+        out_dir / MANIFEST_NAME,
+        MANIFEST_NAME,
+        "application/json",
+        dry_run,
+        bucket,
+        cache_control="no-cache",
+        metadata={"upload-encoding": encoding or "identity"},
+    )
+
+
+def upload_all(dry_run: bool = False, encoding: str | None = None):
+    client = get_client()
+    keys = local_export_files(EXPORT_OUTPUT_DIR)
+
+    logger.info("Uploading %d files from %s", len(keys), EXPORT_OUTPUT_DIR)
+    upload_files(client, EXPORT_OUTPUT_DIR, keys, dry_run, encoding=encoding)
+    if (EXPORT_OUTPUT_DIR / MANIFEST_NAME).exists():
+        upload_manifest(client, EXPORT_OUTPUT_DIR, dry_run, encoding=encoding)
     logger.info("Upload complete")
 
 
@@ -80,5 +299,29 @@ if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser()
     parser.add_argument("--dry-run", action="store_true", help="Log files without uploading")
+    parser.add_argument("--full", action="store_true", help="Upload every file instead of syncing changes")
+    parser.add_argument(
+        "--compare",
+        choices=("manifest", "etag"),
+        default="manifest",
+        help="Detect changes against the stored export manifest (default) or the bucket's ETags",
+    )
+    parser.add_argument("--delete-orphans", action="store_true", help="Delete remote keys no longer in the export")
+    parser.add_argument(
+        "--encoding",
+        choices=("identity", *ENCODING_SUFFIXES),
+        default="identity",
+        help="Upload pre-compressed variants with this Content-Encoding (export with EXPORT_COMPRESSION first)",
+    )
     args = parser.parse_args()
-    upload_all(dry_run=args.dry_run)
\ No newline at end of file
+    encoding = None if args.encoding == "identity" else args.encoding
+    if args.full:
+        upload_all(dry_run=args.dry_run, encoding=encoding)
+    else:
+        sync_export(
+            get_client(),
+            compare=args.compare,
+            delete_orphans=args.delete_orphans,
+            dry_run=args.dry_run,
+            encoding=encoding,
+        )
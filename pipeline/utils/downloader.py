@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
+import io
 import requests
 import time
 import zipfile
+from contextlib import contextmanager
+from typing import Iterator, TextIO
 from tqdm import tqdm
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
 from pipeline.logger import get_logger
 
@@ -52,6 +55,43 @@ def extract_if_zip(file_path: Path, extract_to: Path, expected_extension: str) -
 
     return list(extract_to.glob(f"*{expected_extension}"))
 
+def list_zip_members(zip_path: Path, expected_extension: str) -> dict[str, str]:
+    """
+    Map the upper-cased base name of every file in a zip with the given
+    extension to its full member name, so members can be looked up
+    case-insensitively regardless of any folder they are nested in.
+    The first member wins if two share a base name.
+    """
+    members: dict[str, str] = {}
+    with zipfile.ZipFile(zip_path, "r") as zip:
+        for info in zip.infolist():
+            name = PurePosixPath(info.filename)
+            if info.is_dir() or name.suffix.casefold() != expected_extension:
+                continue
+            members.setdefault(name.name.upper(), info.filename)
+    return members
+
+
+@contextmanager
+def open_zip_member(zip_path: Path, member_name: str) -> Iterator[TextIO]:
+    """
+    Open a CSV inside a zip as a streaming text file, without extracting it.
+    ``member_name`` is matched case-insensitively against member base names.
+
+    :raises FileNotFoundError: If the zip has no member with that name.
+    """
+    suffix = PurePosixPath(member_name).suffix.casefold()
+    members = list_zip_members(zip_path, suffix)
+    member = members.get(member_name.upper())
+    if member is None:
+        raise FileNotFoundError(f"{member_name} not found in {zip_path}")
+
+    with zipfile.ZipFile(zip_path, "r") as zip:
+        with zip.open(member, "r") as raw:
+            with io.TextIOWrapper(raw, encoding="utf-8-sig", errors="replace", newline="") as text:
+                yield text
+
+
 def download_file(url: str, dest: Path, chunk_size: int = 8192) -> Path:
     """
     Download a file from "url" to "dest" while streaming bytes with a tqdm progress bar.
@@ -10,6 +10,7 @@ CREATE TABLE IF NOT EXISTS census_places (
     geom GEOMETRY(MultiPolygon, 4326),
     centroid GEOMETRY(Point, 4326),
     point_geom GEOMETRY(Point, 4326),
+    geom_updated_at TIMESTAMPTZ NOT NULL DEFAULT now(), -- drives incremental crash enrichment
     CONSTRAINT census_places_state_fips_place_fips_unique UNIQUE (state_fips, place_fips)
 );
 
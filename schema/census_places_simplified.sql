@@ -0,0 +1,13 @@
+-- census_places boundaries simplified and precision-reduced once per zoom
+-- band, so the boundary export reads stored geometries instead of running
+-- ST_SimplifyPreserveTopology on every export. Derived; rebuilt by the city pipeline.
+-- File: schema/census_places_simplified.sql
+
+CREATE TABLE IF NOT EXISTS census_places_simplified (
+    state_fips CHAR(2) NOT NULL,
+    place_fips CHAR(5) NOT NULL,
+    zoom_band VARCHAR(8) NOT NULL,
+    decimal_digits SMALLINT NOT NULL, -- coordinates are snapped to 10^-decimal_digits degrees
+    geom GEOMETRY(MultiPolygon, 4326) NOT NULL,
+    PRIMARY KEY (state_fips, place_fips, zoom_band)
+);
@@ -0,0 +1,14 @@
+-- census_places boundaries cut into small pieces with ST_Subdivide, so the
+-- GiST index narrows point-in-polygon checks to a few compact polygons
+-- instead of whole-city bounding boxes. Derived; rebuilt by the city pipeline.
+-- File: schema/census_places_subdivided.sql
+
+CREATE TABLE IF NOT EXISTS census_places_subdivided (
+    id SERIAL PRIMARY KEY,
+    state_fips CHAR(2) NOT NULL,
+    place_fips CHAR(5) NOT NULL,
+    geom GEOMETRY(Polygon, 4326) NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS census_places_subdivided_geom_idx ON census_places_subdivided USING GIST (geom);
+CREATE INDEX IF NOT EXISTS census_places_subdivided_place_idx ON census_places_subdivided (state_fips, place_fips);
@@ -0,0 +1,18 @@
+-- Fatality sums per census place and year, aggregated from fars_crashes.
+-- File: schema/city_year_fatalities.sql
+-- Derived; refreshed for the affected years after each FARS load or
+-- enrichment, and read by derive_city_stats and the annual fatalities export.
+
+CREATE TABLE IF NOT EXISTS city_year_fatalities (
+    state CHAR(2) NOT NULL,
+    place_fips CHAR(5) NOT NULL,
+    year INTEGER NOT NULL,
+    total_fatalities INTEGER NOT NULL,
+    pedestrian_fatalities INTEGER,
+    cyclist_fatalities INTEGER,
+    motorist_fatalities INTEGER,
+    other_fatalities INTEGER,
+    PRIMARY KEY (state, place_fips, year)
+);
+
+CREATE INDEX IF NOT EXISTS city_year_fatalities_year_idx ON city_year_fatalities (year);
@@ -0,0 +1,12 @@
+-- One row per enrich_crash_locations run.
+-- File: schema/crash_enrichment_runs.sql
+-- Incremental runs re-check crashes inside census_places boundaries whose
+-- geom_updated_at is later than the last completed run's started_at.
+
+CREATE TABLE IF NOT EXISTS crash_enrichment_runs (
+    run_id SERIAL PRIMARY KEY,
+    full_run BOOLEAN NOT NULL,
+    started_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    completed_at TIMESTAMPTZ,
+    crashes_updated INTEGER
+);
@@ -1,3 +1,5 @@
+DROP TABLE IF EXISTS census_places_subdivided CASCADE;
+DROP TABLE IF EXISTS census_places_simplified CASCADE;
 DROP TABLE IF EXISTS city_stats CASCADE;
 DROP TABLE IF EXISTS census_places CASCADE;
 
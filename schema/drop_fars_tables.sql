@@ -1,3 +1,6 @@
 DROP TABLE IF EXISTS fars_crashes CASCADE;
 DROP TABLE IF EXISTS fars_persons CASCADE;
-
+DROP TABLE IF EXISTS fars_persons_rejects CASCADE;
+DROP TABLE IF EXISTS fars_load_ledger CASCADE;
+DROP TABLE IF EXISTS crash_enrichment_runs CASCADE;
+DROP TABLE IF EXISTS city_year_fatalities CASCADE;
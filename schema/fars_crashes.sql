@@ -1,9 +1,11 @@
 -- Creates the PostGIS crashes table.
 -- File: schema/fars_crashes.sql
 -- Requires: PostGIS extension installed in this database.
+-- Range-partitioned by year; one partition per FARS year (fars_crashes_y<year>)
+-- is created and attached by the loader (pipeline/etl/load/fars_partitions.py).
 
 CREATE TABLE IF NOT EXISTS fars_crashes (
-    crash_id SERIAL PRIMARY KEY,
+    crash_id SERIAL NOT NULL,
     st_case INTEGER NOT NULL,
     year INTEGER NOT NULL,
     crash_date DATE,
@@ -23,8 +25,10 @@ CREATE TABLE IF NOT EXISTS fars_crashes (
     cyclist_fatalities INTEGER,
     other_fatalities INTEGER,
     location GEOMETRY(Point, 4326), -- WGS84
+    location_5070 GEOMETRY(Point, 5070) GENERATED ALWAYS AS (ST_Transform(location, 5070)) STORED, -- CONUS Albers, meters
+    CONSTRAINT crashes_pkey PRIMARY KEY (crash_id, year),
     CONSTRAINT crashes_stcase_year_unique UNIQUE (st_case, year)
-);
+) PARTITION BY RANGE (year);
 
 ALTER TABLE fars_crashes
     ADD CONSTRAINT crashes_location_geom_check
@@ -35,6 +39,8 @@ CREATE INDEX IF NOT EXISTS crashes_date_idx ON fars_crashes (crash_date);
 CREATE INDEX IF NOT EXISTS crashes_state_idx ON fars_crashes (state_name);
 CREATE INDEX IF NOT EXISTS crashes_county_idx ON fars_crashes (county_name);
 CREATE INDEX IF NOT EXISTS crashes_city_idx ON fars_crashes (fars_city_name);
+-- The covering export index, crashes_export_idx on (state, place_fips, year),
+-- is created by the post-load maintenance stage (pipeline/etl/load/fars_maintenance.py).
 
 COMMENT ON TABLE fars_crashes IS
 'FARS crash-level fatalities, normalized across historical schema changes';
@@ -43,4 +49,7 @@ COMMENT ON COLUMN fars_crashes.year IS
 'Authoritative FARS reporting year; used as primary temporal key';
 
 COMMENT ON COLUMN fars_crashes.location IS
-'WGS84 point geometry; NULL for pre-1999 records without coordinates';
\ No newline at end of file
+'WGS84 point geometry; NULL for pre-1999 records without coordinates';
+
+COMMENT ON COLUMN fars_crashes.location_5070 IS
+'location projected to EPSG:5070 (meters), kept in sync by PostgreSQL; used for grid binning in hotspot analysis';
\ No newline at end of file
@@ -0,0 +1,16 @@
+-- One row per FARS year and source CSV, recording what was last loaded.
+-- File: schema/fars_load_ledger.sql
+
+CREATE TABLE IF NOT EXISTS fars_load_ledger (
+    year INTEGER NOT NULL,
+    file_name VARCHAR(40) NOT NULL,
+    source_sha256 CHAR(64) NOT NULL,
+    row_count INTEGER,
+    loader_version INTEGER NOT NULL,
+    started_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    completed_at TIMESTAMPTZ,
+    PRIMARY KEY (year, file_name)
+);
+
+COMMENT ON TABLE fars_load_ledger IS
+'FARS files loaded per year; a year is skipped when its archive hash and loader version are unchanged';
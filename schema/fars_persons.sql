@@ -1,9 +1,10 @@
 -- Creates the PostGIS persons table.
 -- File: schema/fars_persons.sql
+-- Range-partitioned by crash_year to match fars_crashes (fars_persons_y<year>).
 
 CREATE TABLE IF NOT EXISTS fars_persons (
-    person_id SERIAL PRIMARY KEY,
-    crash_id INTEGER NOT NULL REFERENCES fars_crashes(crash_id),
+    person_id SERIAL NOT NULL,
+    crash_id INTEGER NOT NULL,
     st_case INTEGER NOT NULL,
     crash_year INTEGER NOT NULL,
     vehicle_number INTEGER NOT NULL,
@@ -13,5 +14,9 @@ CREATE TABLE IF NOT EXISTS fars_persons (
     person_type INTEGER NOT NULL,
     injury_severity INTEGER NOT NULL,
     location_code INTEGER NOT NULL,
-    CONSTRAINT persons_stcase_veh_per_year_unique UNIQUE (crash_id, person_number, vehicle_number)
-);
\ No newline at end of file
+    CONSTRAINT persons_pkey PRIMARY KEY (person_id, crash_year),
+    CONSTRAINT persons_crash_fkey FOREIGN KEY (crash_id, crash_year)
+        REFERENCES fars_crashes (crash_id, year),
+    CONSTRAINT persons_stcase_veh_per_year_unique
+        UNIQUE (crash_id, person_number, vehicle_number, crash_year)
+) PARTITION BY RANGE (crash_year);
\ No newline at end of file
@@ -0,0 +1,20 @@
+-- PERSON.CSV rows that could not be matched to a crash on (st_case, year).
+-- File: schema/fars_persons_rejects.sql
+
+CREATE TABLE IF NOT EXISTS fars_persons_rejects (
+    st_case INTEGER NOT NULL,
+    crash_year INTEGER NOT NULL,
+    vehicle_number INTEGER NOT NULL,
+    person_number INTEGER NOT NULL,
+    person_age INTEGER,
+    sex INTEGER,
+    person_type INTEGER NOT NULL,
+    injury_severity INTEGER NOT NULL,
+    location_code INTEGER NOT NULL,
+    reason VARCHAR(40) NOT NULL,
+    rejected_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    CONSTRAINT persons_rejects_unique UNIQUE (crash_year, st_case, vehicle_number, person_number)
+);
+
+COMMENT ON TABLE fars_persons_rejects IS
+'Orphan FARS person rows whose ST_CASE has no matching crash for the same year';
@@ -0,0 +1,209 @@
+-- Converts fars_crashes and fars_persons from plain tables to the
+-- year-partitioned layout in schema/fars_crashes.sql and schema/fars_persons.sql.
+-- File: schema/migrations/025_partition_fars_tables.sql
+-- Creates the partitioned parents, moves each year's rows into its
+-- fars_crashes_y<year> / fars_persons_y<year> partitions and drops the old
+-- tables, all in one transaction. crash_id and person_id values and their
+-- sequences are kept. Does nothing if fars_crashes is already partitioned.
+-- Run before 030_add_crash_location_5070.sql.
+
+BEGIN;
+
+DO $$
+DECLARE
+    partition_year INTEGER;
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'fars_crashes'::regclass) = 'p' THEN
+        RAISE NOTICE 'fars_crashes is already partitioned, skipping';
+        RETURN;
+    END IF;
+
+    -- Recreated below on the partitioned tables
+    DROP VIEW IF EXISTS fars_fatal_crashes, fars_person_semantics, fars_person_with_crash;
+
+    ALTER TABLE fars_persons RENAME TO fars_persons_old;
+    ALTER TABLE fars_crashes RENAME TO fars_crashes_old;
+
+    -- Free the constraint and index names for the new tables
+    ALTER TABLE fars_persons_old DROP CONSTRAINT IF EXISTS fars_persons_crash_id_fkey;
+    ALTER TABLE fars_persons_old DROP CONSTRAINT IF EXISTS persons_stcase_veh_per_year_unique;
+    ALTER TABLE fars_crashes_old DROP CONSTRAINT IF EXISTS crashes_stcase_year_unique;
+    DROP INDEX IF EXISTS
+        crashes_location_gist_idx,
+        crashes_date_idx,
+        crashes_state_idx,
+        crashes_county_idx,
+        crashes_city_idx,
+        crashes_export_idx;
+
+    CREATE TABLE fars_crashes (
+        crash_id INTEGER NOT NULL DEFAULT nextval('fars_crashes_crash_id_seq'),
+        st_case INTEGER NOT NULL,
+        year INTEGER NOT NULL,
+        crash_date DATE,
+        state CHAR(2) NOT NULL,
+        state_name VARCHAR(20),
+        county CHAR(3) NOT NULL,
+        county_name VARCHAR(40),
+        city CHAR(4) NOT NULL,
+        place_fips CHAR (5),
+        fars_city_name VARCHAR(80),
+        fips_city_name VARCHAR(80),
+        route_code INTEGER,
+        road_label VARCHAR(30),
+        total_fatalities INTEGER NOT NULL CHECK (total_fatalities >= 0),
+        motorist_fatalities INTEGER,
+        pedestrian_fatalities INTEGER,
+        cyclist_fatalities INTEGER,
+        other_fatalities INTEGER,
+        location GEOMETRY(Point, 4326), -- WGS84
+        CONSTRAINT crashes_pkey PRIMARY KEY (crash_id, year),
+        CONSTRAINT crashes_stcase_year_unique UNIQUE (st_case, year)
+    ) PARTITION BY RANGE (year);
+
+    ALTER TABLE fars_crashes
+        ADD CONSTRAINT crashes_location_geom_check
+            CHECK (location IS NULL OR (ST_GeometryType(location) = 'ST_Point' AND ST_SRID(location) = 4326));
+
+    CREATE TABLE fars_persons (
+        person_id INTEGER NOT NULL DEFAULT nextval('fars_persons_person_id_seq'),
+        crash_id INTEGER NOT NULL,
+        st_case INTEGER NOT NULL,
+        crash_year INTEGER NOT NULL,
+        vehicle_number INTEGER NOT NULL,
+        person_number INTEGER NOT NULL,
+        person_age INTEGER,
+        sex INTEGER,
+        person_type INTEGER NOT NULL,
+        injury_severity INTEGER NOT NULL,
+        location_code INTEGER NOT NULL,
+        CONSTRAINT persons_pkey PRIMARY KEY (person_id, crash_year),
+        CONSTRAINT persons_crash_fkey FOREIGN KEY (crash_id, crash_year)
+            REFERENCES fars_crashes (crash_id, year),
+        CONSTRAINT persons_stcase_veh_per_year_unique
+            UNIQUE (crash_id, person_number, vehicle_number, crash_year)
+    ) PARTITION BY RANGE (crash_year);
+
+    -- Keep the sequences when the old tables are dropped
+    ALTER SEQUENCE fars_crashes_crash_id_seq OWNED BY fars_crashes.crash_id;
+    ALTER SEQUENCE fars_persons_person_id_seq OWNED BY fars_persons.person_id;
+
+    FOR partition_year IN SELECT DISTINCT year FROM fars_crashes_old ORDER BY year LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF fars_crashes FOR VALUES FROM (%s) TO (%s)',
+            'fars_crashes_y' || partition_year, partition_year, partition_year + 1
+        );
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF fars_persons FOR VALUES FROM (%s) TO (%s)',
+            'fars_persons_y' || partition_year, partition_year, partition_year + 1
+        );
+
+        INSERT INTO fars_crashes (
+            crash_id, st_case, year, crash_date, state, state_name, county, county_name,
+            city, place_fips, fars_city_name, fips_city_name, route_code, road_label,
+            total_fatalities, motorist_fatalities, pedestrian_fatalities,
+            cyclist_fatalities, other_fatalities, location
+        )
+        SELECT
+            crash_id, st_case, year, crash_date, state, state_name, county, county_name,
+            city, place_fips, fars_city_name, fips_city_name, route_code, road_label,
+            total_fatalities, motorist_fatalities, pedestrian_fatalities,
+            cyclist_fatalities, other_fatalities, location
+        FROM fars_crashes_old
+        WHERE year = partition_year;
+
+        INSERT INTO fars_persons (
+            person_id, crash_id, st_case, crash_year, vehicle_number, person_number,
+            person_age, sex, person_type, injury_severity, location_code
+        )
+        SELECT
+            person_id, crash_id, st_case, crash_year, vehicle_number, person_number,
+            person_age, sex, person_type, injury_severity, location_code
+        FROM fars_persons_old
+        WHERE crash_year = partition_year;
+
+        RAISE NOTICE 'Moved FARS year % into partitions', partition_year;
+    END LOOP;
+
+    -- Fails, rolling everything back, if a person's crash_year has no crashes
+    IF EXISTS (
+        SELECT 1 FROM fars_persons_old
+        WHERE crash_year NOT IN (SELECT DISTINCT year FROM fars_crashes_old)
+    ) THEN
+        RAISE EXCEPTION 'fars_persons has rows whose crash_year has no fars_crashes rows';
+    END IF;
+
+    DROP TABLE fars_persons_old;
+    DROP TABLE fars_crashes_old;
+END $$;
+
+CREATE INDEX IF NOT EXISTS crashes_location_gist_idx ON fars_crashes USING GIST (location);
+CREATE INDEX IF NOT EXISTS crashes_date_idx ON fars_crashes (crash_date);
+CREATE INDEX IF NOT EXISTS crashes_state_idx ON fars_crashes (state_name);
+CREATE INDEX IF NOT EXISTS crashes_county_idx ON fars_crashes (county_name);
+CREATE INDEX IF NOT EXISTS crashes_city_idx ON fars_crashes (fars_city_name);
+-- crashes_export_idx is rebuilt by: python -m pipeline.etl.load.fars_maintenance <years>
+
+COMMENT ON TABLE fars_crashes IS
+'FARS crash-level fatalities, normalized across historical schema changes';
+
+COMMENT ON COLUMN fars_crashes.year IS
+'Authoritative FARS reporting year; used as primary temporal key';
+
+COMMENT ON COLUMN fars_crashes.location IS
+'WGS84 point geometry; NULL for pre-1999 records without coordinates';
+
+-- Same definitions as schema/views/
+CREATE OR REPLACE VIEW fars_person_with_crash AS
+SELECT
+    p.person_id,
+    p.crash_id,
+    a.year,
+    a.crash_date,
+    p.person_type,
+    p.injury_severity
+FROM fars_persons p
+JOIN fars_crashes a
+  ON p.crash_id = a.crash_id
+ AND p.crash_year = a.year;
+
+CREATE OR REPLACE VIEW fars_person_semantics AS
+SELECT
+    *,
+    CASE
+        WHEN person_role IN ('Driver', 'Passenger') THEN 'Motorist'
+        WHEN person_role = 'Pedestrian' THEN 'Pedestrian'
+        WHEN person_role IN ('Bicyclist', 'Other Cyclist') THEN 'Cyclist'
+        WHEN person_role = 'Non-motorist Other' THEN 'Other'
+        ELSE 'Unknown'
+    END AS person_mode
+FROM (
+  SELECT
+    *,
+    CASE
+        WHEN injury_severity = 4 THEN true
+        ELSE false
+    END AS is_fatal_person,
+
+    CASE
+        WHEN person_type = 1  THEN 'Driver'
+        WHEN person_type IN (2, 3, 9) THEN 'Passenger'
+        WHEN person_type IN (5, 8, 10, 11, 12, 13) THEN 'Pedestrian'
+        WHEN person_type = 6  THEN 'Bicyclist'
+        WHEN person_type = 7  THEN 'Other Cyclist'
+        WHEN person_type = 4  THEN 'Non-motorist Other'
+        WHEN person_type IN (19, 88, 99) THEN 'Unknown'
+        ELSE 'Unknown'
+    END AS person_role
+  FROM fars_person_with_crash
+) AS base;
+
+CREATE OR REPLACE VIEW fars_fatal_crashes AS
+SELECT
+    crash_id,
+    year,
+    BOOL_OR(is_fatal_person) AS is_fatal_crash
+FROM fars_person_semantics
+GROUP BY crash_id, year;
+
+COMMIT;
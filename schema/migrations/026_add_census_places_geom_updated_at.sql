@@ -0,0 +1,8 @@
+-- Adds census_places.geom_updated_at, which drives the incremental crash
+-- enrichment (pipeline/etl/enrich/enrich_crash_locations.py).
+-- File: schema/migrations/026_add_census_places_geom_updated_at.sql
+-- Existing boundaries are stamped with the migration time. No enrichment run
+-- has completed yet, so the first run after this re-checks every crash.
+
+ALTER TABLE census_places
+    ADD COLUMN IF NOT EXISTS geom_updated_at TIMESTAMPTZ NOT NULL DEFAULT now();
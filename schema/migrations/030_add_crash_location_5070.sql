@@ -0,0 +1,16 @@
+-- Adds the stored EPSG:5070 projection of fars_crashes.location used by
+-- hotspot binning (pipeline/etl/transform/derive_crash_hotspots.py).
+-- File: schema/migrations/030_add_crash_location_5070.sql
+-- Rewrites every crash partition once; new and updated rows are projected
+-- by PostgreSQL from then on.
+
+ALTER TABLE fars_crashes
+    ADD COLUMN IF NOT EXISTS location_5070 GEOMETRY(Point, 5070)
+        GENERATED ALWAYS AS (ST_Transform(location, 5070)) STORED;
+
+COMMENT ON COLUMN fars_crashes.location_5070 IS
+'location projected to EPSG:5070 (meters), kept in sync by PostgreSQL; used for grid binning in hotspot analysis';
+
+-- The export index now also covers location_5070. Rebuild it, and re-cluster
+-- the partitions, with: python -m pipeline.etl.load.fars_maintenance <years>
+DROP INDEX IF EXISTS crashes_export_idx;
@@ -14,4 +14,5 @@ SELECT
 
 FROM fars_persons p
 JOIN fars_crashes a
-  ON p.crash_id = a.crash_id;
\ No newline at end of file
+  ON p.crash_id = a.crash_id
+ AND p.crash_year = a.year;
\ No newline at end of file
@@ -0,0 +1,80 @@
+import argparse
+import time
+
+import numpy as np
+
+from pipeline.connection import get_conn
+from pipeline.etl.enrich.assign_crash_places import load_place_index, match_places
+from pipeline.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Same match the PostGIS enrichment runs, without the UPDATE.
+POSTGIS_MATCH_QUERY = """
+    SELECT DISTINCT ON (fc.crash_id)
+        fc.crash_id,
+        piece.place_fips
+    FROM fars_crashes fc
+    JOIN census_places_subdivided piece
+        ON ST_Intersects(piece.geom, fc.location)
+    WHERE fc.year = %(year)s
+      AND fc.location IS NOT NULL
+    ORDER BY fc.crash_id, piece.state_fips, piece.place_fips
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare in-process STRtree place assignment with the PostGIS enrichment join",
+    )
+    parser.add_argument("--year", type=int, required=True, help="Loaded FARS year to match")
+    args = parser.parse_args()
+
+    with get_conn("enrich") as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT crash_id, ST_X(location), ST_Y(location)
+                FROM fars_crashes
+                WHERE year = %s AND location IS NOT NULL
+                ORDER BY crash_id
+            """, (args.year,))
+            rows = cur.fetchall()
+        if not rows:
+            logger.error("[ENRICH] No located crashes for %s", args.year)
+            return
+        crash_ids, lon, lat = (np.array(col) for col in zip(*rows))
+
+        start = time.time()
+        index = load_place_index(conn)
+        index_elapsed = time.time() - start
+
+        start = time.time()
+        place_fips, _ = match_places(index, lon.astype(np.float64), lat.astype(np.float64))
+        strtree_elapsed = time.time() - start
+
+        start = time.time()
+        with conn.cursor() as cur:
+            cur.execute(POSTGIS_MATCH_QUERY, {"year": args.year})
+            postgis = dict(cur.fetchall())
+        postgis_elapsed = time.time() - start
+
+    strtree = {
+        crash_id: fips
+        for crash_id, fips in zip(crash_ids.tolist(), place_fips.tolist())
+        if fips is not None
+    }
+    mismatches = sum(
+        1 for crash_id in strtree.keys() | postgis.keys()
+        if strtree.get(crash_id) != postgis.get(crash_id)
+    )
+
+    logger.info(
+        "[ENRICH] %s | crashes=%s | STRtree build=%.2fs query=%.2fs matched=%s | "
+        "PostGIS join=%.2fs matched=%s | mismatches=%s",
+        args.year, len(rows), index_elapsed, strtree_elapsed, len(strtree),
+        postgis_elapsed, len(postgis), mismatches,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from pathlib import Path
 
 from pipeline.etl.fars_pipeline import run_fars_pipeline
 from pipeline.etl.enrich.enrich_crash_locations import enrich_crash_locations
+from pipeline.etl.transform.derive_city_year_fatalities import run_refresh_city_year_fatalities
 from pipeline.logger import get_logger
 
 logger = get_logger(__name__)
@@ -32,6 +33,31 @@ def main() -> None:
         help="Specific years to process (e.g. 2023 2022)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for per-year extract + load (default: 1)",
+    )
+
+    parser.add_argument(
+        "--extract",
+        action="store_true",
+        help="Extract every CSV in each archive to disk before loading (debugging only).",
+    )
+
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reload every requested year, even if the load ledger shows it unchanged.",
+    )
+
+    parser.add_argument(
+        "--assign-places",
+        action="store_true",
+        help="Match crashes to census places in-process while loading instead of in a post-load PostGIS pass.",
+    )
+
     parser.add_argument(
         "--validate-only",
         action="store_true",
@@ -44,20 +70,38 @@ def main() -> None:
         help="Only run spatial enrichment; no extraction or loading."
     )
 
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="With --enrich-only, re-check every crash instead of only unassigned crashes and changed boundaries.",
+    )
+
     args = parser.parse_args()
 
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+
+    if args.full and not args.enrich_only:
+        parser.error("--full can only be used with --enrich-only")
+
     if args.validate_only:
         run_fars_validation()
         logger.info("[PIPELINE][FARS] Validation Completed. Passed all blocking checks.")
         return
     
     if args.enrich_only:
-        enrich_crash_locations()
+        enriched_years = enrich_crash_locations(years=args.years, full=args.full)
+        if enriched_years:
+            run_refresh_city_year_fatalities(years=enriched_years)
         return
 
     run_fars_pipeline(
         raw_root=args.raw_root,
         requested_years=args.years,
+        workers=args.workers,
+        extract=args.extract,
+        force=args.force,
+        assign_places=args.assign_places,
     )
 
     elapsed = time.time() - start
@@ -1,8 +1,8 @@
 import csv
-import psycopg
 
 from pathlib import Path
 
+from pipeline.connection import get_conn
 from pipeline.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,11 +15,7 @@ def load_fars_city_codes():
     with open(data_path, newline='') as file:
         reader = csv.DictReader(file)
     
-        with psycopg.connect(
-            host="localhost",
-            dbname="visionzero_db",
-            user="visionzero",
-        ) as conn:
+        with get_conn("load") as conn:
             with conn.cursor() as cur:
                 for row in reader:
                     state_code = row["state_code"]
@@ -1,8 +1,8 @@
 import csv
-import psycopg
 
 from pathlib import Path
 
+from pipeline.connection import get_conn
 from pipeline.logger import get_logger
 from pipeline.etl.transform.mappings import STATE_FIPS_MAP
 
@@ -36,11 +36,7 @@ def load_vision_zero_cities():
     with open(data_path, newline='') as file:
         reader = csv.reader(file)
     
-        with psycopg.connect(
-            host="localhost",
-            dbname="visionzero_db",
-            user="visionzero",
-        ) as conn:
+        with get_conn("load") as conn:
             with conn.cursor() as cur:
                 for row in reader:
                     if not row[0].isdigit():
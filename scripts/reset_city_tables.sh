@@ -35,4 +35,6 @@ fi
 
 psql -U visionzero -d visionzero_db -f schema/drop_city_tables.sql
 psql -U visionzero -d visionzero_db -f schema/census_places.sql
+psql -U visionzero -d visionzero_db -f schema/census_places_subdivided.sql
+psql -U visionzero -d visionzero_db -f schema/census_places_simplified.sql
 psql -U visionzero -d visionzero_db -f schema/city_stats.sql
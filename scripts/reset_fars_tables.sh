@@ -37,3 +37,7 @@ psql -U visionzero -d visionzero_db -f schema/drop_fars_tables.sql
 psql -U visionzero -d visionzero_db -f schema/extensions.sql
 psql -U visionzero -d visionzero_db -f schema/fars_crashes.sql
 psql -U visionzero -d visionzero_db -f schema/fars_persons.sql
+psql -U visionzero -d visionzero_db -f schema/fars_persons_rejects.sql
+psql -U visionzero -d visionzero_db -f schema/fars_load_ledger.sql
+psql -U visionzero -d visionzero_db -f schema/crash_enrichment_runs.sql
+psql -U visionzero -d visionzero_db -f schema/city_year_fatalities.sql
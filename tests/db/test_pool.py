@@ -0,0 +1,81 @@
+import io
+from contextlib import contextmanager, nullcontext
+from unittest.mock import MagicMock
+
+import pytest
+from psycopg.conninfo import conninfo_to_dict
+from psycopg_pool import PoolTimeout
+
+from pipeline import connection
+from pipeline.etl import fars_pipeline
+from pipeline.etl.load import load_fars_crashes, load_fars_persons
+
+
+def test_conninfo_reads_environment_at_call_time(monkeypatch):
+    monkeypatch.setenv("PGHOST", "db.internal")
+    monkeypatch.setenv("PGDATABASE", "visionzero_db")
+    monkeypatch.setenv("PGUSER", "visionzero")
+    monkeypatch.setenv("PGPASSWORD", "secret")
+    monkeypatch.delenv("PGPORT", raising=False)
+
+    params = conninfo_to_dict(connection.conninfo())
+    assert params["host"] == "db.internal"
+    assert params["port"] == "5432"
+    assert params["application_name"] == connection.APPLICATION_NAME
+
+
+def test_get_conn_rejects_unknown_stage(monkeypatch):
+    get_pool = MagicMock()
+    monkeypatch.setattr(connection, "get_pool", get_pool)
+
+    with pytest.raises(ValueError, match="Unknown stage: laod"):
+        with connection.get_conn("laod"):
+            pass
+    get_pool.assert_not_called()
+
+
+class SingleConnectionPool:
+    """Stands in for a ConnectionPool with max_size=1: a second checkout fails instead of blocking."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.in_use = False
+
+    @contextmanager
+    def connection(self):
+        if self.in_use:
+            raise PoolTimeout("a second connection was checked out")
+        self.in_use = True
+        self.checkouts += 1
+        try:
+            yield MagicMock(name="conn")
+        finally:
+            self.in_use = False
+
+
+def test_year_load_uses_a_single_pooled_connection(monkeypatch, tmp_path):
+    pool = SingleConnectionPool()
+    monkeypatch.setattr(connection, "get_pool", lambda: pool)
+
+    archive = tmp_path / "FARS2020NationalCSV.zip"
+    monkeypatch.setattr(fars_pipeline, "download_fars_year", lambda year, raw_root: archive)
+    monkeypatch.setattr(fars_pipeline, "sha256_file", lambda path: "sha")
+    monkeypatch.setattr(fars_pipeline, "list_fars_csvs", lambda path: {"ACCIDENT.CSV": archive, "PERSON.CSV": archive})
+    monkeypatch.setattr(load_fars_crashes, "open_fars_csv", lambda path, name: nullcontext(io.StringIO("ST_CASE\n1\n")))
+    monkeypatch.setattr(load_fars_persons, "open_fars_csv", lambda path, name: nullcontext(io.StringIO("ST_CASE\n1\n")))
+
+    loader_conns = []
+
+    def load_rows(conn, **kwargs):
+        loader_conns.append(conn)
+        return 1, 0, 0
+
+    monkeypatch.setattr(load_fars_crashes, "load_fars_crash_rows_bulk", load_rows)
+    monkeypatch.setattr(load_fars_persons, "load_fars_persons_rows", load_rows)
+
+    stats, status = fars_pipeline.load_fars_year(2020, tmp_path, force=True)
+
+    assert status == fars_pipeline.YEAR_LOADED
+    assert stats["crashes"]["inserted"] == stats["persons"]["inserted"] == 1
+    assert pool.checkouts == 1
+    assert len(loader_conns) == 2 and loader_conns[0] is loader_conns[1]
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+import shapely
+
+from pipeline.etl.enrich.assign_crash_places import PlaceIndex, load_place_index, match_places
+
+
+def make_index() -> PlaceIndex:
+    # Two pieces of place 00100 sharing an edge at x=1, and an overlapping place 00200
+    pieces = [shapely.box(0, 0, 1, 1), shapely.box(1, 0, 2, 1), shapely.box(1.5, 0, 3, 1)]
+    return PlaceIndex(
+        tree=shapely.STRtree(pieces),
+        place_fips=np.array(["00100", "00100", "00200"], dtype=object),
+        display_name=np.array(["Alpha", "Alpha", "Beta"], dtype=object),
+    )
+
+
+def test_match_places_assigns_first_place_and_skips_missing_points():
+    lon = np.array([0.5, 1.0, 1.75, 2.5, 5.0, np.nan])
+    lat = np.array([0.5, 0.5, 0.5, 0.5, 0.5, 0.5])
+
+    place_fips, display_name = match_places(make_index(), lon, lat)
+
+    assert place_fips.tolist() == ["00100", "00100", "00100", "00200", None, None]
+    assert display_name.tolist() == ["Alpha", "Alpha", "Alpha", "Beta", None, None]
+
+
+class EmptyCursor:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        pass
+
+    def fetchall(self):
+        return []
+
+
+class EmptyConnection:
+    def cursor(self):
+        return EmptyCursor()
+
+
+def test_load_place_index_rejects_empty_boundaries():
+    with pytest.raises(RuntimeError, match="census_places_subdivided is empty"):
+        load_place_index(EmptyConnection())
@@ -0,0 +1,35 @@
+import numpy as np
+
+from pipeline.export.cluster_points import cluster_pyramid, from_mercator, tile_groups
+
+
+def test_cluster_pyramid_merges_nearby_points():
+    # Two crashes a block apart in Los Angeles, one in New York
+    lon = np.array([-118.2437, -118.2440, -74.0060])
+    lat = np.array([34.0522, 34.0525, 40.7128])
+    sums = np.array([[1, 0], [2, 1], [1, 1]], dtype=np.int16)
+
+    pyramid = cluster_pyramid(lon, lat, sums, min_zoom=0, max_zoom=7)
+
+    assert sorted(pyramid) == list(range(8))
+    for clusters in pyramid.values():
+        assert clusters.count.sum() == 3
+        assert clusters.sums.sum(axis=0).tolist() == [4, 2]
+
+    z7 = pyramid[7]
+    assert sorted(z7.count.tolist()) == [1, 2]
+    la = int(np.argmax(z7.count))
+    assert z7.sums[la].tolist() == [3, 1]
+    cluster_lon, cluster_lat = from_mercator(z7.x[la], z7.y[la])
+    assert abs(cluster_lon - -118.24385) < 1e-6
+    assert abs(cluster_lat - 34.05235) < 1e-3
+
+
+def test_tile_groups_cover_every_cluster():
+    lon = np.array([-118.2437, -74.0060, 2.3522])
+    lat = np.array([34.0522, 40.7128, 48.8566])
+    clusters = cluster_pyramid(lon, lat, np.zeros((3, 0)), min_zoom=2, max_zoom=2)[2]
+
+    groups = tile_groups(clusters, 2)
+    assert sorted(groups) == [(0, 1), (1, 1), (2, 1)]
+    assert sorted(i for indexes in groups.values() for i in indexes) == [0, 1, 2]
@@ -0,0 +1,56 @@
+import numpy as np
+
+from pipeline.export.crash_columns import encode_crash_columns
+
+
+def column(data: bytes, layout: dict, name: str) -> np.ndarray:
+    spec = layout["columns"][name]
+    count = layout["count"] * spec.get("size", 1)
+    return np.frombuffer(data, dtype=np.dtype(spec["type"]).newbyteorder("<"), count=count, offset=spec["offset"])
+
+
+def record(st_case, lon, lat, crash_date, road_label, other):
+    return {
+        "lon": lon,
+        "lat": lat,
+        "st_case": st_case,
+        "year": 2023,
+        "crash_date": crash_date,
+        "state_name": "California",
+        "fars_city_name": "LOS ANGELES",
+        "fips_city_name": "Los Angeles",
+        "road_label": road_label,
+        "total_fatalities": 1,
+        "motorist_fatalities": 0,
+        "pedestrian_fatalities": 1,
+        "cyclist_fatalities": 0,
+        "other_fatalities": other,
+    }
+
+
+def test_encode_crash_columns_round_trips():
+    records = [
+        record(60001, -118.25, 34.05, "2023-02-01", "I-10", 0),
+        record(60002, -118.5, 34.25, None, None, None),
+    ]
+    data, layout = encode_crash_columns(2023, records)
+
+    assert layout["count"] == 2 and layout["byteLength"] == len(data)
+    assert all(spec["offset"] % 4 == 0 for spec in layout["columns"].values())
+    np.testing.assert_allclose(column(data, layout, "position"), [-118.25, 34.05, -118.5, 34.25], rtol=1e-6)
+    assert column(data, layout, "st_case").tolist() == [60001, 60002]
+    assert column(data, layout, "crash_date").tolist() == [32, 0]
+
+    other = layout["columns"]["other_fatalities"]
+    assert other["type"] == "uint8"
+    assert column(data, layout, "other_fatalities").tolist() == [0, other["null"]]
+
+    road = layout["columns"]["road_label"]
+    assert [road["dictionary"][i] for i in column(data, layout, "road_label")] == ["I-10", None]
+    assert layout["columns"]["state_name"]["dictionary"] == ["California"]
+
+
+def test_encode_crash_columns_empty_year():
+    data, layout = encode_crash_columns(2023, [])
+    assert layout["count"] == 0
+    assert len(data) == layout["byteLength"]
@@ -0,0 +1,71 @@
+import pytest
+
+from pipeline.export.export_vector_tiles import MAX_LAT, crash_tiles, tile_xy
+
+
+class LeafCursor:
+    def __init__(self, leaves):
+        self.leaves = leaves
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        pass
+
+    def fetchall(self):
+        return self.leaves
+
+
+class LeafConnection:
+    """Returns precomputed max-zoom tiles in place of the crash query."""
+
+    def __init__(self, leaves):
+        self.leaves = leaves
+
+    def cursor(self):
+        return LeafCursor(self.leaves)
+
+
+@pytest.mark.parametrize("zoom", [0, 1, 4, 14])
+def test_tile_xy_clamps_the_antimeridian_and_poles(zoom):
+    last = (1 << zoom) - 1
+
+    assert tile_xy(-180, 0, zoom)[0] == 0
+    assert tile_xy(180, 0, zoom)[0] == last
+    assert tile_xy(0, MAX_LAT, zoom)[1] == 0
+    assert tile_xy(0, -MAX_LAT, zoom)[1] == last
+    assert tile_xy(0, 90, zoom)[1] == 0
+    assert tile_xy(0, -90, zoom)[1] == last
+
+
+def test_tile_xy_corners():
+    assert tile_xy(-180, MAX_LAT, 3) == (0, 0)
+    assert tile_xy(180, -MAX_LAT, 3) == (7, 7)
+    assert tile_xy(0, 0, 1) == (1, 1)
+    assert tile_xy(-0.0001, 0.0001, 1) == (0, 0)
+
+
+def test_crash_tile_parents_match_direct_tile_math():
+    points = [
+        (-180, MAX_LAT),
+        (180, -MAX_LAT),
+        (-122.4194, 37.7749),
+        (-73.9857, 40.7484),
+        (-157.8583, 21.3069),
+        (-149.9003, 61.2181),
+        (0, 0),
+    ]
+    min_zoom, max_zoom = 4, 14
+    leaves = [tile_xy(lon, lat, max_zoom) for lon, lat in points]
+
+    tiles = crash_tiles(LeafConnection(leaves), min_zoom, max_zoom)
+
+    assert tiles == {
+        (z, *tile_xy(lon, lat, z))
+        for lon, lat in points
+        for z in range(min_zoom, max_zoom + 1)
+    }
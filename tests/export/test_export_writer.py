@@ -0,0 +1,84 @@
+import gzip
+import json
+
+from pipeline.export.export_writer import MANIFEST_NAME, ExportWriter
+
+
+def test_export_writer_skips_unchanged_files(tmp_path):
+    writer = ExportWriter(tmp_path)
+    assert writer.write_text("cities/06/44000/annual_fatalities.json", "[]") is True
+    with writer.open_text("crashes/06/44000/2023.json") as file:
+        file.write("[")
+        file.write("{}")
+        file.write("]")
+    writer.save()
+
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+    assert manifest["crashes/06/44000/2023.json"]["size"] == 4
+    mtime = (tmp_path / "crashes/06/44000/2023.json").stat().st_mtime_ns
+
+    writer = ExportWriter(tmp_path)
+    assert writer.write_text("cities/06/44000/annual_fatalities.json", "[{}]") is True
+    with writer.open_text("crashes/06/44000/2023.json") as file:
+        file.write("[{}]")
+    writer.save()
+
+    assert (writer.written, writer.unchanged) == (1, 1)
+    assert (tmp_path / "crashes/06/44000/2023.json").stat().st_mtime_ns == mtime
+    assert (tmp_path / "cities/06/44000/annual_fatalities.json").read_text() == "[{}]"
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_export_writer_rewrites_files_missing_from_disk(tmp_path):
+    writer = ExportWriter(tmp_path)
+    writer.write_text("cities.json", "[]")
+    writer.save()
+
+    (tmp_path / "cities.json").unlink()
+    writer = ExportWriter(tmp_path)
+    assert writer.write_text("cities.json", "[]") is True
+    assert (tmp_path / "cities.json").read_text() == "[]"
+
+
+def test_export_writer_writes_compressed_variants(tmp_path):
+    writer = ExportWriter(tmp_path, encodings=("gzip",))
+    writer.write_text("cities.json", "[]")
+    with writer.open_text("crashes/06/44000/2023.json") as file:
+        file.write("[{}]")
+    writer.save()
+
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+    for rel_path, text in [("cities.json", b"[]"), ("crashes/06/44000/2023.json", b"[{}]")]:
+        variant = tmp_path / f"{rel_path}.gz"
+        assert gzip.decompress(variant.read_bytes()) == text
+        assert manifest[rel_path]["gzip"] == variant.stat().st_size
+
+
+def test_export_writer_streams_binary_without_variants_for_range_reads(tmp_path):
+    writer = ExportWriter(tmp_path, encodings=("gzip",))
+    with writer.open_binary("tiles/vision_zero.pmtiles") as file:
+        file.write(b"PMTiles")
+        file.write(b"\x03")
+    writer.save()
+
+    assert (tmp_path / "tiles/vision_zero.pmtiles").read_bytes() == b"PMTiles\x03"
+    assert not (tmp_path / "tiles/vision_zero.pmtiles.gz").exists()
+    assert "gzip" not in json.loads((tmp_path / MANIFEST_NAME).read_text())["tiles/vision_zero.pmtiles"]
+
+
+def test_export_writer_removes_files_no_longer_exported(tmp_path):
+    writer = ExportWriter(tmp_path, encodings=("gzip",))
+    writer.write_text("cities.json", "[]")
+    writer.write_text("crashes/06/44000/2022.json", "[]")
+    writer.save()
+    (tmp_path / "untracked.json").write_text("{}")
+
+    writer = ExportWriter(tmp_path)
+    writer.write_text("cities.json", "[]")
+    writer.save()
+
+    assert not (tmp_path / "crashes/06/44000/2022.json").exists()
+    assert not (tmp_path / "crashes/06/44000/2022.json.gz").exists()
+    assert not (tmp_path / "cities.json.gz").exists()
+    assert (tmp_path / "cities.json").exists()
+    assert (tmp_path / "untracked.json").exists()
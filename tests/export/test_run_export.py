@@ -0,0 +1,9 @@
+from pipeline.export.run_export import artifact_type
+
+
+def test_artifact_type_groups_by_top_level_directory():
+    assert artifact_type("crashes/06/67000/2020.json") == "crashes/*.json"
+    assert artifact_type("crashes/06/67000/2020.bin") == "crashes/*.bin"
+    assert artifact_type("clusters/3/1/2.json") == "clusters/*.json"
+    assert artifact_type("tiles/vision_zero.pmtiles") == "tiles/*.pmtiles"
+    assert artifact_type("cities.json") == "cities.json"
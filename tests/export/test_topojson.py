@@ -0,0 +1,45 @@
+import pytest
+
+from pipeline.export.topojson import encode_topology
+
+
+def decode_arc(topology: dict, index: int) -> list[list[float]]:
+    (kx, ky), (x0, y0) = topology["transform"]["scale"], topology["transform"]["translate"]
+    x = y = 0
+    points = []
+    for dx, dy in topology["arcs"][index]:
+        x, y = x + dx, y + dy
+        points.append([x * kx + x0, y * ky + y0])
+    return points
+
+
+def test_encode_topology_round_trips_within_quantization():
+    exterior = [[-93.3, 44.9], [-93.2, 44.9], [-93.2, 45.0], [-93.3, 45.0], [-93.3, 44.9]]
+    hole = [[-93.28, 44.92], [-93.27, 44.92], [-93.27, 44.93], [-93.28, 44.92]]
+    geometry = {"type": "Polygon", "coordinates": [exterior, hole]}
+
+    topology = encode_topology({"z9-11": geometry}, properties={"place_fips": "43000"}, quantization=1000)
+
+    obj = topology["objects"]["z9-11"]
+    assert obj["type"] == "MultiPolygon"
+    assert obj["properties"] == {"place_fips": "43000"}
+    assert obj["arcs"] == [[[0], [1]]]
+
+    kx, ky = topology["transform"]["scale"]
+    for ring, arc_index in ((exterior, 0), (hole, 1)):
+        decoded = decode_arc(topology, arc_index)
+        assert len(decoded) == len(ring)
+        for (x, y), (dx, dy) in zip(ring, decoded):
+            assert x == pytest.approx(dx, abs=kx / 2)
+            assert y == pytest.approx(dy, abs=ky / 2)
+
+
+def test_encode_topology_drops_rings_collapsed_by_quantization():
+    exterior = [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]]
+    sliver = [[0.2, 0.2], [0.2000001, 0.2], [0.2, 0.2000001], [0.2, 0.2]]
+    geometry = {"type": "MultiPolygon", "coordinates": [[exterior, sliver], [sliver]]}
+
+    topology = encode_topology({"boundary": geometry}, quantization=100)
+
+    assert topology["objects"]["boundary"]["arcs"] == [[[0]]]
+    assert len(topology["arcs"]) == 1
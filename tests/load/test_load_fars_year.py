@@ -0,0 +1,76 @@
+import io
+from contextlib import contextmanager, nullcontext
+from unittest.mock import MagicMock
+
+import pytest
+
+from pipeline import connection
+from pipeline.etl import fars_pipeline
+from pipeline.etl.load import load_fars_crashes, load_fars_persons
+from pipeline.etl.load.fars_load_ledger import LEDGER_FILES
+
+
+class FakeLedger:
+    """fars_load_ledger completions that only become visible on commit."""
+
+    def __init__(self):
+        self.completed: set[tuple[int, str]] = set()
+        self.pending: set[tuple[int, str]] = set()
+
+    def start(self, conn, year, file_name, source_sha256):
+        self.completed.discard((year, file_name))
+
+    def complete(self, conn, year, file_name, row_count):
+        self.pending.add((year, file_name))
+
+    def is_current(self, conn, year, source_sha256):
+        return all((year, file_name) in self.completed for file_name in LEDGER_FILES)
+
+    def commit(self):
+        self.completed |= self.pending
+        self.pending.clear()
+
+    def rollback(self):
+        self.pending.clear()
+
+
+@pytest.fixture
+def ledger(monkeypatch, tmp_path):
+    ledger = FakeLedger()
+    conn = MagicMock(name="conn")
+    conn.commit.side_effect = ledger.commit
+    conn.rollback.side_effect = ledger.rollback
+
+    pool = MagicMock(name="pool")
+    pool.connection = contextmanager(lambda: (yield conn))
+    monkeypatch.setattr(connection, "get_pool", lambda: pool)
+
+    archive = tmp_path / "FARS2020NationalCSV.zip"
+    monkeypatch.setattr(fars_pipeline, "download_fars_year", lambda year, raw_root: archive)
+    monkeypatch.setattr(fars_pipeline, "sha256_file", lambda path: "sha")
+    monkeypatch.setattr(fars_pipeline, "list_fars_csvs", lambda path: {"ACCIDENT.CSV": archive, "PERSON.CSV": archive})
+    monkeypatch.setattr(fars_pipeline, "start_ledger_entry", ledger.start)
+    monkeypatch.setattr(fars_pipeline, "complete_ledger_entry", ledger.complete)
+    monkeypatch.setattr(fars_pipeline, "is_year_current", ledger.is_current)
+    monkeypatch.setattr(load_fars_crashes, "open_fars_csv", lambda path, name: nullcontext(io.StringIO("ST_CASE\n1\n")))
+    monkeypatch.setattr(load_fars_persons, "open_fars_csv", lambda path, name: nullcontext(io.StringIO("ST_CASE\n1\n")))
+    monkeypatch.setattr(load_fars_crashes, "load_fars_crash_rows_bulk", lambda conn, **kwargs: (1, 0, 0))
+    monkeypatch.setattr(load_fars_persons, "load_fars_persons_rows", lambda conn, **kwargs: (1, 0, 0))
+    return ledger
+
+
+def test_failed_partition_swap_is_retried_next_run(monkeypatch, tmp_path, ledger):
+    def failing_attach(conn, year):
+        raise RuntimeError("lock wait interrupted")
+
+    monkeypatch.setattr(fars_pipeline, "attach_year_partitions", failing_attach)
+    with pytest.raises(RuntimeError):
+        fars_pipeline.load_fars_year(2020, tmp_path)
+    assert not ledger.completed
+
+    monkeypatch.setattr(fars_pipeline, "attach_year_partitions", lambda conn, year: None)
+    _, status = fars_pipeline.load_fars_year(2020, tmp_path)
+    assert status == fars_pipeline.YEAR_LOADED
+
+    _, status = fars_pipeline.load_fars_year(2020, tmp_path)
+    assert status == fars_pipeline.YEAR_UNCHANGED
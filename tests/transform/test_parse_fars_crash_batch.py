@@ -0,0 +1,117 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pipeline.etl.transform.parse_fars_crash import (
+    parse_fars_date,
+    parse_fars_geom,
+    map_route_to_road_label,
+)
+from pipeline.etl.transform.parse_fars_crash_batch import (
+    assemble_fars_crash_batch,
+    parse_fars_date_batch,
+    parse_fars_geom_batch,
+    parse_numbers,
+)
+
+GEOM_ROWS = [
+    {"LATITUDE": "44.9778", "LONGITUD": "-93.2650"},
+    {"LATITUDE": "44583000", "LONGITUD": "-93155000"},
+    {"LATITUDE": " 45.5 ", "LONGITUD": "-122.6"},
+    {"LATITUDE": "", "LONGITUD": "-93.2"},
+    {"LATITUDE": "0", "LONGITUD": "-93.2"},
+    {"LATITUDE": "9999", "LONGITUD": "9999"},
+    {"LATITUDE": "88888888", "LONGITUD": "888888888"},
+    {"LATITUDE": "777.7", "LONGITUD": "-93.2"},
+    {"LATITUDE": "abc", "LONGITUD": "-93.2"},
+    {"LATITUDE": "1e1", "LONGITUD": ".5"},
+]
+
+DATE_ROWS = [
+    {"YEAR": "2020", "MONTH": "2", "DAY": "29"},
+    {"YEAR": "2021", "MONTH": "2", "DAY": "29"},
+    {"YEAR": "95", "MONTH": "12", "DAY": "31"},
+    {"YEAR": "23", "MONTH": "1", "DAY": "1"},
+    {"YEAR": "2019", "MONTH": "13", "DAY": "1"},
+    {"YEAR": "2019", "MONTH": "99", "DAY": "99"},
+    {"YEAR": "", "MONTH": "1", "DAY": "1"},
+    {"YEAR": "x", "MONTH": "1", "DAY": "1"},
+    {"YEAR": " 2019", "MONTH": "+4", "DAY": "30"},
+]
+
+
+def test_parse_numbers_matches_int():
+    values = pd.Series(["7", " 12 ", "-3", "+5", "", "1.0", "x", "007"]).to_numpy(dtype=str)
+    parsed, valid = parse_numbers(values, np.int64)
+    for raw, value, ok in zip(values, parsed, valid):
+        try:
+            expected = int(raw)
+        except ValueError:
+            assert not ok
+        else:
+            assert ok and value == expected
+
+
+def test_parse_numbers_accepts_object_arrays():
+    values = np.array(["42", "x", None], dtype=object)
+    parsed, valid = parse_numbers(values, np.int64)
+    assert parsed[0] == 42
+    assert list(valid) == [True, False, False]
+
+
+def test_geom_batch_matches_scalar():
+    lon, lat = parse_fars_geom_batch(pd.DataFrame(GEOM_ROWS, dtype=str))
+    for row, batch_lon, batch_lat in zip(GEOM_ROWS, lon, lat):
+        expected_lon, expected_lat = parse_fars_geom(row)
+        if expected_lon is None:
+            assert pd.isna(batch_lon) and pd.isna(batch_lat)
+        else:
+            assert (batch_lon, batch_lat) == (expected_lon, expected_lat)
+
+
+def test_date_batch_matches_scalar():
+    dates = parse_fars_date_batch(pd.DataFrame(DATE_ROWS, dtype=str))
+    assert list(dates) == [parse_fars_date(row) for row in DATE_ROWS]
+    assert dates[2] == date(1995, 12, 31)
+
+
+def test_date_batch_raises_like_scalar_without_day_column():
+    row = {"YEAR": "2020", "MONTH": "2"}
+    with pytest.raises(KeyError):
+        parse_fars_date(row)
+    with pytest.raises(KeyError):
+        parse_fars_date_batch(pd.DataFrame([row], dtype=str))
+
+
+def test_assemble_batch_flags_unparseable_rows():
+    frame = pd.DataFrame([
+        {"ST_CASE": "10001", "STATE": "6", "COUNTY": "37", "CITY": "1234",
+         "YEAR": "2020", "MONTH": "1", "DAY": "1", "ROUTE": "2", "FATALS": "1"},
+        {"ST_CASE": "10002", "STATE": "27", "COUNTY": "53", "CITY": "0",
+         "YEAR": "2020", "MONTH": "1", "DAY": "1", "ROUTE": "", "FATALS": "1"},
+        {"ST_CASE": "10003", "STATE": "27", "COUNTY": "53", "CITY": "9999",
+         "YEAR": "2020", "MONTH": "1", "DAY": "1", "ROUTE": "95", "FATALS": "2"},
+    ], dtype=str)
+
+    records, errors = assemble_fars_crash_batch(
+        frame, glc_lookup={("06", "1234"): "Los Angeles"}, file_year=2020
+    )
+
+    assert list(errors) == [False, True, False]
+    assert list(records["st_case"]) == ["10001", "10003"]
+    assert list(records["state"]) == ["06", "27"]
+    assert list(records["fars_city_name"]) == ["Los Angeles", "Unincorporated"]
+    assert list(records["road_label"]) == [
+        map_route_to_road_label(2),
+        map_route_to_road_label(95),
+    ]
+    assert records["lat"].isna().all()
+
+
+def test_assemble_batch_missing_required_column_fails_every_row():
+    frame = pd.DataFrame([{"ST_CASE": "1", "STATE": "6"}], dtype=str)
+    records, errors = assemble_fars_crash_batch(frame, {}, 2020)
+    assert records.empty
+    assert errors.all()
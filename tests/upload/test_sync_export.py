@@ -0,0 +1,84 @@
+import gzip
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from pipeline.export.export_writer import ExportWriter
+from pipeline.upload.upload_to_r2 import sync_export
+
+BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+def export(out_dir, files: dict[str, str], encodings: tuple[str, ...] = ()) -> None:
+    writer = ExportWriter(out_dir, encodings=encodings)
+    for key, text in files.items():
+        writer.write_text(key, text)
+    writer.save()
+
+
+@pytest.mark.parametrize("compare", ["manifest", "etag"])
+def test_sync_export_uploads_only_changed_keys(client, tmp_path, compare):
+    export(tmp_path, {"cities.json": "[]", "crashes/06/44000/2022.json": "[]"})
+    uploaded, _ = sync_export(client, tmp_path, BUCKET, compare=compare)
+    assert uploaded == ["cities.json", "crashes/06/44000/2022.json"]
+
+    export(tmp_path, {"cities.json": "[{}]", "crashes/06/44000/2022.json": "[]", "crashes/06/44000/2023.json": "[]"})
+    uploaded, deleted = sync_export(client, tmp_path, BUCKET, compare=compare)
+    assert uploaded == ["cities.json", "crashes/06/44000/2023.json"]
+    assert deleted == []
+
+    body = client.get_object(Bucket=BUCKET, Key="cities.json")["Body"].read()
+    assert body == b"[{}]"
+
+
+def test_sync_export_deletes_orphans(client, tmp_path):
+    export(tmp_path, {"cities.json": "[]", "crashes/06/44000/2022.json": "[]"})
+    sync_export(client, tmp_path, BUCKET)
+
+    export(tmp_path, {"cities.json": "[]"})
+    uploaded, deleted = sync_export(client, tmp_path, BUCKET, delete_orphans=True)
+
+    assert uploaded == []
+    assert deleted == ["crashes/06/44000/2022.json"]
+    keys = {obj["Key"] for obj in client.list_objects_v2(Bucket=BUCKET)["Contents"]}
+    assert keys == {"cities.json", "export_manifest.json"}
+
+
+def test_sync_export_deletes_orphans_without_remote_manifest(client, tmp_path):
+    export(tmp_path, {"cities.json": "[]", "crashes/06/44000/2022.json": "[]"})
+    sync_export(client, tmp_path, BUCKET)
+    client.delete_object(Bucket=BUCKET, Key="export_manifest.json")
+
+    export(tmp_path, {"cities.json": "[]"})
+    uploaded, deleted = sync_export(client, tmp_path, BUCKET, delete_orphans=True)
+
+    assert uploaded == ["cities.json"]
+    assert deleted == ["crashes/06/44000/2022.json"]
+
+
+def test_sync_export_uploads_compressed_variants(client, tmp_path):
+    export(tmp_path, {"cities.json": "[]"}, encodings=("gzip",))
+    uploaded, _ = sync_export(client, tmp_path, BUCKET)
+    assert uploaded == ["cities.json"]
+    assert "ContentEncoding" not in client.get_object(Bucket=BUCKET, Key="cities.json")
+
+    # Switching encodings re-uploads everything, even unchanged files
+    uploaded, _ = sync_export(client, tmp_path, BUCKET, encoding="gzip")
+    assert uploaded == ["cities.json"]
+
+    response = client.get_object(Bucket=BUCKET, Key="cities.json")
+    assert response["ContentEncoding"] == "gzip"
+    assert response["CacheControl"].startswith("public")
+    assert gzip.decompress(response["Body"].read()) == b"[]"
+    assert "cities.json.gz" not in {obj["Key"] for obj in client.list_objects_v2(Bucket=BUCKET)["Contents"]}
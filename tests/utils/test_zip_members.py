@@ -0,0 +1,45 @@
+import csv
+import zipfile
+
+import pytest
+
+from pipeline.utils.downloader import list_zip_members, open_zip_member
+
+
+def make_fars_zip(path):
+    with zipfile.ZipFile(path, "w") as zip:
+        zip.writestr("FARS2020NationalCSV/", "")
+        zip.writestr("FARS2020NationalCSV/accident.CSV", "﻿ST_CASE,STATE\n10001,27\n")
+        zip.writestr("FARS2020NationalCSV/PERSON.csv", "ST_CASE,PER_NO\n10001,1\n")
+        zip.writestr("FARS2020NationalCSV/README.txt", "not a csv")
+    return path
+
+
+def test_list_zip_members_matches_nested_names_case_insensitively(tmp_path):
+    zip_path = make_fars_zip(tmp_path / "fars_2020.zip")
+
+    members = list_zip_members(zip_path, ".csv")
+
+    assert members == {
+        "ACCIDENT.CSV": "FARS2020NationalCSV/accident.CSV",
+        "PERSON.CSV": "FARS2020NationalCSV/PERSON.csv",
+    }
+
+
+def test_open_zip_member_streams_csv_without_extracting(tmp_path):
+    zip_path = make_fars_zip(tmp_path / "fars_2020.zip")
+
+    with open_zip_member(zip_path, "Accident.csv") as csvfile:
+        rows = list(csv.DictReader(csvfile))
+
+    # BOM is stripped, and nothing is written next to the zip
+    assert rows == [{"ST_CASE": "10001", "STATE": "27"}]
+    assert list(tmp_path.iterdir()) == [zip_path]
+
+
+def test_open_zip_member_missing_member_raises(tmp_path):
+    zip_path = make_fars_zip(tmp_path / "fars_2020.zip")
+
+    with pytest.raises(FileNotFoundError):
+        with open_zip_member(zip_path, "VEHICLE.CSV"):
+            pass